@@ -1,8 +1,16 @@
+import sys
+from pathlib import Path
+
 import emoji
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.optimize import curve_fit
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from dih_models.plotting.chart_style import chart_fingerprint, png_is_current, stamp_png_fingerprint  # noqa: E402
+
+output_path = "military_spending_chart.png"
+
 # Provided data
 years_provided = np.arange(1973, 2022)
 spending_provided = np.array(
@@ -130,6 +138,20 @@ max_spending_value = max(
     max(spending_provided), max(spending_projected_filtered), max(spending_reduction), max(spending_freeze)
 )
 
+# Skip drawing if the PNG already shows this data (the script source covers
+# the embedded NIH series and the labels)
+chart_hash = chart_fingerprint(
+    years_provided,
+    spending_provided,
+    spending_projected_filtered,
+    spending_reduction,
+    spending_freeze,
+    Path(__file__).read_bytes(),
+)
+if png_is_current(output_path, chart_hash):
+    print(f"{output_path} is up to date")
+    sys.exit(0)
+
 # Plotting
 plt.figure(figsize=(6, 6))  # Adjusting figure size to be larger for better readability on phones
 
@@ -294,5 +316,6 @@ plt.ylabel("Global Military Spending")
 plt.title("Historical and Projected Global Military Spending")
 
 plt.grid(True)
-plt.savefig("military_spending_chart.png", dpi=300)
+plt.savefig(output_path, dpi=300)
+stamp_png_fingerprint(output_path, chart_hash)
 plt.show()
@@ -0,0 +1,272 @@
+"""
+Content-Addressed Build Cache
+=============================
+
+Keeps the generate-everything pipeline from rewriting artifacts whose inputs
+did not change.
+
+Each cached entry (e.g. one outcome's tornado/sensitivity/MC charts) is keyed
+on a hash of:
+- the metadata of the parameter and of every parameter in its upstream
+  closure (values, uncertainty metadata, display fields, inputs, and the
+  bytecode of compute lambdas plus the helpers/constants they reference)
+- the generator version (hash of the generator module sources and the
+  pipeline script)
+- any extra run settings the caller folds in (sample count, seed, ...)
+
+When the key matches the manifest and every recorded artifact still exists,
+the pipeline skips regenerating that entry. Files that are regenerated are
+written through `write_if_changed`, so identical content never touches the
+file and Quarto's freeze/mtime logic stays warm.
+
+Usage:
+    from dih_models.build_cache import BuildCache
+
+    cache = BuildCache(project_root / "_analysis" / ".build-cache.json")
+    key = cache.parameter_key(graph, name, "n=10000")
+    artifacts = cache.lookup(f"outcome:{name}", key)
+    if artifacts is None:
+        ...  # generate, then:
+        cache.record(f"outcome:{name}", key, [path1, path2])
+    cache.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import types
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from dih_models.parameter_graph import ParameterGraph
+from dih_models.pipeline_stages import PIPELINE_SCRIPT
+
+# Bump when the manifest layout or keying scheme changes
+CACHE_SCHEMA_VERSION = 1
+
+# Modules whose source determines the content of generated artifacts (the
+# pipeline script, which emits the artifacts, is hashed along with them)
+_GENERATOR_MODULES = (
+    "build_cache.py",
+    "chart_generators.py",
+    "chart_renderer.py",
+    "compute_compiler.py",
+    "formatting.py",
+    "latex_generation.py",
+    "parameter_graph.py",
+    "plotting/chart_style.py",
+    "sample_store.py",
+    "uncertainty.py",
+)
+
+# Parameter attributes that feed generated artifacts (compute handled separately)
+_FINGERPRINT_ATTRS = (
+    "source_ref", "source_type", "description", "unit", "formula", "latex",
+    "confidence", "last_updated", "peer_reviewed", "conservative",
+    "sensitivity", "display_value", "display_name", "keywords",
+    "validation_min", "validation_max", "confidence_interval", "std_error",
+    "distribution", "inputs",
+)
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write text to `path` only if it differs from the current contents.
+
+    Returns True if the file was written.
+    """
+    return write_bytes_if_changed(path, content.encode("utf-8"))
+
+
+def write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    """Binary counterpart of `write_if_changed`."""
+    path = Path(path)
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def write_json_if_changed(path: Path, data: Any, indent: int = 2) -> bool:
+    """Serialize `data` like json.dump(..., indent=indent) and write if changed."""
+    return write_if_changed(path, json.dumps(data, indent=indent))
+
+
+def _stable_repr(value: Any) -> str:
+    """repr() that is stable across runs for the metadata types we store."""
+    if isinstance(value, Enum):
+        return f"{type(value).__name__}.{value.name}"
+    if isinstance(value, float):
+        return repr(float(value))
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_stable_repr(v) for v in value) + "]"
+    return repr(value)
+
+
+def _code_fingerprint(fn: Any, hasher: Any, seen: Set[int], depth: int = 0) -> None:
+    """Feed a function's bytecode and the globals it references into `hasher`.
+
+    Referenced module-level helpers are followed (so editing e.g.
+    `compound_sum` invalidates every parameter whose lambda calls it), and
+    referenced numeric constants contribute their values.
+    """
+    code = getattr(fn, "__code__", None)
+    if code is None or id(code) in seen or depth > 8:
+        return
+    seen.add(id(code))
+    _hash_code(code, hasher)
+    fn_globals = getattr(fn, "__globals__", {})
+    for name in _all_names(code):
+        ref = fn_globals.get(name)
+        if isinstance(ref, types.FunctionType):
+            _code_fingerprint(ref, hasher, seen, depth + 1)
+        elif isinstance(ref, (int, float, str, tuple, dict)) and not isinstance(ref, bool):
+            hasher.update(f"{name}={_stable_repr(ref)};".encode())
+
+
+def _hash_code(code: types.CodeType, hasher: Any) -> None:
+    hasher.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(const, hasher)
+        else:
+            hasher.update(_stable_repr(const).encode("utf-8"))
+    hasher.update(",".join(code.co_names).encode("utf-8"))
+
+
+def _all_names(code: types.CodeType) -> List[str]:
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.extend(_all_names(const))
+    return names
+
+
+def _node_fingerprint(graph: ParameterGraph, name: str) -> str:
+    """Hash of one parameter's own metadata."""
+    hasher = hashlib.sha256()
+    hasher.update(name.encode("utf-8"))
+    val = graph.value(name)
+    if val is None:
+        hasher.update(b"<missing>")
+        return hasher.hexdigest()
+    hasher.update(_stable_repr(float(val)).encode("utf-8"))
+    for attr in _FINGERPRINT_ATTRS:
+        hasher.update(f"|{attr}={_stable_repr(getattr(val, attr, None))}".encode())
+    compute_fn = getattr(val, "compute", None)
+    if compute_fn is not None:
+        _code_fingerprint(compute_fn, hasher, set())
+    return hasher.hexdigest()
+
+
+def parameter_fingerprint(graph: ParameterGraph, name: str, memo: Optional[Dict[str, str]] = None) -> str:
+    """Hash of a parameter's metadata plus that of its whole upstream closure.
+
+    `memo` caches per-node hashes across calls (pass the same dict for every
+    parameter of one graph).
+    """
+    memo = memo if memo is not None else {}
+    hasher = hashlib.sha256()
+    for node in sorted(set(graph.upstream(name)) | {name}):
+        node_hash = memo.get(node)
+        if node_hash is None:
+            node_hash = _node_fingerprint(graph, node)
+            memo[node] = node_hash
+        hasher.update(f"{node}:{node_hash};".encode())
+    return hasher.hexdigest()
+
+
+def generator_version(package_dir: Optional[Path] = None) -> str:
+    """Hash of the generator module and pipeline script sources (changes whenever they are edited)."""
+    package_dir = package_dir or Path(__file__).parent
+    hasher = hashlib.sha256(f"schema={CACHE_SCHEMA_VERSION};".encode())
+    sources = [(module, package_dir / module) for module in _GENERATOR_MODULES]
+    sources.append((PIPELINE_SCRIPT, package_dir.parent / PIPELINE_SCRIPT))
+    for name, path in sources:
+        hasher.update(name.encode("utf-8"))
+        if path.exists():
+            hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+class BuildCache:
+    """Persistent manifest mapping cache entries to (key, artifact paths).
+
+    Artifact paths are stored relative to the manifest's project root so the
+    cache survives moving the checkout.
+    """
+
+    def __init__(self, manifest_path: Path, project_root: Optional[Path] = None, enabled: bool = True) -> None:
+        self.manifest_path = Path(manifest_path)
+        self.project_root = Path(project_root) if project_root else self.manifest_path.parent.parent
+        self.enabled = enabled
+        self.version = generator_version()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._touched: Set[str] = set()
+        self._node_hashes: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        if enabled and self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("schema") == CACHE_SCHEMA_VERSION:
+                    self._entries = data.get("entries", {})
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def parameter_key(self, graph: ParameterGraph, name: str, *extra: str) -> str:
+        """Cache key for artifacts derived from parameter `name` (and its upstream closure)."""
+        return self.key(parameter_fingerprint(graph, name, self._node_hashes), *extra)
+
+    def key(self, *parts: str) -> str:
+        """Combine fingerprints/settings with the generator version into a key."""
+        hasher = hashlib.sha256(self.version.encode("utf-8"))
+        for part in parts:
+            hasher.update(b"\0")
+            hasher.update(str(part).encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _rel(self, path: Path) -> str:
+        path = Path(path)
+        try:
+            return path.resolve().relative_to(self.project_root.resolve()).as_posix()
+        except ValueError:
+            return str(path)
+
+    def lookup(self, entry: str, key: str) -> Optional[List[Path]]:
+        """Return the recorded artifacts if `entry` is fresh for `key`, else None."""
+        if not self.enabled:
+            self.misses += 1
+            return None
+        record = self._entries.get(entry)
+        if not record or record.get("key") != key:
+            self.misses += 1
+            return None
+        paths = [self.project_root / p for p in record.get("artifacts", [])]
+        if not all(p.exists() for p in paths):
+            self.misses += 1
+            return None
+        self._touched.add(entry)
+        self.hits += 1
+        return paths
+
+    def record(self, entry: str, key: str, artifacts: Iterable[Path]) -> None:
+        """Remember that `entry` produced `artifacts` for `key`."""
+        self._entries[entry] = {"key": key, "artifacts": sorted(self._rel(p) for p in artifacts)}
+        self._touched.add(entry)
+
+    def save(self) -> None:
+        """Persist the manifest, dropping entries not looked up or recorded this run."""
+        if not self.enabled:
+            return
+        entries = {k: v for k, v in self._entries.items() if k in self._touched}
+        write_json_if_changed(
+            self.manifest_path,
+            {"schema": CACHE_SCHEMA_VERSION, "entries": dict(sorted(entries.items()))},
+        )
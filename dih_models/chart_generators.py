@@ -11,6 +11,13 @@ Generate Quarto QMD files with embedded Python matplotlib code for:
 - Monte Carlo distribution charts (outcome uncertainty)
 - CDF/exceedance probability charts (risk assessment)
 
+Chart generators accept an optional `batch` (dih_models.chart_renderer.ChartBatch);
+with it the PNG is rendered by the pipeline and the QMD only references the image.
+
+Generated chart cells stamp their PNG with a fingerprint of the embedded data
+and the chart style version, and skip drawing entirely when the existing PNG
+already carries it.
+
 Functions:
 - generate_tornado_chart_qmd() - Tornado chart showing input parameter impacts
 - generate_sensitivity_table_qmd() - Markdown table of sensitivity coefficients
@@ -32,14 +39,52 @@ Usage:
     )
 """
 
+import hashlib
+import textwrap
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
+from dih_models.build_cache import write_if_changed
 from dih_models.formatting import format_parameter_value
 from dih_models.latex_generation import smart_title_case
 
+if TYPE_CHECKING:
+    from dih_models.chart_renderer import ChartBatch
+
 
-def generate_tornado_chart_qmd(param_name: str, tornado_data: dict, output_dir: Path, param_metadata: dict = None, baseline: float = None, units: str = "") -> Path:
+def _skip_unchanged_png(qmd_content: str, png_name: str) -> str:
+    """Guard the chart cell of `qmd_content` so an up-to-date PNG is not redrawn.
+
+    The cell embeds all of its data, so a hash of the cell body identifies the
+    plot; chart_fingerprint() adds the chart style version at render time.
+    """
+    fence, _, rest = qmd_content.partition("\n")
+    cell, _, trailer = rest.partition("\n```")
+    lines = cell.split("\n")
+    n_options = 0
+    while n_options < len(lines) and lines[n_options].startswith("#|"):
+        n_options += 1
+    options = "".join(line + "\n" for line in lines[:n_options])
+    body = "\n".join(lines[n_options:]).strip("\n")
+    code_hash = hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
+
+    guarded = f'''
+from dih_models.plotting.chart_style import (
+    chart_fingerprint, get_figure_output_path, png_is_current, show_png, stamp_png_fingerprint
+)
+
+output_path = get_figure_output_path('{png_name}')
+chart_hash = chart_fingerprint("{code_hash}")
+
+if png_is_current(output_path, chart_hash):
+    show_png(output_path)
+else:
+{textwrap.indent(body, "    ")}
+    stamp_png_fingerprint(output_path, chart_hash)'''
+    return f"{fence}\n{options}{guarded}\n```{trailer}"
+
+
+def generate_tornado_chart_qmd(param_name: str, tornado_data: dict, output_dir: Path, param_metadata: dict = None, baseline: float = None, units: str = "", batch: "ChartBatch" = None) -> Path:
     """
     Generate a tornado chart QMD file for a parameter with uncertainty.
 
@@ -50,6 +95,8 @@ def generate_tornado_chart_qmd(param_name: str, tornado_data: dict, output_dir:
         param_metadata: Optional parameter metadata for context
         baseline: Baseline value to center chart on (instead of 0)
         units: Units for x-axis label
+        batch: Optional ChartBatch; if given, the chart is queued for batch
+            rendering and the QMD only references the finished PNG
 
     Returns:
         Path to generated QMD file
@@ -96,7 +143,7 @@ from dih_models.plotting.chart_style import (
     setup_chart_style, add_watermark, clean_spines,
     COLOR_BLACK, COLOR_WHITE, add_png_metadata, get_figure_output_path
 )
-from dih_models.parameters import format_parameter_value
+from dih_models.formatting import format_parameter_value
 
 setup_chart_style()
 
@@ -186,25 +233,31 @@ add_png_metadata(
 plt.show()
 ```'''
 
+    qmd_content = _skip_unchanged_png(qmd_content, f'tornado-{param_name.lower()}.png')
+    if batch is not None:
+        qmd_content = batch.add(qmd_content, f'tornado-{param_name.lower()}.png')
+
     # Write QMD file
     output_file = output_dir / f'tornado-{param_name.lower()}.qmd'
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(qmd_content)
+    write_if_changed(output_file, qmd_content)
 
     return output_file
 
 
-def generate_sensitivity_table_qmd(param_name: str, sensitivity_data: dict, output_dir: Path, param_metadata: dict = None, parameters: Dict[str, Dict[str, Any]] = None) -> Path:
+def generate_sensitivity_table_qmd(param_name: str, sensitivity_data: dict, output_dir: Path, param_metadata: dict = None, parameters: Dict[str, Dict[str, Any]] = None, method: str = "regression") -> Path:
     """
     Generate a sensitivity indices table QMD file for a parameter.
 
     Args:
         param_name: Parameter name
         sensitivity_data: Dict mapping input names to sensitivity coefficients
+            (method="regression"), or a `sobol_indices` result with
+            "first_order"/"total_order" dicts (method="sobol")
         output_dir: Directory to write QMD file
         param_metadata: Optional parameter metadata for context
         parameters: Optional dict of all parameter metadata for looking up inputs
+        method: "regression" (standardized coefficients) or "sobol" (variance-based indices)
 
     Returns:
         Path to generated QMD file
@@ -215,6 +268,12 @@ def generate_sensitivity_table_qmd(param_name: str, sensitivity_data: dict, outp
     else:
         display_name = smart_title_case(param_name)
 
+    if method == "sobol":
+        first_order = sensitivity_data.get("first_order", {})
+        sensitivity_data = sensitivity_data.get("total_order", {})
+    elif method != "regression":
+        raise ValueError(f"Unknown sensitivity method: {method}")
+
     # Sort by absolute sensitivity (largest first)
     sorted_indices = sorted(
         sensitivity_data.items(),
@@ -223,7 +282,16 @@ def generate_sensitivity_table_qmd(param_name: str, sensitivity_data: dict, outp
     )
 
     # Generate markdown table
-    qmd_content = f'''**Sensitivity Indices for {display_name}**
+    if method == "sobol":
+        qmd_content = f'''**Sensitivity Indices for {display_name}**
+
+Variance-based (Sobol) sensitivity showing which inputs explain the most variance in the output, including non-linear effects and interactions.
+
+| Input Parameter | First-Order Index | Total-Order Index | Interpretation |
+|:----------------|------------------:|------------------:|:---------------|
+'''
+    else:
+        qmd_content = f'''**Sensitivity Indices for {display_name}**
 
 Regression-based sensitivity showing which inputs explain the most variance in the output.
 
@@ -247,6 +315,18 @@ Regression-based sensitivity showing which inputs explain the most variance in t
                 unit_str = input_val.unit
                 # Clean up unit (e.g., don't show "USD" if it's obvious, but maybe good to be explicit)
                 display_input = f"{display_input} ({unit_str})"
+        if method == "sobol":
+            # Total-order indices are shares of output variance (0 to 1)
+            if coef > 0.5:
+                interpretation = "Strong driver"
+            elif coef > 0.2:
+                interpretation = "Moderate driver"
+            elif coef > 0.05:
+                interpretation = "Weak driver"
+            else:
+                interpretation = "Minimal effect"
+            qmd_content += f'| {display_input} | {first_order.get(input_name, 0.0):.4f} | {coef:.4f} | {interpretation} |\n'
+            continue
         # Standardized coefficients range from -1 to 1
         # Use absolute value thresholds appropriate for standardized betas
         abs_coef = abs(coef)
@@ -260,20 +340,24 @@ Regression-based sensitivity showing which inputs explain the most variance in t
             interpretation = "Minimal effect"
         qmd_content += f'| {display_input} | {coef:.4f} | {interpretation} |\n'
 
-    qmd_content += '''
+    if method == "sobol":
+        qmd_content += '''
+*Interpretation*: The first-order index is the share of output variance explained by the input alone; the total-order index adds its interactions with other inputs. A large gap between the two indicates strong interactions. Estimates from Saltelli sampling carry Monte Carlo error, so small indices may be slightly negative.
+'''
+    else:
+        qmd_content += '''
 *Interpretation*: Standardized coefficients show the change in output (in SD units) per 1 SD change in input. Values near ±1 indicate strong influence; values exceeding ±1 may occur with correlated inputs.
 '''
 
     # Write QMD file
     output_file = output_dir / f'sensitivity-table-{param_name.lower()}.qmd'
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(qmd_content)
+    write_if_changed(output_file, qmd_content)
 
     return output_file
 
 
-def generate_input_distribution_chart_qmd(param_name: str, param_data: dict, output_dir: Path) -> Path:
+def generate_input_distribution_chart_qmd(param_name: str, param_data: dict, output_dir: Path, batch: "ChartBatch" = None) -> Path:
     """
     Generate a distribution chart for an input parameter showing its uncertainty range.
 
@@ -284,6 +368,7 @@ def generate_input_distribution_chart_qmd(param_name: str, param_data: dict, out
         param_name: Parameter name (e.g., 'GLOBAL_MILITARY_SPENDING_ANNUAL_2024')
         param_data: Parameter metadata dict with 'value' key containing Parameter instance
         output_dir: Directory to write QMD file (knowledge/figures/)
+        batch: Optional ChartBatch (see generate_tornado_chart_qmd)
 
     Returns:
         Path to generated QMD file
@@ -487,11 +572,14 @@ plt.show()
 *This chart shows the assumed probability distribution for this parameter. The shaded region represents the 95% confidence interval where we expect the true value to fall.*
 '''
 
+    qmd_content = _skip_unchanged_png(qmd_content, f'distribution-{param_name.lower()}.png')
+    if batch is not None:
+        qmd_content = batch.add(qmd_content, f'distribution-{param_name.lower()}.png')
+
     # Write QMD file
     output_file = output_dir / f'distribution-{param_name.lower()}.qmd'
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(qmd_content)
+    write_if_changed(output_file, qmd_content)
 
     return output_file
 
@@ -501,7 +589,9 @@ def generate_monte_carlo_distribution_chart_qmd(
     outcome_data: dict,
     samples: list,
     output_dir: Path,
-    param_metadata: dict = None
+    param_metadata: dict = None,
+    sample_digest: str = None,
+    batch: "ChartBatch" = None
 ) -> Path:
     """
     Generate a Monte Carlo output distribution chart for a calculated parameter.
@@ -514,6 +604,10 @@ def generate_monte_carlo_distribution_chart_qmd(
         samples: List of Monte Carlo samples for this outcome
         output_dir: Directory to write QMD file
         param_metadata: Optional parameter metadata
+        sample_digest: Digest of `samples` in the sample store
+            (dih_models.sample_store); if given, the chart loads all samples
+            from the store instead of embedding the first 1,000 as literals
+        batch: Optional ChartBatch (see generate_tornado_chart_qmd)
 
     Returns:
         Path to generated QMD file
@@ -532,10 +626,17 @@ def generate_monte_carlo_distribution_chart_qmd(
     p95 = outcome_data.get("p95", baseline)
     units = outcome_data.get("units", "")
 
+    if sample_digest:
+        store_import = "from dih_models.sample_store import load_sample_column\n"
+        samples_code = f'samples = load_sample_column("{param_name}", digest="{sample_digest}")'
+    else:
+        store_import = ""
+        samples_code = f'samples = {samples[:1000] if len(samples) > 1000 else samples}  # Truncate for embedding'
+
     # Generate QMD with embedded Python
     qmd_content = f'''```{{python}}
 #| echo: false
-#| fig-cap: "Monte Carlo Distribution: {display_name} (10,000 simulations)"
+#| fig-cap: "Monte Carlo Distribution: {display_name} ({len(samples):,} simulations)"
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -545,13 +646,13 @@ from dih_models.plotting.chart_style import (
     setup_chart_style, add_watermark, clean_spines, get_tick_formatter,
     COLOR_BLACK, COLOR_WHITE, add_png_metadata, get_figure_output_path
 )
-from dih_models.parameters import format_parameter_value
-
+from dih_models.formatting import format_parameter_value
+{store_import}
 setup_chart_style()
 
 # Simulation results
 
-samples = {samples[:1000] if len(samples) > 1000 else samples}  # Truncate for embedding
+{samples_code}
 baseline = {baseline}
 mean = {mean}
 std = {std}
@@ -658,14 +759,17 @@ plt.show()
 | Standard Deviation | {format_parameter_value(std, units, include_unit=False)} |
 | 90% Confidence Interval | [{format_parameter_value(p5, units, include_unit=False)}, {format_parameter_value(p95, units, include_unit=False)}] |
 
-*The histogram shows the distribution of {display_name} across 10,000 Monte Carlo simulations. The CDF (right) shows the probability of the outcome exceeding any given value, which is useful for risk assessment.*
+*The histogram shows the distribution of {display_name} across {len(samples):,} Monte Carlo simulations. The CDF (right) shows the probability of the outcome exceeding any given value, which is useful for risk assessment.*
 '''
 
+    qmd_content = _skip_unchanged_png(qmd_content, f'mc-distribution-{param_name.lower()}.png')
+    if batch is not None:
+        qmd_content = batch.add(qmd_content, f'mc-distribution-{param_name.lower()}.png')
+
     # Write QMD file
     output_file = output_dir / f'mc-distribution-{param_name.lower()}.qmd'
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(qmd_content)
+    write_if_changed(output_file, qmd_content)
 
     return output_file
 
@@ -675,7 +779,9 @@ def generate_cdf_chart_qmd(
     samples: list,
     output_dir: Path,
     param_metadata: dict = None,
-    thresholds: list = None
+    thresholds: list = None,
+    sample_digest: str = None,
+    batch: "ChartBatch" = None
 ) -> Path:
     """
     Generate a standalone Cumulative Distribution Function (CDF) chart.
@@ -688,6 +794,9 @@ def generate_cdf_chart_qmd(
         output_dir: Directory to write QMD file
         param_metadata: Optional parameter metadata
         thresholds: Optional list of threshold values to annotate (e.g., [10, 50, 100] for ROI)
+        sample_digest: Digest of `samples` in the sample store; if given, the
+            chart loads all samples from the store instead of embedding 2,000
+        batch: Optional ChartBatch (see generate_tornado_chart_qmd)
 
     Returns:
         Path to generated QMD file
@@ -710,6 +819,13 @@ def generate_cdf_chart_qmd(
         p90 = sorted_s[int(len(sorted_s) * 0.90)]
         thresholds = [p10, p50, p90]
 
+    if sample_digest:
+        store_import = "from dih_models.sample_store import load_sample_column\n"
+        samples_code = f'samples = load_sample_column("{param_name}", digest="{sample_digest}")'
+    else:
+        store_import = ""
+        samples_code = f'samples = {samples[:2000] if len(samples) > 2000 else samples}'
+
     qmd_content = f'''```{{python}}
 #| echo: false
 #| fig-cap: "Probability of Exceeding Threshold: {display_name}"
@@ -722,13 +838,13 @@ from dih_models.plotting.chart_style import (
     setup_chart_style, add_watermark, clean_spines, get_tick_formatter,
     COLOR_BLACK, COLOR_WHITE, add_png_metadata, get_figure_output_path
 )
-from dih_models.parameters import format_parameter_value
-
+from dih_models.formatting import format_parameter_value
+{store_import}
 setup_chart_style()
 
 # Monte Carlo samples
 
-samples = {samples[:2000] if len(samples) > 2000 else samples}
+{samples_code}
 thresholds = {thresholds}
 display_name = "{display_name}"
 units = "{units}"
@@ -791,10 +907,13 @@ plt.show()
 *This exceedance probability chart shows the likelihood that {display_name} will exceed any given threshold. Higher curves indicate more favorable outcomes with greater certainty.*
 '''
 
+    qmd_content = _skip_unchanged_png(qmd_content, f'exceedance-{param_name.lower()}.png')
+    if batch is not None:
+        qmd_content = batch.add(qmd_content, f'exceedance-{param_name.lower()}.png')
+
     # Write QMD file
     output_file = output_dir / f'exceedance-{param_name.lower()}.qmd'
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(qmd_content)
+    write_if_changed(output_file, qmd_content)
 
     return output_file
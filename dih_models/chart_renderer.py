@@ -0,0 +1,201 @@
+"""
+Batch Chart Renderer
+====================
+
+Alternative backend for the chart generators in `chart_generators.py`.
+
+By default every tornado/distribution/MC/exceedance chart is a QMD whose
+python cell re-plots the chart when Quarto renders the page. With the batch
+backend the generate-everything pipeline renders those PNGs itself, from
+the same plotting code, in one multiprocess pass, and writes QMDs that only
+reference the finished image:
+
+- The generators hand their chart cell to a `ChartBatch`, which records a
+  render job and returns the static QMD text (caption, image, and the
+  markdown that followed the cell).
+- `render_chart_batch()` configures matplotlib once (Agg backend plus
+  `setup_chart_style()`, including font resolution), imports the modules the
+  chart cells use (numpy, scipy.stats, formatting, sample_store), and then
+  executes every job in forked workers that inherit that state, with the cell's own
+  `setup_chart_style()` call removed. Each job runs in a fresh namespace
+  and restores the shared rcParams afterwards.
+
+The resulting documents contain no code, so Quarto no longer starts a kernel
+for them, and the PNGs are regular build artifacts the build cache can track.
+A chart whose code fails keeps its code-executing QMD instead
+(`write_code_qmds()`), so the failure shows up when Quarto renders it rather
+than as a link to a missing image.
+
+Usage:
+    from dih_models.chart_renderer import ChartBatch, render_chart_batch
+
+    batch = ChartBatch(project_root)
+    generate_tornado_chart_qmd(..., batch=batch)
+    report = render_chart_batch(batch.jobs, workers=4)
+    write_code_qmds(batch.jobs, report["failures"])
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+import time
+import traceback
+import warnings
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from dih_models.build_cache import write_if_changed
+
+# Generator output: one python cell, then optional markdown
+_CHART_CELL = re.compile(r"\A```\{python\}\n(.*?)\n```[ \t]*\n?(.*)\Z", re.DOTALL)
+_FIG_CAP = re.compile(r'^#\|\s*fig-cap:\s*"(.*)"\s*$', re.MULTILINE)
+# The cell's own style setup, which render_chart_batch() has already done
+_STYLE_SETUP = re.compile(r"^[ \t]*setup_chart_style\(\)[ \t]*\n", re.MULTILINE)
+
+# Values: "qmd" (code-executing QMDs, default) or "batch" (pre-rendered PNGs)
+CHART_BACKENDS = ("qmd", "batch")
+
+# (png path, project root, python source, code-executing QMD) per chart
+ChartJob = Tuple[str, str, str, str]
+
+
+class ChartBatch:
+    """Render jobs collected while generating static chart QMDs.
+
+    Image links are project-absolute ("/knowledge/figures/...") like the
+    setup-parameters include, so they resolve from whichever chapter
+    includes the figure. Each chart's QMD sits next to its PNG under the
+    same stem, as the generators name them.
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = Path(project_root)
+        self.jobs: List[ChartJob] = []
+
+    @property
+    def png_paths(self) -> List[Path]:
+        return [Path(png) for png, _, _, _ in self.jobs]
+
+    def add(self, qmd_content: str, png_name: str) -> str:
+        """Queue the chart cell of `qmd_content`; return the static QMD text."""
+        match = _CHART_CELL.match(qmd_content)
+        if match is None:
+            raise ValueError(f"Chart QMD for {png_name} does not start with a python cell")
+        code, trailer = match.groups()
+        cap = _FIG_CAP.search(code)
+        caption = cap.group(1) if cap else ""
+
+        png_path = self.project_root / "knowledge" / "figures" / png_name
+        self.jobs.append((str(png_path), str(self.project_root), _STYLE_SETUP.sub("", code), qmd_content))
+
+        rel = png_path.relative_to(self.project_root).as_posix()
+        static = f"![{caption}](/{rel})\n"
+        if trailer.strip():
+            static += "\n" + trailer.lstrip("\n")
+        return static
+
+
+# --- Rendering ---------------------------------------------------------------
+
+# Jobs and rcParams for forked workers (inherited copy-on-write, never pickled)
+_RENDER_STATE: Dict[str, Any] = {}
+
+
+def _configure_matplotlib() -> Any:
+    """Agg backend, the shared chart style and the chart cells' imports.
+
+    Returns a copy of the rcParams. Everything imported here is inherited by
+    the forked workers, so no job pays for it (scipy.stats alone takes about
+    a second).
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot  # noqa: F401
+    import numpy  # noqa: F401
+
+    try:
+        import scipy.stats  # noqa: F401
+    except ImportError:
+        pass
+
+    import dih_models.formatting  # noqa: F401
+    import dih_models.sample_store  # noqa: F401
+    from dih_models.plotting.chart_style import setup_chart_style
+
+    setup_chart_style()
+    return matplotlib.rcParams.copy()
+
+
+def _render_job(index: int) -> Tuple[str, float, Optional[str]]:
+    """Execute one chart's code; returns (png path, seconds, error or None)."""
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    png_path, project_root, code, _ = _RENDER_STATE["jobs"][index]
+    start = time.perf_counter()
+    error = None
+    previous_cwd = os.getcwd()
+    try:
+        # Generated code locates knowledge/figures from the working directory
+        os.chdir(project_root)
+        with warnings.catch_warnings(), matplotlib.rc_context(_RENDER_STATE["rc"]):
+            # plt.show() under Agg only warns that the backend is non-interactive
+            warnings.filterwarnings("ignore", message=".*non-interactive.*")
+            exec(compile(code, png_path, "exec"), {"__name__": "__main__"})
+        if not os.path.exists(png_path):
+            error = f"chart code did not write {png_path}"
+    except Exception:
+        error = traceback.format_exc(limit=-2)
+    finally:
+        plt.close("all")
+        os.chdir(previous_cwd)
+    return png_path, time.perf_counter() - start, error
+
+
+def render_chart_batch(jobs: List[ChartJob], workers: int = 1) -> Dict[str, Any]:
+    """Render every queued chart PNG.
+
+    Matplotlib is configured once in this process; with `workers > 1` (and
+    fork available) the jobs run in forked workers that inherit it.
+
+    Returns a dict with:
+        timings: png path -> seconds
+        failures: png path -> traceback text
+        workers: number of processes used
+    """
+    _RENDER_STATE["rc"] = _configure_matplotlib()
+    _RENDER_STATE["jobs"] = jobs
+    workers = min(workers, len(jobs))
+    try:
+        if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+            with multiprocessing.get_context("fork").Pool(workers) as pool:
+                results = pool.map(_render_job, range(len(jobs)), chunksize=1)
+        else:
+            workers = 1
+            results = [_render_job(i) for i in range(len(jobs))]
+    finally:
+        _RENDER_STATE.clear()
+
+    return {
+        "timings": {png: seconds for png, seconds, _ in results},
+        "failures": {png: error for png, _, error in results if error is not None},
+        "workers": max(workers, 1),
+    }
+
+
+def write_code_qmds(jobs: Iterable[ChartJob], failed: Iterable[str]) -> List[Path]:
+    """Put the code-executing QMD back for every job whose PNG failed to render.
+
+    Returns the QMD paths written.
+    """
+    failed = {str(png) for png in failed}
+    written = []
+    for png, _, _, qmd_content in jobs:
+        if png in failed:
+            qmd_path = Path(png).with_suffix(".qmd")
+            write_if_changed(qmd_path, qmd_content)
+            written.append(qmd_path)
+    return written
@@ -0,0 +1,702 @@
+"""
+Compute Lambda Compiler
+=======================
+
+Parses the `compute=lambda ctx: ...` expressions of parameters.py with `ast`
+into a small expression IR, shared by everything that needs to look inside
+a compute lambda:
+
+- the exact set of `ctx["X"]` inputs (validation.validate_compute_inputs_match)
+- the operation for auto-generated LaTeX (latex_generation.infer_operation_from_compute)
+- fused NumPy kernels for Monte Carlo propagation and batched graph
+  evaluation (uncertainty._compute_vectorized): lambdas written for scalars
+  (`int(...)`, `float(...)`, `min(...)`, `sum([... for year in range(1, 11)])`)
+  raise on numpy arrays and used to fall back to one Python call per sample;
+  their kernels evaluate all samples at once
+- symbolic partial derivatives (d output / d input) as IR and kernels
+
+The file is parsed once per process (cached by path, size and mtime), and
+kernels are cached per lambda and globals namespace.
+
+IR: `Expr(op, args, value)` trees with ops
+    const (value), input (value = ctx key), global (value = module-level name),
+    add, sub, mul, div, pow, neg, float, int, abs, min, max, exp, log, sqrt
+`sum(...)` is lowered to a left fold of `add` (Python's summation order),
+comprehensions over `range(<constants>)` are unrolled, and subexpressions
+whose operands are all constants are folded with Python arithmetic, so a
+kernel evaluated on scalars reproduces the lambda exactly. Numeric
+module-level constants (DAYS_PER_YEAR, Parameter values, ...) become
+constants when a kernel is built from the lambda's globals. Anything else
+(calls to model functions, dict lookups, conditionals) leaves the lambda
+uncompiled (`CompiledCompute.ir is None`, see `.error`); its inputs are still
+collected from the AST.
+
+Kernels use NumPy by default. `kernel(backend="numexpr")` evaluates the same
+expression with numexpr (optional dependency) for very large sweeps; its
+transcendental functions can differ from NumPy in the last bit, so the
+pipeline keeps the NumPy backend for reproducible outputs.
+
+Usage:
+    from dih_models.compute_compiler import compile_compute, parse_compute_lambdas
+
+    compiled = compile_compute(param.compute)      # None if not a parsed lambda
+    compiled.inputs                                 # frozenset of ctx keys
+    kernel = compiled.kernel(param.compute.__globals__)
+    kernel({"A": a_samples, "B": b_samples})
+    dy_da = compiled.derivative_kernel("A", param.compute.__globals__)
+"""
+
+from __future__ import annotations
+
+import ast
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # Kernels need numpy; parsing, inputs and derivatives do not
+
+# Binary operators: IR op -> (ast node type, Python implementation)
+_BINARY_OPS: Dict[str, Tuple[type, Callable[[Any, Any], Any]]] = {
+    "add": (ast.Add, lambda a, b: a + b),
+    "sub": (ast.Sub, lambda a, b: a - b),
+    "mul": (ast.Mult, lambda a, b: a * b),
+    "div": (ast.Div, lambda a, b: a / b),
+    "pow": (ast.Pow, lambda a, b: a**b),
+}
+_AST_BINARY = {node_type: op for op, (node_type, _) in _BINARY_OPS.items()}
+_SYMBOLS = {"add": "+", "sub": "-", "mul": "*", "div": "/", "pow": "**"}
+
+# Calls: name in the lambda -> (IR op, Python implementation)
+_CALLS: Dict[str, Tuple[str, Callable[..., Any]]] = {
+    "float": ("float", float),
+    "int": ("int", int),
+    "abs": ("abs", abs),
+    "min": ("min", min),
+    "max": ("max", max),
+    "math.exp": ("exp", math.exp),
+    "math.log": ("log", math.log),
+    "math.sqrt": ("sqrt", math.sqrt),
+}
+_PY_FUNCS: Dict[str, Callable[..., Any]] = {op: fn for op, fn in _CALLS.values()}
+
+# NumPy spelling of each function op
+_NUMPY_FUNCS = {
+    "int": "np.trunc",
+    "abs": "np.abs",
+    "min": "np.minimum",
+    "max": "np.maximum",
+    "exp": "np.exp",
+    "log": "np.log",
+    "sqrt": "np.sqrt",
+}
+
+# Function ops numexpr supports (min/max are emitted as where())
+_NUMEXPR_FUNCS = {"abs": "abs", "exp": "exp", "log": "log", "sqrt": "sqrt"}
+
+# Comprehensions longer than this are not unrolled
+_MAX_UNROLL = 1000
+
+
+class UnsupportedExpression(ValueError):
+    """A lambda construct the IR cannot represent."""
+
+
+@dataclass(frozen=True)
+class Expr:
+    """One IR node; `value` holds the constant, ctx key or global name."""
+
+    op: str
+    args: Tuple[Expr, ...] = ()
+    value: Any = None
+
+    @property
+    def is_const(self) -> bool:
+        return self.op == "const"
+
+    def inputs(self) -> FrozenSet[str]:
+        if self.op == "input":
+            return frozenset((self.value,))
+        return frozenset().union(*(arg.inputs() for arg in self.args))
+
+    def globals(self) -> FrozenSet[str]:
+        if self.op == "global":
+            return frozenset((self.value,))
+        return frozenset().union(*(arg.globals() for arg in self.args))
+
+    def __str__(self) -> str:
+        if self.op == "const":
+            return repr(self.value)
+        if self.op in ("input", "global"):
+            return str(self.value)
+        if self.op in _SYMBOLS:
+            return f"({self.args[0]} {_SYMBOLS[self.op]} {self.args[1]})"
+        if self.op == "neg":
+            return f"(-{self.args[0]})"
+        return f"{self.op}({', '.join(str(arg) for arg in self.args)})"
+
+
+def const(value: Any) -> Expr:
+    return Expr("const", value=value)
+
+
+def make(op: str, *args: Expr) -> Expr:
+    """Build a node, folding it with Python arithmetic if every operand is constant."""
+    if args and all(arg.is_const for arg in args):
+        values = [arg.value for arg in args]
+        try:
+            if op in _BINARY_OPS:
+                return const(_BINARY_OPS[op][1](*values))
+            if op == "neg":
+                return const(-values[0])
+            if op in _PY_FUNCS:
+                return const(_PY_FUNCS[op](*values))
+        except (ArithmeticError, ValueError):
+            pass  # Keep the node: evaluating it raises, as the lambda would
+    return Expr(op, tuple(args))
+
+
+# ---------------------------------------------------------------------------
+# AST -> IR
+# ---------------------------------------------------------------------------
+
+
+def _call_name(func: ast.expr) -> Optional[str]:
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+        return f"{func.value.id}.{func.attr}"
+    return None
+
+
+def _const_range(call: ast.expr, env: Mapping[str, Any]) -> range:
+    if not (isinstance(call, ast.Call) and _call_name(call.func) == "range" and not call.keywords):
+        raise UnsupportedExpression("comprehension over something other than range()")
+    bounds = [_to_ir(arg, "", env) for arg in call.args]
+    if not all(b.is_const and isinstance(b.value, int) for b in bounds):
+        raise UnsupportedExpression("range() with non-constant bounds")
+    values = range(*(b.value for b in bounds))
+    if len(values) > _MAX_UNROLL:
+        raise UnsupportedExpression(f"range() longer than {_MAX_UNROLL}")
+    return values
+
+
+def _elements(node: ast.expr, ctx_name: str, env: Mapping[str, Any]) -> List[Expr]:
+    """The items of a list/tuple literal or an unrolled comprehension over range()."""
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [_to_ir(elt, ctx_name, env) for elt in node.elts]
+    if isinstance(node, (ast.ListComp, ast.GeneratorExp)):
+        if len(node.generators) != 1:
+            raise UnsupportedExpression("nested comprehension")
+        gen = node.generators[0]
+        if gen.ifs or gen.is_async or not isinstance(gen.target, ast.Name):
+            raise UnsupportedExpression("comprehension with filters or unpacking")
+        return [
+            _to_ir(node.elt, ctx_name, {**env, gen.target.id: value})
+            for value in _const_range(gen.iter, env)
+        ]
+    raise UnsupportedExpression(f"{type(node).__name__} where a list was expected")
+
+
+def _to_ir(node: ast.expr, ctx_name: str, env: Mapping[str, Any]) -> Expr:
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return const(node.value)
+        raise UnsupportedExpression(f"constant {node.value!r}")
+    if isinstance(node, ast.Name):
+        if node.id in env:
+            return const(env[node.id])
+        if node.id == ctx_name:
+            raise UnsupportedExpression("ctx used other than as ctx[\"NAME\"]")
+        return Expr("global", value=node.id)
+    if isinstance(node, ast.Subscript):
+        key = node.slice
+        if (
+            isinstance(node.value, ast.Name)
+            and node.value.id == ctx_name
+            and isinstance(key, ast.Constant)
+            and isinstance(key.value, str)
+        ):
+            return Expr("input", value=key.value)
+        raise UnsupportedExpression("subscript other than ctx[\"NAME\"]")
+    if isinstance(node, ast.BinOp):
+        op = _AST_BINARY.get(type(node.op))
+        if op is None:
+            raise UnsupportedExpression(f"operator {type(node.op).__name__}")
+        return make(op, _to_ir(node.left, ctx_name, env), _to_ir(node.right, ctx_name, env))
+    if isinstance(node, ast.UnaryOp):
+        operand = _to_ir(node.operand, ctx_name, env)
+        if isinstance(node.op, ast.USub):
+            return make("neg", operand)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        raise UnsupportedExpression(f"operator {type(node.op).__name__}")
+    if isinstance(node, ast.Call):
+        name = _call_name(node.func)
+        if node.keywords:
+            raise UnsupportedExpression(f"keyword arguments in call to {name}")
+        if name == "sum":
+            if len(node.args) != 1:
+                raise UnsupportedExpression("sum() with a start value")
+            items = _elements(node.args[0], ctx_name, env)
+            if not items:
+                return const(0)
+            # sum() starts from 0; 0 + x == x, so fold from the first item
+            total = items[0]
+            for item in items[1:]:
+                total = make("add", total, item)
+            return total
+        if name in _CALLS:
+            op = _CALLS[name][0]
+            args = [_to_ir(arg, ctx_name, env) for arg in node.args]
+            if op in ("min", "max"):
+                if len(node.args) == 1:
+                    args = _elements(node.args[0], ctx_name, env)
+                if len(args) < 2:
+                    raise UnsupportedExpression(f"{op}() of fewer than two values")
+                result = args[0]
+                for arg in args[1:]:
+                    result = make(op, result, arg)
+                return result
+            if len(args) != 1:
+                raise UnsupportedExpression(f"{name}() with {len(args)} arguments")
+            return make(op, *args)
+        raise UnsupportedExpression(f"call to {name or ast.unparse(node.func)}")
+    raise UnsupportedExpression(type(node).__name__)
+
+
+def _ctx_keys(node: ast.AST, ctx_name: str) -> Tuple[FrozenSet[str], bool]:
+    """All constant ctx["X"] keys under `node`, and whether ctx is used any other way."""
+    keys = set()
+    dynamic = False
+    subscripted = set()
+    for sub in ast.walk(node):
+        if isinstance(sub, ast.Subscript) and isinstance(sub.value, ast.Name) and sub.value.id == ctx_name:
+            subscripted.add(id(sub.value))
+            if isinstance(sub.slice, ast.Constant) and isinstance(sub.slice.value, str):
+                keys.add(sub.slice.value)
+            else:
+                dynamic = True
+    for sub in ast.walk(node):
+        if isinstance(sub, ast.Name) and sub.id == ctx_name and id(sub) not in subscripted:
+            dynamic = True
+    return frozenset(keys), dynamic
+
+
+# ---------------------------------------------------------------------------
+# Compiled lambdas
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CompiledCompute:
+    """One parsed compute lambda.
+
+    `inputs` are the ctx keys read by the lambda (exact unless `dynamic`,
+    i.e. ctx is also used in some other way). `ir` is None if the lambda
+    uses constructs the IR does not support; `error` then says which.
+    """
+
+    name: Optional[str]
+    lineno: int
+    source: str
+    inputs: FrozenSet[str]
+    dynamic: bool
+    ir: Optional[Expr]
+    error: Optional[str] = None
+    _kernels: Dict[Tuple[int, str], Tuple[Any, Callable[[Mapping[str, Any]], Any]]] = field(default_factory=dict, repr=False)
+
+    def resolve(self, fn_globals: Optional[Mapping[str, Any]] = None) -> Expr:
+        """The IR with module-level numeric constants substituted (UnsupportedExpression if impossible)."""
+        if self.ir is None:
+            raise UnsupportedExpression(self.error or "not compiled")
+        return _resolve(self.ir, fn_globals or {})
+
+    def _cached_kernel(self, fn_globals: Optional[Mapping[str, Any]], variant: str, build: Callable[[], Callable]) -> Callable[[Mapping[str, Any]], Any]:
+        """Kernel cache per globals namespace; entries hold the namespace itself, so a
+        recycled id() can never hand out another namespace's kernel."""
+        key = (id(fn_globals), variant)
+        cached = self._kernels.get(key)
+        if cached is None or cached[0] is not fn_globals:
+            cached = (fn_globals, build())
+            self._kernels[key] = cached
+        return cached[1]
+
+    def kernel(self, fn_globals: Optional[Mapping[str, Any]] = None, backend: str = "numpy") -> Callable[[Mapping[str, Any]], Any]:
+        """A function ctx -> value evaluating the expression on scalars or numpy arrays."""
+        return self._cached_kernel(
+            fn_globals, backend, lambda: build_kernel(self.resolve(fn_globals), backend=backend, name=self.name)
+        )
+
+    def derivative(self, wrt: str, fn_globals: Optional[Mapping[str, Any]] = None) -> Expr:
+        """Symbolic d(expression)/d(ctx[wrt])."""
+        return derivative(self.resolve(fn_globals), wrt)
+
+    def derivative_kernel(self, wrt: str, fn_globals: Optional[Mapping[str, Any]] = None) -> Callable[[Mapping[str, Any]], Any]:
+        name = f"{self.name}_d_{wrt}" if self.name else None
+        return self._cached_kernel(
+            fn_globals, "d/d" + wrt, lambda: build_kernel(self.derivative(wrt, fn_globals), name=name)
+        )
+
+
+def _source_segment(lines: List[bytes], node: ast.AST) -> str:
+    """Source text of `node` (ast.get_source_segment re-splits the whole file per call)."""
+    first, last = node.lineno - 1, node.end_lineno - 1
+    if first == last:
+        return lines[first][node.col_offset:node.end_col_offset].decode("utf-8")
+    parts = [lines[first][node.col_offset:], *lines[first + 1:last], lines[last][:node.end_col_offset]]
+    return b"".join(parts).decode("utf-8")
+
+
+def _compile_lambda(name: Optional[str], node: ast.Lambda, lines: List[bytes]) -> CompiledCompute:
+    ctx_name = node.args.args[0].arg
+    inputs, dynamic = _ctx_keys(node.body, ctx_name)
+    ir: Optional[Expr] = None
+    error = None
+    try:
+        ir = _to_ir(node.body, ctx_name, {})
+    except UnsupportedExpression as e:
+        error = str(e)
+    return CompiledCompute(
+        name=name,
+        lineno=node.lineno,
+        source=_source_segment(lines, node.body),
+        inputs=inputs,
+        dynamic=dynamic,
+        ir=ir,
+        error=error,
+    )
+
+
+def _is_compute_lambda(node: ast.expr) -> bool:
+    return isinstance(node, ast.Lambda) and len(node.args.args) == 1 and not node.args.vararg and not node.args.kwarg
+
+
+class ParsedComputeFile:
+    """Every compute lambda of one source file, by parameter name and by line."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        tree = ast.parse(source, filename=path)
+        lines = source.encode("utf-8").splitlines(keepends=True)
+        self.path = path
+        self.by_name: Dict[str, CompiledCompute] = {}
+        self.by_line: Dict[int, Optional[CompiledCompute]] = {}
+
+        named: Dict[int, str] = {}
+        for stmt in tree.body:
+            if (
+                isinstance(stmt, ast.Assign)
+                and len(stmt.targets) == 1
+                and isinstance(stmt.targets[0], ast.Name)
+                and isinstance(stmt.value, ast.Call)
+            ):
+                for kw in stmt.value.keywords:
+                    if kw.arg == "compute" and _is_compute_lambda(kw.value):
+                        named[id(kw.value)] = stmt.targets[0].id
+
+        for node in ast.walk(tree):
+            if not _is_compute_lambda(node):
+                continue
+            name = named.get(id(node))
+            if name is None and node.lineno in self.by_line:
+                continue
+            compiled = _compile_lambda(name, node, lines)
+            if name is not None:
+                self.by_name[name] = compiled
+            # Two lambdas starting on one line cannot be told apart by code object
+            self.by_line[node.lineno] = None if node.lineno in self.by_line else compiled
+
+
+_PARSED: Dict[str, Tuple[Tuple[int, int], ParsedComputeFile]] = {}
+
+
+def parse_compute_lambdas(path: Any) -> ParsedComputeFile:
+    """Parse `path` (cached until its size or mtime changes)."""
+    path = os.path.abspath(str(path))
+    stat = os.stat(path)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    cached = _PARSED.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, ParsedComputeFile(path))
+        _PARSED[path] = cached
+    return cached[1]
+
+
+_BY_CODE: Dict[Any, Optional[CompiledCompute]] = {}
+
+
+def compile_compute(fn: Any) -> Optional[CompiledCompute]:
+    """The parsed lambda behind a compute function, or None if it cannot be located."""
+    code = getattr(fn, "__code__", None)
+    if code is None or code.co_name != "<lambda>":
+        return None
+    if code not in _BY_CODE:
+        try:
+            compiled = parse_compute_lambdas(code.co_filename).by_line.get(code.co_firstlineno)
+        except (OSError, SyntaxError, ValueError):
+            compiled = None
+        _BY_CODE[code] = compiled
+    return _BY_CODE[code]
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+
+def _resolve(expr: Expr, fn_globals: Mapping[str, Any]) -> Expr:
+    if expr.op == "global":
+        value = fn_globals.get(expr.value)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise UnsupportedExpression(f"{expr.value} is not a numeric constant")
+        return const(value if type(value) in (int, float) else float(value))
+    if not expr.args:
+        return expr
+    return make(expr.op, *(_resolve(arg, fn_globals) for arg in expr.args))
+
+
+def _numpy_source(expr: Expr) -> str:
+    if expr.op == "const":
+        return repr(expr.value)
+    if expr.op == "input":
+        return f"ctx[{expr.value!r}]"
+    if expr.op in _SYMBOLS:
+        return f"({_numpy_source(expr.args[0])} {_SYMBOLS[expr.op]} {_numpy_source(expr.args[1])})"
+    if expr.op == "neg":
+        return f"(-{_numpy_source(expr.args[0])})"
+    if expr.op == "float":
+        return _numpy_source(expr.args[0])
+    if expr.op in _NUMPY_FUNCS:
+        return f"{_NUMPY_FUNCS[expr.op]}({', '.join(_numpy_source(arg) for arg in expr.args)})"
+    raise UnsupportedExpression(f"no NumPy lowering for {expr.op}")
+
+
+def _numexpr_source(expr: Expr, names: Dict[str, str]) -> str:
+    if expr.op == "const":
+        return repr(float(expr.value))
+    if expr.op == "input":
+        return names.setdefault(expr.value, f"x{len(names)}")
+    args = [_numexpr_source(arg, names) for arg in expr.args]
+    if expr.op in _SYMBOLS:
+        return f"({args[0]} {_SYMBOLS[expr.op]} {args[1]})"
+    if expr.op == "neg":
+        return f"(-{args[0]})"
+    if expr.op == "float":
+        return args[0]
+    if expr.op in ("min", "max"):
+        cmp = "<=" if expr.op == "min" else ">="
+        return f"where({args[0]} {cmp} {args[1]}, {args[0]}, {args[1]})"
+    if expr.op in _NUMEXPR_FUNCS:
+        return f"{_NUMEXPR_FUNCS[expr.op]}({args[0]})"
+    raise UnsupportedExpression(f"no numexpr lowering for {expr.op}")
+
+
+def _as_int(value: Any) -> Any:
+    """Integer result of a lambda ending in int(): int for scalars, int64 for arrays that fit."""
+    if np.ndim(value) == 0:
+        return int(value)
+    if np.all(np.isfinite(value)) and np.all(np.abs(value) < 2.0**63):
+        return value.astype(np.int64)
+    return value
+
+
+def build_kernel(expr: Expr, backend: str = "numpy", name: Optional[str] = None) -> Callable[[Mapping[str, Any]], Any]:
+    """Compile a resolved IR tree into one Python function of ctx."""
+    if expr.globals():
+        raise UnsupportedExpression(f"unresolved globals: {', '.join(sorted(expr.globals()))}")
+    if backend == "numexpr":
+        import numexpr  # type: ignore
+
+        names: Dict[str, str] = {}
+        text = _numexpr_source(expr, names)
+
+        def numexpr_kernel(ctx: Mapping[str, Any]) -> Any:
+            return numexpr.evaluate(text, local_dict={var: ctx[key] for key, var in names.items()})
+
+        return numexpr_kernel
+    if backend != "numpy":
+        raise ValueError(f"Unknown kernel backend {backend!r} (expected 'numpy' or 'numexpr')")
+    if np is None:
+        raise RuntimeError("Compute kernels require numpy")
+    func_name = f"kernel_{name}" if name and name.isidentifier() else "kernel"
+    body = _numpy_source(expr)
+    if expr.op == "int":
+        body = f"_as_int({body})"
+    code = f"def {func_name}(ctx):\n    return {body}\n"
+    namespace: Dict[str, Any] = {"np": np, "_as_int": _as_int}
+    exec(compile(code, f"<compute kernel {name or ''}>", "exec"), namespace)
+    return namespace[func_name]
+
+
+def compiled_kernel(fn: Any) -> Optional[Callable[[Mapping[str, Any]], Any]]:
+    """NumPy kernel for a compute lambda, or None if it has none."""
+    compiled = compile_compute(fn)
+    if compiled is None or compiled.ir is None:
+        return None
+    try:
+        return compiled.kernel(getattr(fn, "__globals__", None))
+    except (UnsupportedExpression, RuntimeError):
+        compiled.ir = None
+        compiled.error = compiled.error or "could not build a kernel"
+        return None
+
+
+# Rows (spread evenly from first to last) on which a kernel must reproduce its lambda
+CHECK_ROWS = 8
+
+# Lambda code object -> kernel that reproduced the lambda on the checked rows (or None)
+_CHECKED: Dict[Any, Optional[Callable[[Mapping[str, Any]], Any]]] = {}
+
+
+def checked_kernel(fn: Any, ctx: Mapping[str, Any]) -> Optional[Callable[[Mapping[str, Any]], Any]]:
+    """`compiled_kernel(fn)`, verified once against scalar calls of `fn`.
+
+    CHECK_ROWS rows spread over the arrays in `ctx` (always including the
+    first and last) are evaluated by the kernel, on arrays, and by the
+    lambda, one scalar row at a time. If the results differ by more than
+    float rounding on any row the lambda can evaluate, or the lambda raises
+    on every checked row, the kernel is rejected (None, also for every later
+    call) and callers keep using the lambda itself. This guards against
+    lowering differences in branches a single row would not reach
+    (min/max, int truncation) and against the source on disk no longer
+    matching the loaded lambda.
+    """
+    code = getattr(fn, "__code__", None)
+    if code in _CHECKED:
+        return _CHECKED[code]
+    kernel = compiled_kernel(fn)
+    if kernel is not None and not _matches_lambda(fn, kernel, ctx):
+        kernel = None
+    if code is not None:
+        _CHECKED[code] = kernel
+    return kernel
+
+
+def _matches_lambda(fn: Any, kernel: Callable[[Mapping[str, Any]], Any], ctx: Mapping[str, Any]) -> bool:
+    columns = {key: np.ravel(np.asarray(value, dtype=float)) for key, value in ctx.items()}
+    n = max((len(column) for column in columns.values()), default=1)
+    rows = np.unique(np.linspace(0, n - 1, CHECK_ROWS).round().astype(int))
+
+    def column_at(column: Any, index: Any) -> Any:
+        return column[index] if len(column) == n else column[0]
+
+    expected = np.full(len(rows), np.nan)
+    evaluated = np.zeros(len(rows), dtype=bool)
+    for i, row in enumerate(rows):
+        try:
+            expected[i] = float(fn({key: float(column_at(column, row)) for key, column in columns.items()}))
+        except Exception:
+            continue  # The caller's per-sample fallback reproduces the lambda's error here
+        evaluated[i] = True
+    if not evaluated.any():
+        return False
+    try:
+        with np.errstate(all="ignore"):
+            actual = kernel({key: np.array(column_at(column, rows), dtype=float) for key, column in columns.items()})
+        actual = np.broadcast_to(np.asarray(actual, dtype=float), rows.shape)
+    except Exception:
+        return False
+    return bool(np.allclose(actual[evaluated], expected[evaluated], rtol=1e-12, atol=0.0))
+
+
+# ---------------------------------------------------------------------------
+# Symbolic derivatives
+# ---------------------------------------------------------------------------
+
+ZERO = const(0)
+ONE = const(1)
+
+
+def _add(a: Expr, b: Expr) -> Expr:
+    if a == ZERO:
+        return b
+    if b == ZERO:
+        return a
+    return make("add", a, b)
+
+
+def _sub(a: Expr, b: Expr) -> Expr:
+    if b == ZERO:
+        return a
+    if a == ZERO:
+        return make("neg", b)
+    return make("sub", a, b)
+
+
+def _mul(a: Expr, b: Expr) -> Expr:
+    if a == ZERO or b == ZERO:
+        return ZERO
+    if a == ONE:
+        return b
+    if b == ONE:
+        return a
+    return make("mul", a, b)
+
+
+def _div(a: Expr, b: Expr) -> Expr:
+    if a == ZERO:
+        return ZERO
+    if b == ONE:
+        return a
+    return make("div", a, b)
+
+
+def derivative(expr: Expr, wrt: str) -> Expr:
+    """Symbolic partial derivative of a resolved IR tree with respect to input `wrt`.
+
+    `int()` is differentiated as the identity (its continuous relaxation) and
+    min/max pick the derivative of the selected branch.
+    """
+    if wrt not in expr.inputs():
+        return ZERO
+    op, args = expr.op, expr.args
+    if op == "input":
+        return ONE
+    if op in ("float", "int"):
+        return derivative(args[0], wrt)
+    if op == "neg":
+        return make("neg", derivative(args[0], wrt)) if derivative(args[0], wrt) != ZERO else ZERO
+    if op in ("add", "sub"):
+        da, db = derivative(args[0], wrt), derivative(args[1], wrt)
+        return _add(da, db) if op == "add" else _sub(da, db)
+    if op == "mul":
+        a, b = args
+        return _add(_mul(derivative(a, wrt), b), _mul(a, derivative(b, wrt)))
+    if op == "div":
+        a, b = args
+        da, db = derivative(a, wrt), derivative(b, wrt)
+        # (a/b)' = a'/b - a*b'/b^2
+        return _sub(_div(da, b), _div(_mul(a, db), make("pow", b, const(2))))
+    if op == "pow":
+        a, b = args
+        da, db = derivative(a, wrt), derivative(b, wrt)
+        term = ZERO
+        if da != ZERO:
+            # b * a^(b-1) * a'
+            term = _mul(_mul(b, make("pow", a, _sub(b, ONE))), da)
+        if db != ZERO:
+            # a^b * log(a) * b'
+            term = _add(term, _mul(_mul(expr, make("log", a)), db))
+        return term
+    if op == "abs":
+        a = args[0]
+        return _mul(_div(a, make("abs", a)), derivative(a, wrt))
+    if op == "exp":
+        return _mul(expr, derivative(args[0], wrt))
+    if op == "log":
+        return _div(derivative(args[0], wrt), args[0])
+    if op == "sqrt":
+        return _div(derivative(args[0], wrt), _mul(const(2), expr))
+    if op in ("min", "max"):
+        a, b = args
+        da, db = derivative(a, wrt), derivative(b, wrt)
+        # Indicator of the first argument being selected, as arithmetic on min/max:
+        # (min(a, b) - b) / (a - b) is 1 where a < b and 0 where a > b
+        pick_a = _div(_sub(expr, b), _sub(a, b))
+        return _add(_mul(pick_a, da), _mul(_sub(ONE, pick_a), db))
+    raise UnsupportedExpression(f"no derivative for {op}")
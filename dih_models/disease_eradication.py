@@ -0,0 +1,258 @@
+"""
+Disease Eradication Grid
+========================
+
+Array-backed disease-eradication model. The scalar functions in parameters.py
+(`calculate_disease_eradication_rate`, `calculate_life_extension_from_eradication`
+and `calculate_personal_lifetime_wealth_disease_eradication`) evaluate it on
+a 1×1×1 grid, so this module holds the only copy of the formulas.
+
+The scalar functions return nested dicts for one (treaty_pct, years_elapsed)
+point, keyed by the DISEASE_BURDEN categories. Here the categories are
+fixed-index vectors (burden, years lost per death, current
+cure rate, maximum cure rate, in CATEGORIES order), and one call evaluates a
+whole grid of treaty_pct × years_elapsed × Monte Carlo samples of
+TRIAL_CAPACITY_MULTIPLIER. Every result array has shape (T, Y, S) (plus a
+trailing category axis for per-category results), so scenario sweeps such as
+1-10% treaty × 5/10/20/40 years × 10,000 draws are a few numpy operations.
+
+With the point value of TRIAL_CAPACITY_MULTIPLIER (the default) every grid
+cell equals the scalar model's result for that treaty_pct and years_elapsed.
+
+Usage:
+    from dih_models.disease_eradication import eradication_grid, personal_lifetime_wealth_grid
+
+    grid = eradication_grid([0.01, 0.05, 0.10], [5, 10, 20, 40], trial_capacity_multiplier=samples)
+    grid.total_life_extension[1, 2]  # 5% treaty, 20 years: one value per sample
+    wealth = personal_lifetime_wealth_grid(grid)["total_lifetime_benefit"]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from dih_models import parameters as _params
+from dih_models.npv_kernels import compound_sum, extended_earnings_pv
+
+CATEGORIES: Tuple[str, ...] = tuple(_params.DISEASE_BURDEN)
+
+
+def _category_vector(values: Dict[str, float]) -> np.ndarray:
+    return np.array([values[category] for category in CATEGORIES], dtype=float)
+
+
+# Per-category inputs, indexed like CATEGORIES
+BURDEN_PCT = _category_vector(_params.DISEASE_BURDEN)
+YEARS_LOST_PER_DEATH = _category_vector(_params.YEARS_LOST_PER_DEATH)
+CURRENT_CURE_RATE = _category_vector(_params.CURRENT_CURE_RATE)
+MAX_CURE_RATE = _category_vector(_params.RESEARCH_ACCELERATION_POTENTIAL)
+
+
+@dataclass(frozen=True)
+class EradicationGrid:
+    """Disease-eradication results over treaty_pct × years_elapsed × samples.
+
+    Arrays are (T, Y, S); `new_cure_rate` and `improvement` are (T, Y, S, C)
+    with categories in CATEGORIES order.
+    """
+
+    treaty_pct: np.ndarray
+    years_elapsed: np.ndarray
+    trial_capacity_multiplier: np.ndarray
+    conservative: bool
+    cumulative_research_years: np.ndarray
+    new_cure_rate: np.ndarray
+    improvement: np.ndarray
+    disease_life_extension: np.ndarray
+    aging_reversal_bonus: np.ndarray
+    total_life_extension: np.ndarray
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.total_life_extension.shape  # type: ignore[return-value]
+
+    @property
+    def avg_cure_improvement(self) -> np.ndarray:
+        """Burden-weighted cure rate improvement (drives healthcare savings)."""
+        return self.improvement @ BURDEN_PCT
+
+    def category_life_extension(self) -> np.ndarray:
+        """Years gained per category, (T, Y, S, C)."""
+        return self.improvement * BURDEN_PCT * YEARS_LOST_PER_DEATH
+
+
+def cure_rates(cumulative_research: np.ndarray | float, conservative: bool = False) -> np.ndarray:
+    """
+    Cure/prevention rate of every category after `cumulative_research` research-years
+
+    Progress toward each category's maximum cure rate follows a logarithmic
+    curve (diminishing returns); conservative mode halves the progress.
+
+    Args:
+        cumulative_research: Research-years accumulated (any shape)
+        conservative: If True, assume 50% of calculated progress
+
+    Returns:
+        Cure rates with a trailing category axis in CATEGORIES order
+    """
+    # Calibrated against historical precedent (124 years of progress, 1900-2024 →
+    # +32 years of life expectancy), faster under 115x acceleration:
+    # -   500 research-years → 35% of potential
+    # - 1,000 research-years → 50% of potential
+    # - 2,300 research-years → 70% of potential (20-year scenario)
+    # - 5,000 research-years → 85% of potential
+    # - 10,000 research-years → 95% of potential
+    progress_factor = np.minimum(0.95, 0.25 + 0.25 * ((np.asarray(cumulative_research, dtype=float) / 1000) ** 0.6))
+    if conservative:
+        progress_factor = progress_factor * 0.5
+    room_for_improvement = MAX_CURE_RATE - CURRENT_CURE_RATE
+    return np.minimum(MAX_CURE_RATE, CURRENT_CURE_RATE + room_for_improvement * progress_factor[..., None])
+
+
+def eradication_grid(
+    treaty_pct: Sequence[float] | np.ndarray | float,
+    years_elapsed: Sequence[float] | np.ndarray | float,
+    trial_capacity_multiplier: Optional[Sequence[float] | np.ndarray | float] = None,
+    conservative: bool = False,
+) -> EradicationGrid:
+    """
+    Life extension from systematic disease eradication for a whole scenario grid
+
+    Args:
+        treaty_pct: Fractions of military spending redirected (T values)
+        years_elapsed: Years since treaty signed (Y values)
+        trial_capacity_multiplier: Samples of TRIAL_CAPACITY_MULTIPLIER at a
+            1% treaty (S values); defaults to its point value
+        conservative: If True, assume 50% slower progress (as the scalar model)
+
+    Returns:
+        EradicationGrid with (T, Y, S) arrays
+    """
+    treaty = np.atleast_1d(np.asarray(treaty_pct, dtype=float))
+    years = np.atleast_1d(np.asarray(years_elapsed, dtype=float))
+    if trial_capacity_multiplier is None:
+        trial_capacity_multiplier = float(_params.TRIAL_CAPACITY_MULTIPLIER)
+    multiplier = np.atleast_1d(np.asarray(trial_capacity_multiplier, dtype=float))
+
+    # calculate_cumulative_research_years: multiplier(treaty_pct) × years_elapsed
+    research_multiplier = multiplier[None, None, :] * (treaty[:, None, None] / 0.01)
+    cumulative_research = research_multiplier * years[None, :, None]
+
+    new_cure_rate = cure_rates(cumulative_research, conservative)
+    improvement = new_cure_rate - CURRENT_CURE_RATE
+
+    # calculate_life_extension_from_eradication: Σ improvement × burden × years lost,
+    # plus the aging reversal bonus. Organ regeneration and epigenetic reprogramming
+    # push lifespan toward the accident-limited limit (practically ~150-200 years):
+    # -   500 research-years → +15 years
+    # - 2,300 research-years → +65 years [20-year scenario]
+    # - 10,000 research-years → +120 years
+    disease_life_extension = (improvement * BURDEN_PCT) @ YEARS_LOST_PER_DEATH
+    aging_reversal_bonus = np.minimum(150, 12.0 * ((cumulative_research / 100) ** 0.56))
+    if conservative:
+        aging_reversal_bonus = aging_reversal_bonus * 0.3
+
+    return EradicationGrid(
+        treaty_pct=treaty,
+        years_elapsed=years,
+        trial_capacity_multiplier=multiplier,
+        conservative=conservative,
+        cumulative_research_years=cumulative_research,
+        new_cure_rate=new_cure_rate,
+        improvement=improvement,
+        disease_life_extension=disease_life_extension,
+        aging_reversal_bonus=aging_reversal_bonus,
+        total_life_extension=disease_life_extension + aging_reversal_bonus,
+    )
+
+
+def personal_lifetime_wealth_grid(
+    grid: EradicationGrid,
+    current_age: int = 30,
+    baseline_life_expectancy: int = 80,
+    annual_income: Any = 50000,
+    discount_rate: Any = 0.03,
+) -> Dict[str, np.ndarray]:
+    """
+    Personal lifetime wealth (disease eradication model) for every grid cell
+
+    Life extension and healthcare savings follow the grid's samples. The
+    per-treaty components (GDP boost, productivity, caregiver savings) come
+    from the scalar helpers in parameters.py, which use the point value of
+    TRIAL_CAPACITY_MULTIPLIER, exactly as the scalar model does.
+
+    Args:
+        grid: Result of eradication_grid()
+        current_age: Person's current age
+        baseline_life_expectancy: Current life expectancy
+        annual_income: Person's annual income
+        discount_rate: Discount rate for NPV calculations
+
+    Returns:
+        dict of (T, Y, S) arrays: "total_lifetime_benefit", the NPV components,
+        the annual components ("*_annual") and "gdp_boost"
+    """
+    # Per-treaty components, broadcast along years and samples
+    treaty = grid.treaty_pct
+    gdp_boost = np.array([_params.calculate_gdp_growth_boost(pct) for pct in treaty])[:, None, None]
+    productivity_gains_annual = np.array(
+        [_params.calculate_productivity_loss_conservative_baseline(pct, annual_income) for pct in treaty]
+    )[:, None, None]
+    caregiver_savings_annual = np.array(
+        [_params.calculate_caregiver_savings_conservative_baseline(pct) for pct in treaty]
+    )[:, None, None]
+
+    peace_dividend_per_capita_annual = _params.PEACE_DIVIDEND_ANNUAL_SOCIETAL_BENEFIT / _params.GLOBAL_POPULATION_2024
+    years_remaining = baseline_life_expectancy - current_age
+    life_extension_years = grid.total_life_extension
+    total_years = years_remaining + life_extension_years
+
+    us_chronic_cost_per_capita = 3.7e12 / _params.US_POPULATION_2024
+    healthcare_savings_annual = us_chronic_cost_per_capita * (grid.avg_cure_improvement * 0.8)
+
+    peace_dividend_total = compound_sum(peace_dividend_per_capita_annual, total_years, gdp_boost, discount_rate)
+    healthcare_savings_total = compound_sum(healthcare_savings_annual, total_years, gdp_boost, discount_rate)
+    productivity_gains_total = compound_sum(productivity_gains_annual, total_years, gdp_boost, discount_rate)
+    caregiver_savings_total = compound_sum(caregiver_savings_annual, total_years, gdp_boost, discount_rate)
+
+    baseline_growth = 0.025
+    treaty_value = compound_sum(annual_income, years_remaining, gdp_boost, discount_rate)
+    baseline_value = compound_sum(annual_income, years_remaining, baseline_growth, discount_rate)
+    gdp_boost_benefit = np.broadcast_to(treaty_value - baseline_value, grid.shape)
+
+    extended_earnings = extended_earnings_pv(
+        annual_income,
+        gdp_boost,
+        discount_rate,
+        years_remaining,
+        life_extension_years,
+        max_working_years=70 - baseline_life_expectancy,
+        retirement_share=0.60,
+    )
+
+    total_benefit = (
+        peace_dividend_total
+        + healthcare_savings_total
+        + productivity_gains_total
+        + caregiver_savings_total
+        + gdp_boost_benefit
+        + extended_earnings
+    )
+    return {
+        "total_lifetime_benefit": total_benefit,
+        "peace_dividend_total": peace_dividend_total,
+        "healthcare_savings_total": healthcare_savings_total,
+        "productivity_gains_total": productivity_gains_total,
+        "caregiver_savings_total": caregiver_savings_total,
+        "gdp_boost_benefit": gdp_boost_benefit,
+        "extended_earnings": extended_earnings,
+        "life_extension_years": life_extension_years,
+        "peace_dividend_annual": np.broadcast_to(peace_dividend_per_capita_annual, grid.shape),
+        "healthcare_savings_annual": healthcare_savings_annual,
+        "productivity_gains_annual": np.broadcast_to(productivity_gains_annual, grid.shape),
+        "caregiver_savings_annual": np.broadcast_to(caregiver_savings_annual, grid.shape),
+        "gdp_boost": np.broadcast_to(gdp_boost, grid.shape),
+    }
@@ -0,0 +1,257 @@
+"""
+Local Elasticities
+==================
+
+Local sensitivities of every calculated parameter with respect to every
+leaf (input) parameter at the point values, as elasticities
+
+    E[outcome, leaf] = ∂outcome/∂leaf × leaf / outcome
+
+i.e. the % change in the outcome per 1% change in the input. Tornado bands
+vary each input over its uncertainty range (two graph evaluations per
+input); elasticities are the complementary first-order picture, and all of
+them come from one pass over the compute graph.
+
+Method (forward-mode differentiation with sparse gradients):
+- each leaf starts with the unit gradient {leaf: 1}
+- calculated parameters are visited in topological order; the gradient of
+  a node is Σ_input ∂node/∂input × gradient(input), where the local partial
+  derivatives ∂node/∂input come from the symbolic derivatives of its
+  compiled compute lambda (compute_compiler), evaluated at the baseline
+  values
+- lambdas the compiler cannot parse (calls into model functions) get
+  finite differences on their direct inputs instead; each outcome records
+  whether any such step was involved ("method")
+
+`int(...)` in a lambda is differentiated as the identity (its continuous
+relaxation), so elasticities of integer counts are those of the underlying
+quantity rather than 0.
+
+Usage:
+    from dih_models.elasticities import compute_elasticities, write_elasticities
+
+    result = compute_elasticities(parameters, graph=graph)
+    result.elasticities["TREATY_COMPLETE_ROI_ALL_BENEFITS"]  # leaf -> elasticity
+    result.leaf_importance()                                  # leaf -> max |elasticity|
+    write_elasticities(result, project_root / "_analysis" / ELASTICITIES_FILE)
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from dih_models.build_cache import write_json_if_changed
+from dih_models.compute_compiler import UnsupportedExpression, compile_compute
+from dih_models.parameter_graph import ParameterGraph, build_parameter_graph
+from dih_models.uncertainty import TornadoEngine
+
+# Bump when the file layout changes
+ELASTICITIES_SCHEMA_VERSION = 1
+
+ELASTICITIES_FILE = "elasticities.json"
+
+# Relative step of the central finite differences for uncompiled lambdas
+FD_RELATIVE_STEP = 1e-6
+
+# Relative half-width of the secant used where those hit a step (see _finite_difference)
+SECANT_RELATIVE_STEP = 0.05
+
+# Local partial derivatives of one node: input name -> ∂node/∂input
+Partials = Dict[str, float]
+
+
+@dataclass
+class ElasticityResult:
+    """Point values, gradients and elasticities of calculated parameters.
+
+    `gradients[outcome][leaf]` is ∂outcome/∂leaf and `elasticities` the
+    same scaled by leaf / outcome (absent where the outcome is 0). Leaves
+    with a zero derivative are omitted. `methods[outcome]` is "symbolic" if
+    every step came from compiled derivatives, else "finite_difference".
+    """
+
+    values: Dict[str, float]
+    gradients: Dict[str, Dict[str, float]]
+    elasticities: Dict[str, Dict[str, float]]
+    methods: Dict[str, str]
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def leaf_importance(self) -> Dict[str, float]:
+        """Largest |elasticity| of each leaf over all outcomes, highest first."""
+        importance: Dict[str, float] = {}
+        for row in self.elasticities.values():
+            for leaf, e in row.items():
+                importance[leaf] = max(importance.get(leaf, 0.0), abs(e))
+        return dict(sorted(importance.items(), key=lambda kv: (-kv[1], kv[0])))
+
+    def to_json(self) -> Dict[str, Any]:
+        outcomes = {}
+        for name in self.gradients:
+            outcomes[name] = {
+                "value": self.values[name],
+                "method": self.methods[name],
+                "elasticities": self.elasticities.get(name, {}),
+                "derivatives": self.gradients[name],
+            }
+        return {
+            "schema": ELASTICITIES_SCHEMA_VERSION,
+            "outcomes": outcomes,
+            "leaf_importance": self.leaf_importance(),
+            "errors": dict(sorted(self.errors.items())),
+        }
+
+
+def _finite_difference(compute_fn: Callable[[Dict[str, float]], Any], ctx: Dict[str, float]) -> Partials:
+    """Finite differences of `compute_fn` on each input of `ctx`.
+
+    Central differences with a small step, unless the forward and backward
+    differences disagree or are both zero: model functions that count whole
+    years (`int(years)`) are staircases, whose small-step derivative is 0 or
+    a jump. Those inputs get the secant over ±SECANT_RELATIVE_STEP instead,
+    the average slope of the staircase (the analogue of differentiating
+    `int()` as the identity in compiled lambdas).
+    """
+    partials: Partials = {}
+    base = float(compute_fn(ctx))
+    for name, x in ctx.items():
+        scale = abs(x) or 1.0
+        h = FD_RELATIVE_STEP * scale
+        forward = (float(compute_fn({**ctx, name: x + h})) - base) / h
+        backward = (base - float(compute_fn({**ctx, name: x - h}))) / h
+        if (forward or backward) and math.isclose(forward, backward, rel_tol=1e-3):
+            partials[name] = (forward + backward) / 2
+            continue
+        h = SECANT_RELATIVE_STEP * scale
+        up = float(compute_fn({**ctx, name: x + h}))
+        down = float(compute_fn({**ctx, name: x - h}))
+        partials[name] = (up - down) / (2 * h)
+    return partials
+
+
+def local_partials(compute_fn: Callable[[Dict[str, float]], Any], ctx: Dict[str, float]) -> Tuple[Partials, str]:
+    """∂compute/∂input for every input in `ctx`, and the method used."""
+    compiled = compile_compute(compute_fn)
+    if compiled is not None and compiled.ir is not None:
+        fn_globals = getattr(compute_fn, "__globals__", None)
+        try:
+            partials = {
+                name: float(compiled.derivative_kernel(name, fn_globals)(ctx)) if name in compiled.inputs else 0.0
+                for name in ctx
+            }
+        except (UnsupportedExpression, ArithmeticError, ValueError):
+            pass
+        else:
+            if all(math.isfinite(d) for d in partials.values()):
+                return partials, "symbolic"
+    return _finite_difference(compute_fn, ctx), "finite_difference"
+
+
+def compute_elasticities(
+    parameters: Dict[str, Dict[str, Any]],
+    outcomes: Optional[Sequence[str]] = None,
+    graph: Optional[ParameterGraph] = None,
+    engine: Optional[TornadoEngine] = None,
+) -> ElasticityResult:
+    """
+    Gradients and elasticities of calculated parameters w.r.t. all their leaves
+
+    Args:
+        parameters: Parsed parameters (name -> {"value": ...})
+        outcomes: Calculated parameters to report (default: all of them);
+            every calculated parameter upstream of them is differentiated
+        graph: Optional ParameterGraph already built from `parameters`
+        engine: Optional TornadoEngine whose cached baseline values to reuse
+
+    Returns:
+        ElasticityResult for the requested outcomes
+    """
+    graph = build_parameter_graph(parameters, graph)
+    if engine is None or engine.graph is not graph:
+        engine = TornadoEngine(parameters, graph)
+    values, node_errors = engine.baseline_values, engine.baseline_errors
+
+    targets = list(outcomes) if outcomes is not None else [n for n in graph.topological_order if n in graph.computed]
+    needed = set()
+    for name in targets:
+        needed.update(n for n in graph.upstream(name) if n in graph.computed)
+
+    gradients: Dict[str, Dict[str, float]] = {}
+    symbolic: Dict[str, bool] = {}
+    errors: Dict[str, str] = {}
+
+    def gradient_of(name: str) -> Dict[str, float]:
+        if name in gradients:
+            return gradients[name]
+        return {name: 1.0}  # A leaf (or an input without a compute function)
+
+    for node in graph.topological_order:
+        if node not in needed or node in graph.cyclic:
+            continue
+        inputs_list, compute_fn = graph.computed[node]
+        failed = next((inp for inp in inputs_list if inp in errors or inp in node_errors), None)
+        if node in node_errors or failed is not None:
+            errors[node] = errors.get(failed) or str(node_errors.get(node) or node_errors.get(failed))
+            continue
+        ctx = {inp: float(values.get(inp, 0.0)) for inp in inputs_list}
+        try:
+            partials, method = local_partials(compute_fn, ctx)
+        except Exception as e:
+            errors[node] = str(e)
+            continue
+        grad: Dict[str, float] = {}
+        for inp, d in partials.items():
+            if d == 0.0:
+                continue
+            for leaf, g in gradient_of(inp).items():
+                grad[leaf] = grad.get(leaf, 0.0) + d * g
+        gradients[node] = {leaf: g for leaf, g in grad.items() if g != 0.0}
+        symbolic[node] = method == "symbolic" and all(symbolic.get(inp, True) for inp in inputs_list)
+
+    result_gradients: Dict[str, Dict[str, float]] = {}
+    result_elasticities: Dict[str, Dict[str, float]] = {}
+    result_values: Dict[str, float] = {}
+    methods: Dict[str, str] = {}
+    for name in targets:
+        if name not in gradients:
+            if name not in errors:
+                errors[name] = "not a calculated parameter" if name not in graph.computed else "on a dependency cycle"
+            continue
+        y = float(values[name])
+        grad = dict(sorted(gradients[name].items()))
+        result_values[name] = y
+        result_gradients[name] = grad
+        methods[name] = "symbolic" if symbolic[name] else "finite_difference"
+        if y != 0.0 and math.isfinite(y):
+            row = {leaf: g * float(values.get(leaf, 0.0)) / y for leaf, g in grad.items()}
+            result_elasticities[name] = dict(sorted(
+                ((leaf, e) for leaf, e in row.items() if e != 0.0),
+                key=lambda kv: (-abs(kv[1]), kv[0]),
+            ))
+    return ElasticityResult(
+        values=result_values,
+        gradients=result_gradients,
+        elasticities=result_elasticities,
+        methods=methods,
+        errors={name: errors[name] for name in targets if name in errors},
+    )
+
+
+def write_elasticities(result: ElasticityResult, path: Path) -> bool:
+    """Write `result` as JSON to `path`; True if the file changed."""
+    return write_json_if_changed(Path(path), result.to_json())
+
+
+def load_elasticities(path: Path) -> Dict[str, Any]:
+    """Read a file written by `write_elasticities` ({} if it does not exist)."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("schema") != ELASTICITIES_SCHEMA_VERSION:
+        raise ValueError(f"{path}: elasticities schema {data.get('schema')} (expected {ELASTICITIES_SCHEMA_VERSION})")
+    return data
@@ -22,10 +22,10 @@ Usage:
     )
 """
 
-import re
 from pathlib import Path
 from typing import Any, Dict
 
+from .compute_compiler import Expr, compile_compute, parse_compute_lambdas
 from .formatting import format_parameter_value
 
 
@@ -105,9 +105,59 @@ def smart_title_case(param_name: str) -> str:
     return ' '.join(result)
 
 
+def _strip_casts(expr: Expr) -> Expr:
+    """Drop float()/int() wrappers, which do not change the displayed operation."""
+    while expr.op in ("float", "int"):
+        expr = expr.args[0]
+    return expr
+
+
+def _flatten(expr: Expr, op: str) -> list:
+    """Operands of a chain of one associative operation, e.g. a + b + c."""
+    expr = _strip_casts(expr)
+    if expr.op == op:
+        return _flatten(expr.args[0], op) + _flatten(expr.args[1], op)
+    return [expr]
+
+
+def _operation_from_expression(expr: Expr, inputs: list) -> tuple[str, str | None]:
+    """Classify a compiled compute expression (same labels as the probe below)."""
+    expr = _strip_casts(expr)
+    n = len(inputs)
+
+    if n == 1:
+        if expr.op == "input" and expr.value == inputs[0]:
+            return 'identity', None
+        return 'transform', None
+
+    if n == 2:
+        if expr.op in ("add", "mul", "div", "sub"):
+            a, b = (_strip_casts(arg) for arg in expr.args)
+            if a.op == b.op == "input" and a.value != b.value and {a.value, b.value} == set(inputs):
+                first = a.value == inputs[0]
+                if expr.op == "add":
+                    return 'sum', None
+                if expr.op == "mul":
+                    return 'multiply', None
+                if expr.op == "div":
+                    return 'divide', 'first_over_second' if first else 'second_over_first'
+                return 'subtract', 'first_minus_second' if first else 'second_minus_first'
+        return 'complex', None
+
+    # Multi-input: a sum or product of every input, each used once
+    for op, label in (("add", "sum"), ("mul", "multiply")):
+        terms = _flatten(expr, op)
+        if all(t.op == "input" for t in terms) and sorted(t.value for t in terms) == sorted(inputs):
+            return label, None
+    return 'complex', None
+
+
 def infer_operation_from_compute(param_value: Any, inputs: list) -> tuple[str, str | None]:
     """
-    Infer operation type by testing the compute function with known values.
+    Infer operation type from the compute function.
+
+    Lambdas parsed by the compute compiler are classified from their
+    expression tree; anything else is probed with known test values.
 
     Returns:
         Tuple of (operation_type, order) where:
@@ -121,6 +171,10 @@ def infer_operation_from_compute(param_value: Any, inputs: list) -> tuple[str, s
     if n == 0:
         return 'complex', None
 
+    compiled = compile_compute(param_value.compute)
+    if compiled is not None and compiled.ir is not None:
+        return _operation_from_expression(compiled.ir, list(inputs))
+
     # Create test context with distinct values that make operations distinguishable
     # Use values like [2, 3, 4, ...] so we can identify the operation
     test_vals = [2.0 + i for i in range(n)]
@@ -174,42 +228,8 @@ def infer_operation_from_compute(param_value: Any, inputs: list) -> tuple[str, s
 
 def extract_lambda_body_from_file(param_name: str, params_file: Path) -> str | None:
     """Extract the lambda body from parameters.py for a given parameter."""
-    content = params_file.read_text(encoding="utf-8")
-
-    # Find the parameter definition start
-    start_pattern = rf'{param_name}\s*=\s*Parameter\('
-    start_match = re.search(start_pattern, content)
-    if not start_match:
-        return None
-
-    start = start_match.start()
-
-    # Find matching closing paren by counting depth
-    depth = 0
-    end = start
-    for i, c in enumerate(content[start:], start):
-        if c == '(':
-            depth += 1
-        elif c == ')':
-            depth -= 1
-            if depth == 0:
-                end = i + 1
-                break
-
-    param_def = content[start:end]
-
-    # Find compute=lambda ctx: ... pattern
-    compute_match = re.search(
-        r'compute\s*=\s*lambda\s+ctx\s*:\s*(.+?)(?=,\s*\n\s*\)|$)',
-        param_def,
-        re.DOTALL
-    )
-    if compute_match:
-        body = compute_match.group(1).strip()
-        body = body.rstrip(',').strip()
-        return body
-
-    return None
+    compiled = parse_compute_lambdas(params_file).by_name.get(param_name)
+    return compiled.source if compiled is not None else None
 
 
 def lambda_to_sympy_latex(lambda_body: str, var_names: list[str]) -> str | None:
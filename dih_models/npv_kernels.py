@@ -0,0 +1,132 @@
+"""
+NPV Kernels
+===========
+
+Closed-form present values of growing annual amounts, used by the lifetime
+wealth models in parameters.py in place of year-by-year Python loops.
+
+Every kernel is the geometric series
+
+    PV = Σ_{t=start}^{stop-1} amount × (1 + g)^t / (1 + r)^t
+       = amount × q^start × (q^n − 1) / (q − 1),   q = (1 + g) / (1 + r), n = stop − start
+
+evaluated with log1p/expm1 so it stays accurate as q → 1 (growth close to
+the discount rate) and is exactly amount × n when q == 1. Year bounds are
+truncated like `range(int(start), int(stop))`, and an empty range (stop ≤
+start) contributes 0, so callers need no `if years > 0` branches.
+
+Scalar arguments are evaluated with `math` and return a float. If any
+argument is a numpy array, the kernels broadcast over all of them, so a
+compute lambda can evaluate the models for every Monte Carlo sample in one
+call. numpy is only needed for array arguments.
+
+Exports:
+- geometric_pv(amount, growth_rate, discount_rate, start, stop)
+- compound_sum(annual_benefit, years, growth_rate, discount_rate=0.03):
+    Σ over t = 1..int(years), the loop formerly in parameters.compound_sum
+- extended_earnings_pv(annual_income, growth_rate, discount_rate, years_remaining,
+                       life_extension_years, max_working_years, retirement_share):
+    earnings in the years added by life extension (working years, then a
+    flat retirement income)
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # Scalar-only: the math path below needs no numpy
+
+
+def _is_array(*values: Any) -> bool:
+    return np is not None and any(isinstance(value, np.ndarray) for value in values)
+
+
+def geometric_pv(amount: Any, growth_rate: Any, discount_rate: Any, start: Any, stop: Any) -> Any:
+    """
+    Present value of `amount` growing at `growth_rate` over years start..stop-1
+
+    Formula: PV = Σ_{t=start}^{stop-1} amount × (1 + growth_rate)^t / (1 + discount_rate)^t
+
+    Args:
+        amount: Annual amount at t = 0
+        growth_rate: Annual growth rate of the amount
+        discount_rate: NPV discount rate
+        start: First year (truncated to an integer)
+        stop: Year after the last one (truncated to an integer)
+
+    Returns:
+        Present value (float, or an array if any argument is an array)
+    """
+    if _is_array(amount, growth_rate, discount_rate, start, stop):
+        start = np.trunc(np.asarray(start, dtype=float))
+        n = np.maximum(np.trunc(np.asarray(stop, dtype=float)) - start, 0.0)
+        log_q = np.log1p(np.asarray(growth_rate, dtype=float)) - np.log1p(np.asarray(discount_rate, dtype=float))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            series = np.where(log_q == 0.0, n, np.expm1(n * log_q) / np.expm1(log_q))
+        return amount * np.exp(start * log_q) * series
+
+    start = int(start)
+    n = int(stop) - start
+    if n <= 0:
+        return 0.0
+    log_q = math.log1p(growth_rate) - math.log1p(discount_rate)
+    if log_q == 0.0:
+        return amount * n
+    return amount * math.exp(start * log_q) * math.expm1(n * log_q) / math.expm1(log_q)
+
+
+def compound_sum(annual_benefit: Any, years: Any, growth_rate: Any, discount_rate: Any = 0.03) -> Any:
+    """
+    Present value of compounding annual benefits over years 1..int(years)
+
+    Formula: PV = Σ_{t=1}^{T} annual_benefit × (1 + growth_rate)^t / (1 + discount_rate)^t
+    """
+    if _is_array(years):
+        return geometric_pv(annual_benefit, growth_rate, discount_rate, 1, np.trunc(years) + 1)
+    return geometric_pv(annual_benefit, growth_rate, discount_rate, 1, int(years) + 1)
+
+
+def extended_earnings_pv(
+    annual_income: Any,
+    growth_rate: Any,
+    discount_rate: Any,
+    years_remaining: Any,
+    life_extension_years: Any,
+    max_working_years: float,
+    retirement_share: float,
+) -> Any:
+    """
+    Present value of earnings in the years added by life extension
+
+    Income keeps growing at `growth_rate` for the first
+    max(0, min(life_extension_years, max_working_years)) extra years; for the
+    rest of the extension a flat retirement income of `retirement_share` ×
+    the final working income is received. Zero if life_extension_years <= 0.
+
+    Args:
+        annual_income: Annual income at t = 0
+        growth_rate: Annual income growth rate
+        discount_rate: NPV discount rate
+        years_remaining: Years until the baseline life expectancy
+        life_extension_years: Years added to life expectancy
+        max_working_years: Retirement age minus baseline life expectancy
+        retirement_share: Retirement income as a fraction of final working income
+
+    Returns:
+        Present value of the extra working and retirement income
+    """
+    if _is_array(life_extension_years):
+        working_years = np.maximum(0, np.minimum(life_extension_years, max_working_years))
+    else:
+        working_years = max(0, min(life_extension_years, max_working_years))
+    working_end = years_remaining + working_years
+    total_years = years_remaining + life_extension_years
+
+    working = geometric_pv(annual_income, growth_rate, discount_rate, years_remaining, working_end)
+    retirement_income = annual_income * ((1 + growth_rate) ** working_end) * retirement_share
+    retirement = geometric_pv(retirement_income, 0.0, discount_rate, working_end, total_years)
+    return working + retirement
@@ -0,0 +1,248 @@
+"""
+Parameter Dependency Graph
+==========================
+
+Compiled view of the `inputs` graph declared on `Parameter` instances in
+`dih_models/parameters.py`.
+
+Several stages of the pipeline (uncertainty propagation, tornado analysis,
+survey impact ranking) need the same questions answered about the graph:
+what order to evaluate calculated parameters in, which fundamental inputs a
+parameter ultimately depends on, and which parameters are affected when an
+input changes. `ParameterGraph` builds the graph once from the dict produced
+by `parse_parameters_file()` and answers those questions from cached indexes
+instead of re-walking `inputs` recursively per query.
+
+Usage:
+    from dih_models.parameter_graph import ParameterGraph
+
+    graph = ParameterGraph(parameters)
+    for name in graph.topological_order:
+        ...
+    graph.fundamental_inputs("TREATY_ROI_LAG_ELIMINATION")
+    graph.descendants("NPV_DISCOUNT_RATE_STANDARD")
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+def has_uncertainty(value: Any) -> bool:
+    """Check if a parameter value carries uncertainty metadata."""
+    return bool(
+        getattr(value, "distribution", None) or
+        getattr(value, "confidence_interval", None) or
+        getattr(value, "std_error", None)
+    )
+
+
+class ParameterGraph:
+    """Dependency DAG over a parameters dict.
+
+    Edges run from each parameter to the names listed in its `inputs`.
+    Names referenced in `inputs` but missing from `parameters` are kept as
+    terminal nodes so callers see the same leaves a recursive walk would.
+
+    Attributes:
+        parameters: The dict passed in (name -> {'value': ..., ...})
+        inputs: name -> list of direct input names (only nodes with inputs)
+        computed: name -> (inputs, compute_fn) for nodes with both inputs and compute
+        dependents: name -> set of parameters that list it as a direct input
+        topological_order: Every node, inputs before the parameters that use them
+        cyclic: Nodes that sit on (or downstream of) a dependency cycle
+    """
+
+    def __init__(self, parameters: Dict[str, Dict[str, Any]]) -> None:
+        self.parameters = parameters
+        self.inputs: Dict[str, List[str]] = {}
+        self.computed: Dict[str, Tuple[List[str], Callable[[Dict[str, Any]], Any]]] = {}
+        self.dependents: Dict[str, Set[str]] = {}
+
+        for name, meta in parameters.items():
+            val = meta.get("value")
+            if val is None:
+                continue
+            inputs_list = getattr(val, "inputs", None)
+            if not inputs_list:
+                continue
+            self.inputs[name] = list(inputs_list)
+            compute_fn = getattr(val, "compute", None)
+            if compute_fn:
+                self.computed[name] = (self.inputs[name], compute_fn)
+            for inp in inputs_list:
+                self.dependents.setdefault(inp, set()).add(name)
+
+        self.topological_order, self.cyclic = self._toposort()
+        self._position = {name: i for i, name in enumerate(self.topological_order)}
+
+        self._fundamental: Dict[str, FrozenSet[str]] = {}
+        self._leaves: Dict[str, FrozenSet[str]] = {}
+        self._descendants: Dict[str, FrozenSet[str]] = {}
+        self._upstream: Dict[str, Tuple[str, ...]] = {}
+
+    def _toposort(self) -> Tuple[List[str], Set[str]]:
+        """Kahn's algorithm; nodes that never become ready are cyclic."""
+        nodes: List[str] = list(self.parameters)
+        seen = set(nodes)
+        for inputs_list in self.inputs.values():
+            for inp in inputs_list:
+                if inp not in seen:
+                    seen.add(inp)
+                    nodes.append(inp)
+
+        index = {name: i for i, name in enumerate(nodes)}
+        remaining = {name: len(set(self.inputs.get(name, ()))) for name in nodes}
+        ready = [name for name in nodes if remaining[name] == 0]
+        order: List[str] = []
+        i = 0
+        while i < len(ready):
+            name = ready[i]
+            i += 1
+            order.append(name)
+            for dep in sorted(self.dependents.get(name, ()), key=index.__getitem__):
+                remaining[dep] -= 1
+                if remaining[dep] == 0:
+                    ready.append(dep)
+
+        cyclic = {name for name in nodes if remaining[name] > 0}
+        return order, cyclic
+
+    def check_acyclic(self) -> None:
+        """Raise ValueError if the inputs graph contains a cycle."""
+        if self.cyclic:
+            raise ValueError(
+                f"Dependency cycle among parameters: {', '.join(sorted(self.cyclic))}"
+            )
+
+    def value(self, name: str) -> Any:
+        """Return the Parameter (or plain number) for `name`, or None if unknown."""
+        return self.parameters.get(name, {}).get("value")
+
+    def is_computed(self, name: str) -> bool:
+        """True if `name` has both inputs and a compute function."""
+        return name in self.computed
+
+    def fundamental_inputs(self, name: str) -> FrozenSet[str]:
+        """Leaf parameters with uncertainty that `name` depends on.
+
+        Matches `uncertainty.get_fundamental_inputs`: parameters without inputs
+        are leaves and count only if they carry uncertainty; parameters with
+        inputs are always expanded.
+        """
+        cached = self._fundamental.get(name)
+        if cached is not None:
+            return cached
+        if name in self.cyclic:
+            result = frozenset(self._walk_terminals(name, uncertain_only=True))
+        else:
+            result = self._terminals(name, self._fundamental, uncertain_only=True)
+        self._fundamental[name] = result
+        return result
+
+    def leaf_inputs(self, name: str) -> FrozenSet[str]:
+        """All parameters without inputs that `name` depends on (or {name} for a leaf)."""
+        cached = self._leaves.get(name)
+        if cached is not None:
+            return cached
+        if name in self.cyclic:
+            result = frozenset(self._walk_terminals(name, uncertain_only=False))
+        else:
+            result = self._terminals(name, self._leaves, uncertain_only=False)
+        self._leaves[name] = result
+        return result
+
+    def _terminals(self, name: str, cache: Dict[str, FrozenSet[str]], uncertain_only: bool) -> FrozenSet[str]:
+        """Fill `cache` for the upstream closure of `name` in topological order."""
+        if name not in self._position:
+            # Unknown name: behaves like a value-less leaf
+            return frozenset() if uncertain_only else frozenset((name,))
+        for node in self.upstream(name):
+            if node in cache:
+                continue
+            inputs_list = self.inputs.get(node)
+            if inputs_list:
+                acc: Set[str] = set()
+                for inp in inputs_list:
+                    acc.update(cache[inp])
+                cache[node] = frozenset(acc)
+            elif uncertain_only:
+                val = self.value(node)
+                cache[node] = frozenset((node,)) if val is not None and has_uncertainty(val) else frozenset()
+            else:
+                cache[node] = frozenset((node,))
+        return cache[name]
+
+    def _walk_terminals(self, name: str, uncertain_only: bool) -> Set[str]:
+        """Recursive fallback for nodes on a cycle (visited-set pruning)."""
+        found: Set[str] = set()
+        visited: Set[str] = set()
+        stack = [name]
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            inputs_list = self.inputs.get(node)
+            if inputs_list:
+                stack.extend(inputs_list)
+            elif not uncertain_only:
+                found.add(node)
+            else:
+                val = self.value(node)
+                if val is not None and has_uncertainty(val):
+                    found.add(node)
+        return found
+
+    def upstream(self, name: str) -> Tuple[str, ...]:
+        """`name` and everything it depends on, in topological order.
+
+        Cyclic nodes are excluded; use `fundamental_inputs`/`leaf_inputs`
+        for cycle-tolerant queries.
+        """
+        cached = self._upstream.get(name)
+        if cached is not None:
+            return cached
+        closure: Set[str] = set()
+        stack = [name]
+        while stack:
+            node = stack.pop()
+            if node in closure:
+                continue
+            closure.add(node)
+            stack.extend(self.inputs.get(node, ()))
+        result = tuple(sorted(
+            (n for n in closure if n in self._position),
+            key=self._position.__getitem__,
+        ))
+        self._upstream[name] = result
+        return result
+
+    def descendants(self, name: str) -> FrozenSet[str]:
+        """Every parameter that depends on `name`, directly or transitively."""
+        cached = self._descendants.get(name)
+        if cached is not None:
+            return cached
+        found: Set[str] = set()
+        stack = list(self.dependents.get(name, ()))
+        while stack:
+            node = stack.pop()
+            if node in found:
+                continue
+            found.add(node)
+            stack.extend(self.dependents.get(node, ()))
+        result = frozenset(found)
+        self._descendants[name] = result
+        return result
+
+    def ordered(self, names) -> List[str]:
+        """Sort an iterable of names into topological order (cyclic names last)."""
+        end = len(self._position)
+        return sorted(names, key=lambda n: self._position.get(n, end))
+
+
+def build_parameter_graph(parameters: Dict[str, Dict[str, Any]], graph: Optional[ParameterGraph] = None) -> ParameterGraph:
+    """Return `graph` if it was built from `parameters`, else build a new one."""
+    if graph is not None and graph.parameters is parameters:
+        return graph
+    return ParameterGraph(parameters)
@@ -31,6 +31,13 @@ except ImportError:
     # Handle direct execution (not as package)
     from reference_ids import ReferenceID
 
+# Closed-form, array-aware NPV kernels for the lifetime wealth models
+try:
+    from .npv_kernels import compound_sum as _closed_form_compound_sum, extended_earnings_pv
+except ImportError:
+    # Handle direct execution (not as package)
+    from npv_kernels import compound_sum as _closed_form_compound_sum, extended_earnings_pv
+
 
 # ============================================================================
 # PARAMETER CLASS - Adds source tracking to numeric values
@@ -4593,19 +4600,17 @@ def compound_sum(annual_benefit: float, years: float, growth_rate: float, discou
 
     Args:
         annual_benefit: Initial annual benefit amount
-        years: Number of years
+        years: Number of years (truncated to whole years)
         growth_rate: Annual growth rate (GDP boost)
         discount_rate: NPV discount rate
 
+    Any argument may be a numpy array (one value per Monte Carlo sample); the
+    sum is evaluated in closed form by dih_models/npv_kernels.py.
+
     Returns:
         Present value of all future benefits
     """
-    total = 0
-    for t in range(1, int(years) + 1):
-        future_value = annual_benefit * ((1 + growth_rate) ** t)
-        present_value = future_value / ((1 + discount_rate) ** t)
-        total += present_value
-    return total
+    return _closed_form_compound_sum(annual_benefit, years, growth_rate, discount_rate)
 
 
 # ---
@@ -4962,21 +4967,16 @@ def calculate_personal_lifetime_wealth_conservative_baseline(
     income_without_boost = compound_sum(annual_income, years_remaining, base_growth, discount_rate)
     gdp_boost_benefit = income_with_gdp_boost - income_without_boost
 
-    # Component 6: Extended earning years
-    extended_earnings = 0
-    if life_extension_years > 0:
-        working_years_extended = max(0, min(life_extension_years, 70 - baseline_life_expectancy))
-        retirement_years_extended = life_extension_years - working_years_extended
-
-        for t in range(int(years_remaining), int(years_remaining + working_years_extended)):
-            future_income = annual_income * ((1 + gdp_boost) ** t)
-            extended_earnings += future_income / ((1 + discount_rate) ** t)
-
-        if retirement_years_extended > 0:
-            final_working_income = annual_income * ((1 + gdp_boost) ** (years_remaining + working_years_extended))
-            retirement_income = final_working_income * 0.50  # Realistic 50%
-            for t in range(int(years_remaining + working_years_extended), int(total_years)):
-                extended_earnings += retirement_income / ((1 + discount_rate) ** t)
+    # Component 6: Extended earning years (working until 70, then retirement)
+    extended_earnings = extended_earnings_pv(
+        annual_income,
+        gdp_boost,
+        discount_rate,
+        years_remaining,
+        life_extension_years,
+        max_working_years=70 - baseline_life_expectancy,
+        retirement_share=0.50,  # Realistic 50%
+    )
 
     # Compound benefits over lifetime
     peace_dividend_total = compound_sum(peace_dividend_per_capita_annual, total_years, gdp_boost, discount_rate)
@@ -5046,7 +5046,7 @@ PERSONAL_LIFETIME_WEALTH = Parameter(
         current_age=30,
         annual_income=50000,
         discount_rate=0.03,  # Fixed 3% personal discount rate
-        life_extension_override=float(ctx["LIFE_EXTENSION_YEARS"]),
+        life_extension_override=ctx["LIFE_EXTENSION_YEARS"],
     )["total_lifetime_benefit"],
 )
 
@@ -5091,6 +5091,15 @@ def calculate_cumulative_research_years(treaty_pct: float, years_elapsed: float)
     return multiplier * years_elapsed
 
 
+def _disease_eradication():
+    # Imported lazily: disease_eradication reads its inputs from this module
+    try:
+        from . import disease_eradication
+    except ImportError:
+        import disease_eradication
+    return disease_eradication
+
+
 def calculate_disease_eradication_rate(category: str, cumulative_research_years: float, conservative: bool = False) -> float:
     """
     Calculate what percentage of a disease category can be cured/prevented
@@ -5102,6 +5111,8 @@ def calculate_disease_eradication_rate(category: str, cumulative_research_years:
     - Progress follows logarithmic curve (diminishing returns)
     - Conservative mode assumes slower progress
 
+    The formula lives in disease_eradication.cure_rates().
+
     Args:
         category: Disease category name
         cumulative_research_years: Total research-years accumulated
@@ -5110,35 +5121,9 @@ def calculate_disease_eradication_rate(category: str, cumulative_research_years:
     Returns:
         Total cure/prevention rate (0-1)
     """
-    current_rate = CURRENT_CURE_RATE[category]
-    max_potential = RESEARCH_ACCELERATION_POTENTIAL[category]
-
-    # Room for improvement
-    room_for_improvement = max_potential - current_rate
-
-    # Logarithmic progress curve (diminishing returns)
-    # Fast progress initially, then slows as we approach limits
-    #
-    # Calibrated based on historical precedent:
-    # - 124 years (1900-2024) → 32 years life extension
-    # - But with 115x acceleration, progress is faster
-    #
-    # Progress scaling:
-    # -   500 research-years → 35% of potential
-    # - 1,000 research-years → 50% of potential
-    # - 2,300 research-years → 70% of potential (20-year scenario)
-    # - 5,000 research-years → 85% of potential
-    # - 10,000 research-years → 95% of potential
-    #
-    # Formula: logarithmic with slower saturation
-    progress_factor = min(0.95, 0.25 + 0.25 * ((cumulative_research_years / 1000) ** 0.6))
-
-    if conservative:
-        progress_factor *= 0.5  # Conservative: half the progress
-
-    # New cure rate
-    improvement = room_for_improvement * progress_factor
-    return min(max_potential, current_rate + improvement)
+    eradication = _disease_eradication()
+    rates = eradication.cure_rates(cumulative_research_years, conservative)
+    return float(rates[eradication.CATEGORIES.index(category)])
 
 
 def calculate_life_extension_from_eradication(treaty_pct: float, years_elapsed: float, conservative: bool = False) -> dict[str, Any]:
@@ -5151,6 +5136,8 @@ def calculate_life_extension_from_eradication(treaty_pct: float, years_elapsed:
     - Years of life lost per disease category
     - Diminishing returns as diseases are eradicated
 
+    Evaluates disease_eradication.eradication_grid() on a 1×1×1 grid.
+
     Args:
         treaty_pct: Fraction of military spending redirected
         years_elapsed: Years since treaty signed
@@ -5159,81 +5146,34 @@ def calculate_life_extension_from_eradication(treaty_pct: float, years_elapsed:
     Returns:
         dict with life extension details and total years gained
     """
-    cumulative_research = calculate_cumulative_research_years(treaty_pct, years_elapsed)
-
-    total_life_extension = 0.0
-    disease_details = {}
-
-    for category in DISEASE_BURDEN.keys():
-        # Current baseline deaths from this category
-        burden_pct = DISEASE_BURDEN[category]
-        years_lost_per_death = YEARS_LOST_PER_DEATH[category]
-
-        # Current cure rate
-        current_cure_rate = CURRENT_CURE_RATE[category]
-
-        # New cure rate with research acceleration
-        new_cure_rate = calculate_disease_eradication_rate(category, cumulative_research, conservative)
+    grid = _disease_eradication().eradication_grid(treaty_pct, years_elapsed, conservative=conservative)
+    return _life_extension_result(grid, years_elapsed)
 
-        # Improvement in cure rate
-        cure_rate_improvement = new_cure_rate - current_cure_rate
 
-        # Life extension from this category
-        # If we cure X% more of a disease that causes Y% of deaths
-        # and each death loses Z years, we gain: X * Y * Z years
-        category_life_extension = cure_rate_improvement * burden_pct * years_lost_per_death
-
-        total_life_extension += category_life_extension
+def _life_extension_result(grid: Any, years_elapsed: float) -> dict[str, Any]:
+    """Scalar result dict of calculate_life_extension_from_eradication for a 1×1×1 EradicationGrid"""
+    category_life_extension = grid.category_life_extension()[0, 0, 0]
 
+    disease_details = {}
+    for i, category in enumerate(_disease_eradication().CATEGORIES):
         disease_details[category] = {
-            "burden_pct": burden_pct,
-            "current_cure_rate": current_cure_rate,
-            "new_cure_rate": new_cure_rate,
-            "improvement": cure_rate_improvement,
-            "years_lost_per_death": years_lost_per_death,
-            "life_extension_contribution": category_life_extension,
+            "burden_pct": DISEASE_BURDEN[category],
+            "current_cure_rate": CURRENT_CURE_RATE[category],
+            "new_cure_rate": float(grid.new_cure_rate[0, 0, 0, i]),
+            "improvement": float(grid.improvement[0, 0, 0, i]),
+            "years_lost_per_death": YEARS_LOST_PER_DEATH[category],
+            "life_extension_contribution": float(category_life_extension[i]),
         }
 
-    # AGING REVERSAL BONUS - Approaching Accident-Limited Lifespan
-    #
-    # If we can regenerate organs and reprogram DNA/epigenetics, there's NO biological
-    # reason for aging-related death. Life expectancy becomes limited primarily by accidents.
-    #
-    # Current accident death rate: 62.3 per 100,000 = 0.0623% per year
-    # If accidents are ONLY mortality → expected lifespan ≈ 1,600 years
-    #
-    # But realistically:
-    # - Some accidents can be prevented (AI vehicles, safety systems)
-    # - Some can't (rare disasters, violence)
-    # - Practical limit accounting for accidents: ~150-200 years
-    #
-    # This is ADDITIONAL to disease-specific improvements above
-    #
-    # Scaling toward accident-limited lifespan:
-    # -   500 research-years → +15 years (80→95)
-    # - 1,000 research-years → +35 years (80→115)
-    # - 2,300 research-years → +65 years (80→145) [20-year scenario]
-    # - 4,600 research-years → +95 years (80→175) [40-year scenario]
-    # - 10,000 research-years → +120 years (80→200) [approaching accident-limited]
-    #
-    # Formula: logarithmic scaling with asymptote at accident-limited lifespan (~150 years gain)
-    aging_reversal_bonus = min(150, 12.0 * ((cumulative_research / 100) ** 0.56))
-
-    if conservative:
-        aging_reversal_bonus *= 0.3  # Conservative: only 30% of aging reversal potential
-
-    # Total life extension = disease cures + aging reversal
-    total_life_extension += aging_reversal_bonus
-
     return {
-        "total_life_extension": total_life_extension,
-        "disease_life_extension": total_life_extension - aging_reversal_bonus,
-        "aging_reversal_bonus": aging_reversal_bonus,
-        "cumulative_research_years": cumulative_research,
+        "total_life_extension": float(grid.total_life_extension[0, 0, 0]),
+        "disease_life_extension": float(grid.disease_life_extension[0, 0, 0]),
+        "aging_reversal_bonus": float(grid.aging_reversal_bonus[0, 0, 0]),
+        "cumulative_research_years": float(grid.cumulative_research_years[0, 0, 0]),
         "years_elapsed": years_elapsed,
         "disease_details": disease_details,
         "model_type": "disease_eradication",
-        "conservative": conservative,
+        "conservative": grid.conservative,
     }
 
 
@@ -5262,6 +5202,8 @@ def calculate_personal_lifetime_wealth_disease_eradication(
     - 20 years elapsed: Aging partially reversed, most diseases eradicated
     - 40 years elapsed: Approaching biological limits
 
+    Evaluates disease_eradication.personal_lifetime_wealth_grid() on a 1×1×1 grid.
+
     Args:
         treaty_pct: Fraction of military spending redirected
         current_age: Person's current age
@@ -5274,105 +5216,38 @@ def calculate_personal_lifetime_wealth_disease_eradication(
     Returns:
         dict with total lifetime benefit and detailed breakdown
     """
-    # Calculate life extension from disease eradication
-    eradication_result = calculate_life_extension_from_eradication(treaty_pct, years_elapsed, conservative)
-    life_extension_years = eradication_result["total_life_extension"]
-
-    # Medical progress multiplier for other calculations
-    progress_multiplier = calculate_trial_capacity_multiplier(treaty_pct)
-
-    # Peace dividend (same as other models)
-    peace_dividend_per_capita_annual = PEACE_DIVIDEND_ANNUAL_SOCIETAL_BENEFIT / GLOBAL_POPULATION_2024
-    years_remaining = baseline_life_expectancy - current_age
-    total_years = years_remaining + life_extension_years
-
-    # GDP boost for compounding calculations
-    gdp_boost = calculate_gdp_growth_boost(treaty_pct)
-
-    # Healthcare savings (disease eradication approach)
-    # As diseases are eradicated, healthcare costs drop
-    # Average reduction proportional to cure rate improvement across all categories
-    avg_cure_improvement = sum(
-        detail["improvement"] * detail["burden_pct"] for detail in eradication_result["disease_details"].values()
-    )
-    healthcare_reduction_pct = avg_cure_improvement * 0.8  # 80% of cure improvement translates to cost reduction
-    US_CHRONIC_COST_PER_CAPITA = 3.7e12 / US_POPULATION_2024  # $11,045/person/year
-    healthcare_savings_annual = US_CHRONIC_COST_PER_CAPITA * healthcare_reduction_pct
-
-    # Productivity gains (same as conservative baseline model)
-    productivity_gains_annual = calculate_productivity_loss_conservative_baseline(treaty_pct, annual_income)
-
-    # Caregiver savings (same as conservative baseline model)
-    caregiver_savings_annual = calculate_caregiver_savings_conservative_baseline(treaty_pct)
-
-    # Component totals using compound_sum
-    peace_dividend_total = compound_sum(peace_dividend_per_capita_annual, total_years, gdp_boost, discount_rate)
-    healthcare_savings_total = compound_sum(healthcare_savings_annual, total_years, gdp_boost, discount_rate)
-    productivity_gains_total = compound_sum(productivity_gains_annual, total_years, gdp_boost, discount_rate)
-    caregiver_savings_total = compound_sum(caregiver_savings_annual, total_years, gdp_boost, discount_rate)
-
-    # GDP boost benefit
-    # Calculate the ADDITIONAL benefit from GDP boost (treaty growth vs baseline growth)
-    # FIXED: Only calculate boost for years_remaining to avoid double-counting extended years
-    # (Extended years are fully captured in the extended_earnings component)
-    baseline_growth = 0.025  # Baseline economic growth without treaty
-
-    # Calculate incremental benefit from faster growth over baseline lifespan only
-    gdp_boost_benefit = 0
-    for t in range(1, int(years_remaining) + 1):
-        # Incremental value from faster growth
-        baseline_value = annual_income * ((1 + baseline_growth) ** t)
-        treaty_value = annual_income * ((1 + gdp_boost) ** t)
-        incremental_value = treaty_value - baseline_value
-        gdp_boost_benefit += incremental_value / ((1 + discount_rate) ** t)
-
-    # Extended earnings from life extension
-    extended_earnings = 0
-    if life_extension_years > 0:
-        working_years_extended = max(0, min(life_extension_years, 70 - baseline_life_expectancy))
-        retirement_years_extended = life_extension_years - working_years_extended
-
-        for t in range(int(years_remaining), int(years_remaining + working_years_extended)):
-            future_income = annual_income * ((1 + gdp_boost) ** t)
-            extended_earnings += future_income / ((1 + discount_rate) ** t)
-
-        if retirement_years_extended > 0:
-            final_working_income = annual_income * ((1 + gdp_boost) ** (years_remaining + working_years_extended))
-            retirement_income = final_working_income * 0.60  # 60% retirement income
-            for t in range(int(years_remaining + working_years_extended), int(total_years)):
-                extended_earnings += retirement_income / ((1 + discount_rate) ** t)
-
-    # Total benefit
-    total_benefit = (
-        peace_dividend_total
-        + healthcare_savings_total
-        + productivity_gains_total
-        + caregiver_savings_total
-        + gdp_boost_benefit
-        + extended_earnings
-    )
+    eradication = _disease_eradication()
+    grid = eradication.eradication_grid(treaty_pct, years_elapsed, conservative=conservative)
+    eradication_result = _life_extension_result(grid, years_elapsed)
+    wealth = {
+        name: float(values[0, 0, 0])
+        for name, values in eradication.personal_lifetime_wealth_grid(
+            grid, current_age, baseline_life_expectancy, annual_income, discount_rate
+        ).items()
+    }
+    life_extension_years = wealth["life_extension_years"]
 
     return {
-        "total_lifetime_benefit": total_benefit,
+        "total_lifetime_benefit": wealth["total_lifetime_benefit"],
         "annual_breakdown": {
-            "peace_dividend": peace_dividend_per_capita_annual,
-            "healthcare_savings": healthcare_savings_annual,
-            "productivity_gains": productivity_gains_annual,
-            "caregiver_savings": caregiver_savings_annual,
+            "peace_dividend": wealth["peace_dividend_annual"],
+            "healthcare_savings": wealth["healthcare_savings_annual"],
+            "productivity_gains": wealth["productivity_gains_annual"],
+            "caregiver_savings": wealth["caregiver_savings_annual"],
         },
         "npv_breakdown": {
-            "peace_dividend_total": peace_dividend_total,
-            "healthcare_savings_total": healthcare_savings_total,
-            "productivity_gains_total": productivity_gains_total,
-            "caregiver_savings_total": caregiver_savings_total,
-            "gdp_boost_benefit": gdp_boost_benefit,
-            "extended_earnings": extended_earnings,
+            "peace_dividend_total": wealth["peace_dividend_total"],
+            "healthcare_savings_total": wealth["healthcare_savings_total"],
+            "productivity_gains_total": wealth["productivity_gains_total"],
+            "caregiver_savings_total": wealth["caregiver_savings_total"],
+            "gdp_boost_benefit": wealth["gdp_boost_benefit"],
+            "extended_earnings": wealth["extended_earnings"],
         },
         "life_extension_years": life_extension_years,
         "new_life_expectancy": baseline_life_expectancy + life_extension_years,
         "cumulative_research_years": eradication_result["cumulative_research_years"],
-        "gdp_growth_boost": gdp_boost - 0.025,
-        "medical_progress_multiplier": progress_multiplier,
+        "gdp_growth_boost": wealth["gdp_boost"] - 0.025,
+        "medical_progress_multiplier": calculate_trial_capacity_multiplier(treaty_pct),
         "eradication_details": eradication_result["disease_details"],
         "model_type": "disease_eradication",
         "years_elapsed": years_elapsed,
@@ -5640,3 +5515,30 @@ IAB_BOOTSTRAP_CAMPAIGN_COST_OPTIMISTIC_USD = Parameter(
     unit="USD",
     keywords=["campaign", "cost", "bootstrap", "optimistic"],
 )  # $50M
+
+# ---
+# INPUT CORRELATIONS
+# ---
+
+# Spearman rank correlations between uncertain input parameters, imposed on
+# the Monte Carlo samples by uncertainty.iman_conover() when the pipeline runs
+# with --correlated. Pairs not listed are sampled independently. Values are
+# modelling assumptions about shared drivers, not estimates from data.
+INPUT_RANK_CORRELATIONS = {
+    # Conflict intensity drives deaths across categories
+    ("GLOBAL_ANNUAL_CONFLICT_DEATHS_ACTIVE_COMBAT", "GLOBAL_ANNUAL_CONFLICT_DEATHS_STATE_VIOLENCE"): 0.5,
+    ("GLOBAL_ANNUAL_CONFLICT_DEATHS_ACTIVE_COMBAT", "GLOBAL_ANNUAL_CONFLICT_DEATHS_TERROR_ATTACKS"): 0.3,
+    # Infrastructure damage estimates share the same conflict-intensity inputs
+    ("GLOBAL_ANNUAL_INFRASTRUCTURE_DAMAGE_ENERGY_CONFLICT", "GLOBAL_ANNUAL_INFRASTRUCTURE_DAMAGE_TRANSPORTATION_CONFLICT"): 0.5,
+    ("GLOBAL_ANNUAL_INFRASTRUCTURE_DAMAGE_ENERGY_CONFLICT", "GLOBAL_ANNUAL_INFRASTRUCTURE_DAMAGE_WATER_CONFLICT"): 0.5,
+    ("GLOBAL_ANNUAL_INFRASTRUCTURE_DAMAGE_ENERGY_CONFLICT", "GLOBAL_ANNUAL_INFRASTRUCTURE_DAMAGE_COMMUNICATIONS_CONFLICT"): 0.5,
+    ("GLOBAL_ANNUAL_INFRASTRUCTURE_DAMAGE_HEALTHCARE_CONFLICT", "GLOBAL_ANNUAL_INFRASTRUCTURE_DAMAGE_EDUCATION_CONFLICT"): 0.5,
+    # Trade disruption channels move together with energy prices
+    ("GLOBAL_ANNUAL_TRADE_DISRUPTION_ENERGY_PRICE_CONFLICT", "GLOBAL_ANNUAL_TRADE_DISRUPTION_SHIPPING_CONFLICT"): 0.5,
+    ("GLOBAL_ANNUAL_TRADE_DISRUPTION_ENERGY_PRICE_CONFLICT", "GLOBAL_ANNUAL_TRADE_DISRUPTION_SUPPLY_CHAIN_CONFLICT"): 0.5,
+    # Opportunity cost scales with the spending it is derived from
+    ("GLOBAL_MILITARY_SPENDING_ANNUAL_2024", "GLOBAL_ANNUAL_LOST_ECONOMIC_GROWTH_MILITARY_SPENDING"): 0.7,
+    # Government trial spending is part of total trial and research spending
+    ("GLOBAL_CLINICAL_TRIALS_SPENDING_ANNUAL", "GLOBAL_GOVERNMENT_CLINICAL_TRIALS_SPENDING_ANNUAL"): 0.6,
+    ("GLOBAL_GOVERNMENT_CLINICAL_TRIALS_SPENDING_ANNUAL", "GLOBAL_MED_RESEARCH_SPENDING"): 0.5,
+}
@@ -0,0 +1,292 @@
+"""
+Fast Parameter Access
+=====================
+
+Importing `dih_models.parameters` executes ~5,000 lines of Parameter
+constructors and the generated `ReferenceID` enum, which costs tens of
+milliseconds per Python process. Every rendered chapter pays that cost
+again through `knowledge/includes/setup-parameters.qmd`, which star-imports
+this module instead.
+
+The generate-everything pipeline therefore writes a precompiled snapshot,
+`_analysis/parameters-snapshot.marshal`, holding each numeric parameter's
+value plus the display fields `format_parameter_value` reads (`unit`,
+`display_name`). This module loads that snapshot with `marshal` and serves
+values from it:
+
+- Parameters come back as `LazyParameter` floats. The snapshot fields are
+  available immediately; any other metadata (`source_ref`, `formula`,
+  `std_error`, ...) imports the source module on first access and is read
+  from the real `Parameter`.
+- Plain numeric constants, and the dict/tuple constants (`DISEASE_BURDEN`,
+  ...), come back as stored.
+- Helper functions (`calculate_*`, `compound_sum`, ...) come back as
+  proxies that import the source module on their first call.
+- Any other name is looked up in the source module.
+
+The snapshot records the size, mtime and sha256 of the modules that
+determine parameter values. If any of them changed since the snapshot was
+written (or the snapshot is missing or from another format version), this
+module falls back to importing `dih_models.parameters` and returns the real
+objects, so a stale snapshot can never serve stale values.
+
+Usage:
+    from dih_models.params_fast import TREATY_ROI_LAG_ELIMINATION, format_parameter_value
+
+    format_parameter_value(TREATY_ROI_LAG_ELIMINATION)  # no full import
+    TREATY_ROI_LAG_ELIMINATION.source_ref              # imports parameters.py once
+"""
+
+from __future__ import annotations
+
+import importlib
+import marshal
+import os
+import sys
+import types
+from typing import Any, Dict, List, Mapping, Optional
+
+from dih_models.formatting import (
+    format_parameter_value,
+    format_percentage,
+    format_qalys,
+    format_roi,
+)
+
+# `from dih_models.params_fast import *` exports the formatters plus every
+# snapshot name (extended below)
+__all__ = ["format_parameter_value", "format_percentage", "format_qalys", "format_roi"]
+
+SNAPSHOT_FILE = "parameters-snapshot.marshal"
+
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 2
+
+# Paths use os.path: pathlib/hashlib would dominate this module's import time
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# _analysis/ next to the dih_models package (the project root)
+DEFAULT_SNAPSHOT_PATH = os.path.join(os.path.dirname(_PACKAGE_DIR), "_analysis", SNAPSHOT_FILE)
+
+# Modules whose source determines parameter values
+_SOURCE_MODULES = ("parameters.py", "reference_ids.py", "compute_context.py", "npv_kernels.py")
+
+# Parameter fields stored in the snapshot (everything else loads lazily)
+_SNAPSHOT_FIELDS = ("unit", "display_name")
+
+# Non-numeric constants stored by value (must be marshal-able)
+_CONSTANT_TYPES = (dict, tuple, list, str)
+
+
+def _source_stamp(name: str) -> List[Any]:
+    """[size, mtime_ns, sha256] of a source module ([-1, 0, ""] if missing)."""
+    import hashlib
+
+    path = os.path.join(_PACKAGE_DIR, name)
+    try:
+        stat = os.stat(path)
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return [-1, 0, ""]
+    return [stat.st_size, stat.st_mtime_ns, digest]
+
+
+def _is_fresh(sources: Dict[str, List[Any]]) -> bool:
+    """True if every source module matches the stamp recorded in the snapshot.
+
+    Size and mtime are checked first; files whose mtime moved (e.g. after a
+    checkout) are re-hashed, so only real content changes count as stale.
+    """
+    if set(sources) != set(_SOURCE_MODULES):
+        return False
+    for name, recorded in sources.items():
+        size, mtime_ns, digest = recorded
+        try:
+            stat = os.stat(os.path.join(_PACKAGE_DIR, name))
+        except OSError:
+            return False
+        if stat.st_size != size:
+            return False
+        if stat.st_mtime_ns != mtime_ns and _source_stamp(name)[2] != digest:
+            return False
+    return True
+
+
+def _load_snapshot(path: str) -> Optional[Dict[str, Any]]:
+    """Snapshot data at `path`, or None if missing or stale."""
+    try:
+        with open(path, "rb") as f:
+            data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        return None
+    if not _is_fresh(data.get("sources", {})):
+        return None
+    return data
+
+
+def _source_module() -> Any:
+    return importlib.import_module("dih_models.parameters")
+
+
+class LazyParameter(float):
+    """Float value from the snapshot; full `Parameter` metadata loads on demand.
+
+    `unit` and `display_name` come from the snapshot. Any other public
+    attribute imports `dih_models.parameters` and is read from the real
+    `Parameter`.
+    """
+
+    __slots__ = ("_name", "unit", "display_name")
+
+    def __new__(cls, name: str, value: float, unit: str = "", display_name: Optional[str] = None) -> LazyParameter:
+        instance = super().__new__(cls, value)
+        instance._name = name
+        instance.unit = unit
+        instance.display_name = display_name
+        return instance
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only reached for attributes not in __slots__; keep dunder/private
+        # probes (numpy, copy, pickle) from triggering the full import
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(metadata(self._name), attr)
+
+    def __reduce__(self) -> Any:
+        return (metadata, (self._name,))
+
+
+def metadata(name: str) -> Any:
+    """The real `Parameter` (or value) for `name` from `dih_models.parameters`."""
+    return getattr(_source_module(), name)
+
+
+def _lazy_function(name: str) -> Any:
+    """Proxy for helper `name` of `dih_models.parameters`, imported on first call."""
+
+    def proxy(*args: Any, **kwargs: Any) -> Any:
+        return metadata(name)(*args, **kwargs)
+
+    proxy.__name__ = proxy.__qualname__ = name
+    proxy.__module__ = "dih_models.parameters"
+    return proxy
+
+
+def write_parameter_snapshot(values: Optional[Mapping[str, Any]] = None, path: Optional[os.PathLike[str] | str] = None) -> bool:
+    """Write the snapshot for `values` (name -> Parameter or number).
+
+    Defaults to the numeric constants of `dih_models.parameters`. The
+    non-numeric constants and the names of the helper functions always come
+    from that module. Call this right after loading the parameters so the
+    recorded source stamps match the code that produced the values. Returns
+    True if the file was written (it is left untouched when nothing changed).
+    """
+    from dih_models.build_cache import write_bytes_if_changed
+
+    module = _source_module()
+    if values is None:
+        values = {name: getattr(module, name) for name in dir(module)}
+    path = os.fspath(path) if path is not None else DEFAULT_SNAPSHOT_PATH
+    table: Dict[str, Any] = {}
+    for name in sorted(values):
+        value = values[name]
+        if not name.isupper() or isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        if hasattr(value, "unit"):
+            table[name] = (float(value),) + tuple(getattr(value, f, None) for f in _SNAPSHOT_FIELDS)
+        else:
+            table[name] = value
+    constants: Dict[str, Any] = {}
+    functions: List[str] = []
+    for name in sorted(dir(module)):
+        value = getattr(module, name)
+        if name.startswith("_") or name in __all__ or name in table:
+            continue
+        if name.isupper() and isinstance(value, _CONSTANT_TYPES):
+            constants[name] = value
+        elif isinstance(value, types.FunctionType):
+            functions.append(name)
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "sources": {name: _source_stamp(name) for name in _SOURCE_MODULES},
+        "parameters": table,
+        "constants": constants,
+        "functions": functions,
+    }
+    written = write_bytes_if_changed(path, marshal.dumps(data))
+    if os.path.abspath(path) == DEFAULT_SNAPSHOT_PATH:
+        _reset()
+    return written
+
+
+# --- Module state -----------------------------------------------------------
+
+_snapshot: Optional[Dict[str, Any]] = None
+_constants: Dict[str, Any] = {}
+_functions: frozenset = frozenset()
+_cache: Dict[str, Any] = {}
+
+
+def _reset() -> None:
+    global _snapshot, _constants, _functions
+    _cache.clear()
+    # A process that already imported the source module gains nothing from
+    # the snapshot; serve the real objects instead
+    data = None if "dih_models.parameters" in sys.modules else _load_snapshot(DEFAULT_SNAPSHOT_PATH)
+    _snapshot = data["parameters"] if data is not None else None
+    _constants = data["constants"] if data is not None else {}
+    _functions = frozenset(data["functions"]) if data is not None else frozenset()
+
+
+def snapshot_loaded() -> bool:
+    """True if values are being served from a fresh snapshot."""
+    return _snapshot is not None
+
+
+def __getattr__(name: str) -> Any:
+    cached = _cache.get(name)
+    if cached is not None:
+        return cached
+    entry = _snapshot.get(name) if _snapshot is not None else None
+    if entry is None and name in _constants:
+        value = _constants[name]
+    elif entry is None and name in _functions:
+        value = _lazy_function(name)
+    elif entry is None:
+        if name.startswith("__"):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        try:
+            value = getattr(_source_module(), name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    elif isinstance(entry, tuple):
+        value = LazyParameter(name, *entry)
+    else:
+        value = entry
+    _cache[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    names = set(globals())
+    if _snapshot is not None:
+        names.update(_snapshot, _constants, _functions)
+    return sorted(names)
+
+
+_reset()
+
+# Without a fresh snapshot, export what `from dih_models.parameters import *`
+# would (the import already loaded the module)
+if _snapshot is not None:
+    __all__ += sorted(set(_snapshot) | set(_constants) | _functions)
+else:
+    _module = _source_module()
+    __all__ += [
+        n for n in dir(_module)
+        if not n.startswith("_") and n not in __all__ and not isinstance(getattr(_module, n), types.ModuleType)
+    ]
+    del _module
@@ -0,0 +1,222 @@
+"""
+Pipeline Profiling
+==================
+
+Lightweight instrumentation for the generate-everything pipeline, the
+Python-side counterpart of the per-file Quarto timings collected by
+`BuildMonitor` in scripts/lib/render_utils.py.
+
+The module-level `PROFILER` records:
+- stage timers (wall and CPU seconds; dotted names such as
+  "uncertainty.tornado" are sub-stages), each with the counter increments
+  made while it was open
+- counters, e.g. compute-lambda calls: `count_calls()` is called at the
+  evaluation sites in uncertainty.py, once per vectorized call over whole
+  sample arrays ("compute_calls.vectorized") and with the number of rows for
+  per-sample/per-scenario loops ("compute_calls.scalar")
+- gauges, e.g. the shape and memory size of the Monte Carlo sample matrix
+- per-outcome analysis time (artifact generation, measured in the worker)
+
+The pipeline writes the report to _analysis/pipeline-profile.json and prints
+the slowest stages and outcomes. `run_profiled()` additionally wraps a whole
+run in cProfile (or pyinstrument, if installed) for function-level detail.
+
+Counters are per process: calls made inside forked worker processes are not
+included. This module only uses the standard library.
+
+Usage:
+    from dih_models.pipeline_profile import PROFILER
+
+    with PROFILER.stage("variables"):
+        ...
+    PROFILER.gauge("parameters", len(parameters))
+    PROFILER.write(project_root / "_analysis" / PROFILE_FILE)
+    for line in PROFILER.summary():
+        print(line)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+# Bump when the report layout changes
+PROFILE_SCHEMA_VERSION = 1
+
+PROFILE_FILE = "pipeline-profile.json"
+
+# Values accepted by --profile=MODE
+PROFILE_MODES = ("cprofile", "pyinstrument")
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    return f"{seconds:.2f}s" if seconds < 10 else f"{seconds:.1f}s"
+
+
+class PipelineProfiler:
+    """Stage timers, counters, gauges and per-outcome times for one run."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far and restart the run clock."""
+        self.started = time.perf_counter()
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, Any] = {}
+        self.outcomes: Dict[str, float] = {}
+        self._open: Dict[str, Tuple[float, float, Dict[str, int]]] = {}
+
+    def start(self, name: str) -> None:
+        """Start timing stage `name` (use `stop` or the `stage` context manager)."""
+        self._open[name] = (time.perf_counter(), time.process_time(), dict(self.counters))
+
+    def stop(self, name: str) -> None:
+        """Stop timing stage `name` and any of its sub-stages still open."""
+        for open_name in [n for n in self._open if n == name or n.startswith(name + ".")]:
+            wall_start, cpu_start, counters_start = self._open.pop(open_name)
+            entry = self.stages.setdefault(open_name, {"seconds": 0.0, "cpu_seconds": 0.0, "counters": {}})
+            entry["seconds"] += time.perf_counter() - wall_start
+            entry["cpu_seconds"] += time.process_time() - cpu_start
+            for counter, value in self.counters.items():
+                delta = value - counters_start.get(counter, 0)
+                if delta:
+                    entry["counters"][counter] = entry["counters"].get(counter, 0) + delta
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage `name`."""
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop(name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name: str, value: Any) -> None:
+        self.gauges[name] = value
+
+    def add_outcome(self, name: str, seconds: float) -> None:
+        self.outcomes[name] = self.outcomes.get(name, 0.0) + seconds
+
+    def report(self) -> Dict[str, Any]:
+        """The run's measurements as a JSON-serializable dict."""
+        return {
+            "schema": PROFILE_SCHEMA_VERSION,
+            "generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "argv": sys.argv[1:],
+            "total_seconds": round(time.perf_counter() - self.started, 4),
+            "stages": {
+                name: {
+                    "seconds": round(entry["seconds"], 4),
+                    "cpu_seconds": round(entry["cpu_seconds"], 4),
+                    "counters": dict(sorted(entry["counters"].items())),
+                }
+                for name, entry in self.stages.items()
+            },
+            "counters": dict(sorted(self.counters.items())),
+            "gauges": dict(sorted(self.gauges.items())),
+            "outcomes": {
+                name: round(seconds, 4)
+                for name, seconds in sorted(self.outcomes.items(), key=lambda kv: kv[1], reverse=True)
+            },
+        }
+
+    def write(self, path: Path) -> Path:
+        """Write `report()` to `path` as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        return path
+
+    def summary(self, top: int = 8) -> List[str]:
+        """Human-readable lines: slowest stages and outcomes, call counts, sample memory."""
+        lines = [f"[*] Pipeline profile ({_format_seconds(time.perf_counter() - self.started)} total):"]
+        if self.stages:
+            lines.append("    Slowest stages:")
+            slowest = sorted(self.stages.items(), key=lambda kv: kv[1]["seconds"], reverse=True)
+            for name, entry in slowest[:top]:
+                lines.append(f"      {_format_seconds(entry['seconds']):>8}  {name}")
+        if self.outcomes:
+            lines.append(f"    Slowest outcomes ({len(self.outcomes)} regenerated):")
+            slowest = sorted(self.outcomes.items(), key=lambda kv: kv[1], reverse=True)
+            for name, seconds in slowest[:top]:
+                lines.append(f"      {_format_seconds(seconds):>8}  {name}")
+        vectorized = self.counters.get("compute_calls.vectorized", 0)
+        scalar = self.counters.get("compute_calls.scalar", 0)
+        if vectorized or scalar:
+            lines.append(f"    Compute lambda calls: {vectorized:,} vectorized, {scalar:,} scalar")
+        matrix = self.gauges.get("sample_matrix")
+        if matrix:
+            lines.append(
+                f"    Sample matrix: {matrix['rows']:,} rows x {matrix['columns']:,} columns "
+                f"({matrix['bytes'] / 1e6:.1f} MB)"
+            )
+        return lines
+
+
+PROFILER = PipelineProfiler()
+
+
+def count_calls(name: str, n: int = 1) -> None:
+    """Add `n` to counter `name` of the module-level profiler."""
+    PROFILER.count(name, n)
+
+
+def run_profiled(fn: Callable[[], Any], mode: str, output_base: Path) -> Any:
+    """Run `fn()` under cProfile or pyinstrument and dump the result.
+
+    cProfile writes `<output_base>.prof` (open with snakeviz or pstats) and
+    prints the top functions by cumulative time; pyinstrument writes
+    `<output_base>.html` and prints its call tree. Falls back to cProfile if
+    pyinstrument is not installed. The dump is written even if `fn` exits
+    early (sys.exit) or raises.
+    """
+    output_base = Path(output_base)
+    output_base.parent.mkdir(parents=True, exist_ok=True)
+    if mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler  # type: ignore
+        except ImportError:
+            print("[WARN] pyinstrument is not installed (pip install pyinstrument); using cProfile")
+            mode = "cprofile"
+        else:
+            profiler = Profiler()
+            profiler.start()
+            try:
+                return fn()
+            finally:
+                profiler.stop()
+                html_path = output_base.with_suffix(".html")
+                html_path.write_text(profiler.output_html(), encoding="utf-8")
+                print(profiler.output_text(unicode=False, color=False))
+                print(f"[OK] Wrote pyinstrument profile {html_path}")
+
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return fn()
+    finally:
+        profiler.disable()
+        prof_path = output_base.with_suffix(".prof")
+        profiler.dump_stats(str(prof_path))
+        pstats.Stats(profiler, stream=sys.stdout).sort_stats("cumulative").print_stats(25)
+        print(f"[OK] Wrote cProfile dump {prof_path}")
@@ -0,0 +1,287 @@
+"""
+Pipeline Stage Graph
+====================
+
+Declares the stages of the generate-everything pipeline, the files each one
+reads and writes, and which stages it builds on, so that a run can be
+limited to the stages whose inputs actually changed.
+
+Each stage's key is a hash of:
+- the content of its source files (generator modules, parameters.py,
+  references.qmd, ...), excluding files that another stage generates
+- the keys of its upstream stages (so editing parameters.py re-keys every
+  stage downstream of "parameters")
+- the run settings (command-line flags that change generated content)
+
+A stage is stale when its key differs from the one recorded after its last
+successful run, or when one of its outputs (e.g. _variables.yml) was edited
+or deleted since. File hashes are cached with their size and mtime in
+_analysis/.pipeline-stages.json, so checking an unchanged tree only stats
+the files and takes a few milliseconds. This module only uses the standard
+library so the pre-render hook can import it without loading the models.
+
+Usage:
+    from dih_models.pipeline_stages import StagePlan
+
+    plan = StagePlan(project_root, settings=stage_settings(sys.argv[1:]))
+    for stage in plan.stale():
+        ...  # regenerate, then:
+        plan.complete(stage)
+    plan.save()
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Bump when the manifest layout or keying scheme changes
+STAGE_SCHEMA_VERSION = 1
+
+MANIFEST_FILE = ".pipeline-stages.json"
+
+PIPELINE_SCRIPT = "scripts/generate-everything-parameters-variables-calculations-references.py"
+
+# Flags that do not change generated content (worker counts, cache control,
+# profiling, stage selection itself)
+_NEUTRAL_FLAGS = ("--jobs", "--no-cache", "--profile", "--stages", "--if-changed")
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One pipeline stage: what it reads, what it writes, what it builds on.
+
+    `sources` are paths or glob patterns relative to the project root.
+    `loads_inputs` marks stages that need references.qmd and parameters.py
+    parsed before they run.
+    """
+
+    name: str
+    sources: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    after: Tuple[str, ...] = ()
+    loads_inputs: bool = True
+
+
+# In execution order; every stage also depends on the pipeline script itself
+STAGES: Tuple[Stage, ...] = (
+    Stage(
+        "references",
+        sources=(
+            "knowledge/references.qmd",
+            "scripts/generate_references_json.py",
+            "dih_models/reference_parser.py",
+            "dih_models/reference_ids_generator.py",
+        ),
+        outputs=("knowledge/references.json", "dih_models/reference_ids.py"),
+    ),
+    Stage(
+        "parameters",
+        sources=(
+            "dih_models/parameters.py",
+            "dih_models/compute_compiler.py",
+            "dih_models/compute_context.py",
+            "dih_models/formatting.py",
+            "dih_models/npv_kernels.py",
+            "dih_models/params_fast.py",
+            "dih_models/validation.py",
+        ),
+        outputs=("_analysis/parameters-snapshot.marshal",),
+        after=("references",),
+    ),
+    Stage(
+        "variables",
+        sources=(
+            "dih_models/variables_yml_generator.py",
+            "dih_models/latex_generation.py",
+            "dih_models/compute_compiler.py",
+            "dih_models/quarto_formatting.py",
+        ),
+        outputs=("_variables.yml",),
+        after=("parameters",),
+    ),
+    Stage(
+        "bibtex",
+        sources=("dih_models/bibtex_generator.py",),
+        outputs=("references.bib",),
+        after=("references", "parameters"),
+    ),
+    Stage(
+        "typescript",
+        sources=("dih_models/typescript_generator.py", "_analysis/economist-survey.json"),
+        outputs=("dih_models/parameters-calculations-citations.ts", "dih_models/economist-survey.ts"),
+        after=("references", "parameters"),
+    ),
+    Stage(
+        "uncertainty",
+        sources=(
+            "dih_models/build_cache.py",
+            "dih_models/chart_generators.py",
+            "dih_models/chart_renderer.py",
+            "dih_models/compute_compiler.py",
+            "dih_models/elasticities.py",
+            "dih_models/latex_generation.py",
+            "dih_models/parameter_graph.py",
+            "dih_models/sample_store.py",
+            "dih_models/scenario_sweep.py",
+            "dih_models/uncertainty.py",
+            "dih_models/plotting/chart_style.py",
+        ),
+        outputs=(
+            "_analysis/samples.json",
+            "_analysis/samples.npy",
+            "_analysis/outcomes.json",
+            "_analysis/elasticities.json",
+            "_analysis/scenario-sweep.npz",
+        ),
+        after=("parameters",),
+    ),
+    Stage(
+        "appendix",
+        sources=(
+            "dih_models/parameters_and_calculations_qmd_generator.py",
+            "dih_models/latex_generation.py",
+            "dih_models/compute_compiler.py",
+            "dih_models/quarto_formatting.py",
+        ),
+        outputs=("knowledge/appendix/parameters-and-calculations.qmd",),
+        # Links figures only if the uncertainty stage produced them
+        after=("references", "parameters", "uncertainty"),
+    ),
+    Stage(
+        "outline",
+        sources=("scripts/generate-outline.py", "_quarto-book.yml", "*.qmd", "knowledge/**/*.qmd"),
+        outputs=("OUTLINE-GENERATED.MD",),
+        loads_inputs=False,
+    ),
+)
+
+STAGE_NAMES: Tuple[str, ...] = tuple(stage.name for stage in STAGES)
+
+_STAGES_BY_NAME: Dict[str, Stage] = {stage.name: stage for stage in STAGES}
+
+
+def get_stage(name: str) -> Stage:
+    """Look up a stage by name (KeyError for unknown names)."""
+    return _STAGES_BY_NAME[name]
+
+
+def stage_settings(argv: Sequence[str]) -> str:
+    """Normalize pipeline flags that affect generated content into one string."""
+    return " ".join(sorted(arg for arg in argv if arg.split("=")[0] not in _NEUTRAL_FLAGS))
+
+
+def _read_stamp(path: Path, previous: Optional[List[Any]] = None) -> Optional[List[Any]]:
+    """[size, mtime_ns, sha256] of a file, or None if it is missing.
+
+    The hash in `previous` is reused when size and mtime still match.
+    """
+    try:
+        stat = path.stat()
+        if previous and previous[0] == stat.st_size and previous[1] == stat.st_mtime_ns:
+            return previous
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns, digest]
+
+
+class StagePlan:
+    """Stage keys for the current tree, compared against the last run's manifest.
+
+    Keys are computed once, when first needed, from the files as they are at
+    that point (before any stage rewrites its outputs).
+    """
+
+    def __init__(self, project_root: Path, settings: str = "", manifest_path: Optional[Path] = None) -> None:
+        self.project_root = Path(project_root)
+        self.manifest_path = Path(manifest_path) if manifest_path else self.project_root / "_analysis" / MANIFEST_FILE
+        self.settings = settings
+        self._files: Dict[str, List[Any]] = {}
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("schema") == STAGE_SCHEMA_VERSION:
+                    self._files = data.get("files", {})
+                    self._stages = data.get("stages", {})
+            except (OSError, ValueError):
+                pass
+        self._stamps: Dict[str, Optional[List[Any]]] = {}
+        self._keys: Dict[str, str] = {}
+        self._generated = {output for stage in STAGES for output in stage.outputs}
+
+    def _stamp(self, rel: str) -> Optional[List[Any]]:
+        if rel not in self._stamps:
+            self._stamps[rel] = _read_stamp(self.project_root / rel, self._files.get(rel))
+        return self._stamps[rel]
+
+    def _digest(self, rel: str) -> Optional[str]:
+        stamp = self._stamp(rel)
+        return stamp[2] if stamp else None
+
+    def _source_files(self, stage: Stage) -> List[str]:
+        """Files matched by the stage's sources, minus other stages' outputs."""
+        files = set()
+        for pattern in (PIPELINE_SCRIPT,) + stage.sources:
+            if any(ch in pattern for ch in "*?["):
+                matches = glob.glob(pattern, root_dir=self.project_root, recursive=True)
+                files.update(match.replace(os.sep, "/") for match in matches)
+            else:
+                files.add(pattern)
+        return sorted(files - self._generated)
+
+    def key(self, name: str) -> str:
+        """Hash of the stage's sources, upstream keys and the run settings."""
+        if name not in self._keys:
+            stage = get_stage(name)
+            hasher = hashlib.sha256(f"schema={STAGE_SCHEMA_VERSION};stage={name};{self.settings}".encode())
+            for upstream in stage.after:
+                hasher.update(f"\0{upstream}={self.key(upstream)}".encode())
+            for rel in self._source_files(stage):
+                hasher.update(f"\0{rel}={self._digest(rel)}".encode())
+            self._keys[name] = hasher.hexdigest()
+        return self._keys[name]
+
+    def is_stale(self, name: str) -> bool:
+        """True if the stage's inputs or outputs changed since its last successful run."""
+        record = self._stages.get(name)
+        if not record or record.get("key") != self.key(name):
+            return True
+        return any(self._digest(rel) != digest for rel, digest in record.get("outputs", {}).items())
+
+    def stale(self) -> List[str]:
+        """Stages that need to run, in execution order."""
+        return [name for name in STAGE_NAMES if self.is_stale(name)]
+
+    def complete(self, name: str) -> None:
+        """Record that the stage ran successfully against the keyed inputs."""
+        key = self.key(name)
+        outputs = {}
+        for rel in get_stage(name).outputs:
+            self._stamps.pop(rel, None)  # rewritten by the stage
+            outputs[rel] = self._digest(rel)
+        self._stages[name] = {"key": key, "outputs": outputs}
+
+    def save(self) -> None:
+        """Persist stage records and the file stamps seen this run."""
+        files = {rel: stamp for rel, stamp in self._stamps.items() if stamp is not None}
+        data = {
+            "schema": STAGE_SCHEMA_VERSION,
+            "stages": {name: self._stages[name] for name in STAGE_NAMES if name in self._stages},
+            "files": dict(sorted(files.items())),
+        }
+        text = json.dumps(data, indent=2)
+        try:
+            if self.manifest_path.read_text(encoding="utf-8") == text:
+                return
+        except OSError:
+            pass
+        os.makedirs(self.manifest_path.parent, exist_ok=True)
+        self.manifest_path.write_text(text, encoding="utf-8")
@@ -15,8 +15,11 @@ Usage:
     bars[1].set_hatch(PATTERN_DIAGONAL)  # Apply pattern to differentiate
 """
 
+import hashlib
 import logging
+import struct
 import warnings
+import zlib
 from functools import lru_cache
 from pathlib import Path
 
@@ -548,7 +551,7 @@ def get_chart_metadata(title=None, description=None):
     return metadata
 
 
-def add_png_metadata(filepath, title=None, description=None):
+def add_png_metadata(filepath, title=None, description=None, fingerprint=None):
     """
     Add attribution metadata to a PNG file after it's been saved.
 
@@ -559,6 +562,8 @@ def add_png_metadata(filepath, title=None, description=None):
         filepath: Path to the PNG file
         title: Chart title (optional, recommended)
         description: Brief description (optional)
+        fingerprint: Optional chart_fingerprint() to stamp into the file;
+            if the file already carries it, the file is left untouched
 
     Example:
         plt.savefig('chart.png', dpi=200, bbox_inches=None, facecolor=COLOR_WHITE)
@@ -566,6 +571,12 @@ def add_png_metadata(filepath, title=None, description=None):
                         title="Military vs Medical Research",
                         description="Comparison of spending")
     """
+    if fingerprint is not None and png_is_current(filepath, fingerprint):
+        return
+
+    # PIL drops text chunks it was not given, so carry an existing stamp over
+    fingerprint = fingerprint or read_png_fingerprint(filepath)
+
     try:
         from PIL import Image, PngImagePlugin
 
@@ -593,6 +604,138 @@ def add_png_metadata(filepath, title=None, description=None):
         # PIL not available, skip metadata
         pass
 
+    if fingerprint:
+        stamp_png_fingerprint(filepath, fingerprint)
+
+
+# ---
+# Skip-unchanged rendering: PNGs carry a hash of their data and the style
+# ---
+
+# PNG tEXt keyword holding the chart fingerprint
+CHART_FINGERPRINT_KEY = "Chart-Fingerprint"
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _style_version():
+    """Hash of this module's source, so restyling invalidates every stamped PNG"""
+    try:
+        return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+    except OSError:
+        return "unknown"
+
+
+CHART_STYLE_VERSION = _style_version()
+
+
+def _fingerprint_bytes(value):
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if hasattr(value, "tobytes") and hasattr(value, "dtype"):  # numpy arrays
+        return f"{value.dtype}{getattr(value, 'shape', '')}".encode() + value.tobytes()
+    if isinstance(value, (list, tuple)):
+        return b"[" + b",".join(_fingerprint_bytes(v) for v in value) + b"]"
+    if isinstance(value, dict):
+        return b"{" + b",".join(_fingerprint_bytes([k, v]) for k, v in sorted(value.items(), key=repr)) + b"}"
+    return repr(value).encode("utf-8")
+
+
+def chart_fingerprint(*data):
+    """
+    Hash of the data a chart plots plus CHART_STYLE_VERSION.
+
+    Pass everything that determines the picture (arrays, labels, options).
+
+    Example:
+        fingerprint = chart_fingerprint(years, spending, "Military Spending")
+        if png_is_current(output_path, fingerprint):
+            show_png(output_path)
+        else:
+            ...  # draw
+            save_figure_with_margins(fig, output_path, fingerprint=fingerprint)
+    """
+    hasher = hashlib.sha256(CHART_STYLE_VERSION.encode("utf-8"))
+    for item in data:
+        chunk = _fingerprint_bytes(item)
+        hasher.update(struct.pack(">Q", len(chunk)))
+        hasher.update(chunk)
+    return hasher.hexdigest()[:32]
+
+
+def _png_chunks(data):
+    """Yield (type, start, end) for each chunk of PNG bytes (end includes the CRC)"""
+    pos = len(_PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, chunk_type = struct.unpack(">I4s", data[pos:pos + 8])
+        end = pos + 12 + length
+        yield chunk_type, pos, end
+        pos = end
+
+
+def read_png_fingerprint(filepath):
+    """Return the fingerprint stamped into a PNG, or None"""
+    key = CHART_FINGERPRINT_KEY.encode("latin-1") + b"\0"
+    try:
+        with open(filepath, "rb") as f:
+            if f.read(8) != _PNG_SIGNATURE:
+                return None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                length, chunk_type = struct.unpack(">I4s", header)
+                if chunk_type == b"IEND":
+                    return None
+                if chunk_type == b"tEXt" and length <= 1024:
+                    text = f.read(length)
+                    f.seek(4, 1)
+                    if text.startswith(key):
+                        return text[len(key):].decode("latin-1")
+                else:
+                    # Skip image data without reading it
+                    f.seek(length + 4, 1)
+    except OSError:
+        return None
+
+
+def png_is_current(filepath, fingerprint):
+    """True if `filepath` exists and was stamped with `fingerprint`"""
+    return read_png_fingerprint(filepath) == fingerprint
+
+
+def stamp_png_fingerprint(filepath, fingerprint):
+    """Write `fingerprint` into a PNG's text metadata (replacing any previous stamp)"""
+    path = Path(filepath)
+    data = path.read_bytes()
+    if not data.startswith(_PNG_SIGNATURE):
+        return
+    key = CHART_FINGERPRINT_KEY.encode("latin-1") + b"\0"
+    body = key + fingerprint.encode("latin-1")
+    chunk = struct.pack(">I", len(body)) + b"tEXt" + body + struct.pack(">I", zlib.crc32(b"tEXt" + body))
+
+    parts = [_PNG_SIGNATURE]
+    for chunk_type, start, end in _png_chunks(data):
+        if chunk_type == b"tEXt" and data[start + 8:start + 8 + len(key)] == key:
+            continue
+        if chunk_type == b"IEND":
+            parts.append(chunk)
+        parts.append(data[start:end])
+    path.write_bytes(b"".join(parts))
+
+
+def show_png(filepath):
+    """Display an existing PNG as the cell's figure output (no-op outside Jupyter)"""
+    try:
+        from IPython import get_ipython
+        from IPython.display import Image, display
+    except ImportError:
+        return
+    if get_ipython() is not None:
+        display(Image(filename=str(filepath)))
+
 
 def get_figure_output_path(filename):
     """
@@ -622,7 +765,7 @@ def get_figure_output_path(filename):
     return output_dir / filename
 
 
-def save_figure_with_margins(fig, filepath, dpi=200, pad_inches=0.3, facecolor=COLOR_WHITE):
+def save_figure_with_margins(fig, filepath, dpi=200, pad_inches=0.3, facecolor=COLOR_WHITE, fingerprint=None):
     """
     Save a figure with proper margins and padding to ensure watermark visibility.
 
@@ -635,12 +778,22 @@ def save_figure_with_margins(fig, filepath, dpi=200, pad_inches=0.3, facecolor=C
         dpi: Resolution (default: 200)
         pad_inches: Padding around figure in inches (default: 0.3)
         facecolor: Background color (default: COLOR_WHITE)
+        fingerprint: Optional chart_fingerprint(); stamped into the PNG, and
+            the save is skipped if the existing file already carries it
+
+    Returns:
+        bool: True if the file was written
 
     Example:
         output_path = get_figure_output_path('my-chart.png')
         save_figure_with_margins(fig, output_path, dpi=200)
     """
+    if fingerprint is not None and png_is_current(filepath, fingerprint):
+        return False
     fig.savefig(filepath, dpi=dpi, bbox_inches="tight", pad_inches=pad_inches, facecolor=facecolor)
+    if fingerprint is not None:
+        stamp_png_fingerprint(filepath, fingerprint)
+    return True
 
 
 # Convenience function for quick setup
@@ -0,0 +1,147 @@
+"""
+Monte Carlo Sample Store
+========================
+
+Binary, memory-mappable store for the propagated Monte Carlo samples.
+
+The generate-everything pipeline writes every parameter's samples once to
+`_analysis/samples.npy` (one row per parameter, float64) plus a name index
+`_analysis/samples-index.json`. Generated chart QMDs load their row with
+`load_sample_column()` instead of embedding thousands of literals, so the
+QMDs stay small and charts can use every sample.
+
+Each column carries a short content digest. Chart QMDs embed the digest of
+the column they were generated from, so (a) the QMD text, and therefore
+Quarto's freeze cache, changes whenever the samples change, and (b) rendering
+against a store from a different run fails loudly instead of silently
+plotting the wrong data.
+
+Usage:
+    from dih_models.sample_store import write_sample_store, load_sample_column
+
+    digests = write_sample_store(sims, project_root / "_analysis")
+    samples = load_sample_column("TREATY_ROI_LAG_ELIMINATION", digest=digests[...])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from dih_models.build_cache import write_bytes_if_changed, write_json_if_changed
+
+SAMPLES_FILE = "samples.npy"
+INDEX_FILE = "samples-index.json"
+
+# Bump when the file layout changes
+STORE_VERSION = 1
+
+# _analysis/ next to the dih_models package (the project root)
+DEFAULT_STORE_DIR = Path(__file__).resolve().parent.parent / "_analysis"
+
+# Stores opened in this process (charts rendered in one kernel share the memmap)
+_open_stores: Dict[Path, SampleStore] = {}
+
+
+def column_digest(values: Any) -> str:
+    """Short content hash of a sample column (float64 bytes)."""
+    data = np.ascontiguousarray(np.asarray(values, dtype=np.float64))
+    return hashlib.sha256(data.tobytes()).hexdigest()[:16]
+
+
+def write_sample_store(samples: Dict[str, Any], directory: Optional[Path] = None) -> Dict[str, str]:
+    """Write `samples` (name -> array-like) as a row-per-parameter .npy matrix.
+
+    Columns of different lengths (e.g. from adaptive sampling) are padded
+    with NaN; the index records each column's true length. Files are only
+    rewritten when their content changes.
+
+    Returns name -> column digest.
+    """
+    directory = Path(directory) if directory is not None else DEFAULT_STORE_DIR
+    names = list(samples)
+    columns = [np.asarray(samples[name], dtype=np.float64).ravel() for name in names]
+    width = max((len(c) for c in columns), default=0)
+    matrix = np.full((len(names), width), np.nan)
+    index: Dict[str, Dict[str, Any]] = {}
+    for row, (name, column) in enumerate(zip(names, columns)):
+        matrix[row, :len(column)] = column
+        index[name] = {"row": row, "length": len(column), "digest": column_digest(column)}
+
+    buffer = io.BytesIO()
+    np.save(buffer, matrix, allow_pickle=False)
+    write_bytes_if_changed(directory / SAMPLES_FILE, buffer.getvalue())
+    write_json_if_changed(directory / INDEX_FILE, {
+        "version": STORE_VERSION,
+        "shape": list(matrix.shape),
+        "dtype": "float64",
+        "columns": index,
+    })
+    _open_stores.pop(directory.resolve(), None)
+    return {name: entry["digest"] for name, entry in index.items()}
+
+
+class SampleStore:
+    """Read-only view of a sample store; rows are memory-mapped on demand."""
+
+    def __init__(self, directory: Optional[Path] = None, mmap: bool = True) -> None:
+        self.directory = Path(directory) if directory is not None else DEFAULT_STORE_DIR
+        index_path = self.directory / INDEX_FILE
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"No Monte Carlo sample store at {self.directory}; run "
+                "scripts/generate-everything-parameters-variables-calculations-references.py first"
+            ) from None
+        if index.get("version") != STORE_VERSION:
+            raise ValueError(f"Unsupported sample store version {index.get('version')} in {index_path}")
+        self._columns: Dict[str, Dict[str, Any]] = index["columns"]
+        self._matrix = np.load(self.directory / SAMPLES_FILE, mmap_mode="r" if mmap else None)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._columns)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def column(self, name: str, digest: Optional[str] = None) -> np.ndarray:
+        """Samples for `name` (a read-only view when memory-mapped).
+
+        Raises KeyError for unknown names and ValueError if `digest` is given
+        and does not match the stored column.
+        """
+        entry = self._columns.get(name)
+        if entry is None:
+            raise KeyError(f"No samples stored for {name} in {self.directory}")
+        if digest is not None and entry["digest"] != digest:
+            raise ValueError(
+                f"Samples for {name} in {self.directory} do not match this chart "
+                f"(digest {entry['digest']}, expected {digest}); re-run the generator"
+            )
+        return self._matrix[entry["row"], :entry["length"]]
+
+
+def open_sample_store(directory: Optional[Path] = None) -> SampleStore:
+    """Return a (process-wide cached) memory-mapped store for `directory`."""
+    directory = (Path(directory) if directory is not None else DEFAULT_STORE_DIR).resolve()
+    store = _open_stores.get(directory)
+    if store is None:
+        store = SampleStore(directory)
+        _open_stores[directory] = store
+    return store
+
+
+def load_sample_column(name: str, digest: Optional[str] = None, directory: Optional[Path] = None) -> np.ndarray:
+    """Memory-map the samples for parameter `name` from the store."""
+    return open_sample_store(directory).column(name, digest)
@@ -19,6 +19,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from dih_models.formatting import format_parameter_value
+from dih_models.parameter_graph import ParameterGraph, build_parameter_graph
 from dih_models.reference_parser import parse_references_qmd_detailed
 
 if sys.platform == 'win32':
@@ -535,41 +536,44 @@ class QuestionGenerator:
 
 def _calculate_parameter_impact(
     param_name: str,
-    parameters: Dict[str, Dict[str, Any]]
+    parameters: Dict[str, Dict[str, Any]],
+    graph: ParameterGraph = None
 ) -> List[str]:
     """
     Calculate which outcome parameters this input affects.
 
-    Uses dependency graph analysis to find all calculated parameters that
-    depend on this parameter as a fundamental input.
+    Uses the dependency graph's reverse index to find all calculated
+    parameters that depend on this parameter as a fundamental input.
 
     Args:
         param_name: Parameter to analyze
         parameters: All parameters dict
+        graph: Optional prebuilt ParameterGraph (reuse across calls)
 
     Returns:
         List of outcome parameter names that are affected by this parameter
     """
-    try:
-        from dih_models.uncertainty import get_fundamental_inputs
-    except ImportError:
+    graph = build_parameter_graph(parameters, graph)
+
+    # Only uncertain leaves can be fundamental inputs of anything
+    if param_name not in graph.fundamental_inputs(param_name):
         return []
 
+    candidates = graph.descendants(param_name) | {param_name}
+
     # Find which outcome parameters use this param as a fundamental input
     affected_outcomes = []
 
     for outcome_name, outcome_data in parameters.items():
+        if outcome_name not in candidates:
+            continue
         outcome_val = outcome_data.get("value")
 
         # Check if it's a calculated parameter (potential outcome)
         if not (hasattr(outcome_val, "compute") and hasattr(outcome_val, "inputs")):
             continue
 
-        # Check if this param is a fundamental input to the outcome
-        fundamental_inputs = get_fundamental_inputs(parameters, outcome_name)
-
-        if param_name in fundamental_inputs:
-            affected_outcomes.append(outcome_name)
+        affected_outcomes.append(outcome_name)
 
     # Limit to top 5 most important outcomes
     return affected_outcomes[:5]
@@ -577,7 +581,8 @@ def _calculate_parameter_impact(
 
 def select_validation_parameters(
     parameters: Dict[str, Dict[str, Any]],
-    usage_data: Dict[str, Any] = None
+    usage_data: Dict[str, Any] = None,
+    graph: ParameterGraph = None
 ) -> Dict[str, Dict[str, Any]]:
     """
     Select only calculated parameters (in economics.qmd) and their fundamental inputs.
@@ -588,19 +593,12 @@ def select_validation_parameters(
     Args:
         parameters: All parameters from parameters.py
         usage_data: Document usage data (to filter calculated params)
+        graph: Optional prebuilt ParameterGraph for `parameters`
 
     Returns:
         Filtered dict with only calculated params and their inputs
     """
-    try:
-        from dih_models.uncertainty import get_fundamental_inputs
-    except ImportError:
-        # Fallback: just use direct inputs if uncertainty module not available
-        def get_fundamental_inputs(params, param_name):
-            value = params[param_name].get("value")
-            if hasattr(value, "inputs") and value.inputs:
-                return value.inputs
-            return []
+    graph = build_parameter_graph(parameters, graph)
 
     selected = {}
 
@@ -623,7 +621,7 @@ def select_validation_parameters(
     inputs_needed = set()
     for calc_param in calculated_params:
         try:
-            fundamental_inputs = get_fundamental_inputs(parameters, calc_param)
+            fundamental_inputs = graph.fundamental_inputs(calc_param)
             inputs_needed.update(fundamental_inputs)
         except Exception:
             # If we can't get fundamental inputs, at least include direct inputs
@@ -645,7 +643,8 @@ def generate_survey(
     usage_data: Dict[str, Any] = None,
     top_n: int = 50,
     calculate_sensitivity: bool = True,
-    focused: bool = True
+    focused: bool = True,
+    elasticity_data: Dict[str, Any] = None
 ) -> Dict[str, Any]:
     """
     Generate complete economist validation survey from parameters.
@@ -657,13 +656,18 @@ def generate_survey(
         top_n: Number of parameters to include (by importance)
         calculate_sensitivity: If True, calculate sensitivity on-demand (default)
         focused: If True, only include calculated params and their inputs (default True)
+        elasticity_data: Optional _analysis/elasticities.json contents (ranking fallback
+            when sensitivity_data has no variance shares)
 
     Returns:
         Survey structure with all questions, organized by module
     """
+    # Build the dependency graph once; impact lookups below reuse its indexes
+    graph = ParameterGraph(parameters)
+
     # Filter to focused set if requested (calculated params + their inputs only)
     if focused:
-        parameters_to_rank = select_validation_parameters(parameters, usage_data)
+        parameters_to_rank = select_validation_parameters(parameters, usage_data, graph)
         print(f"      Focused mode: {len(parameters_to_rank)} parameters (calculated + inputs)")
     else:
         parameters_to_rank = parameters
@@ -679,7 +683,7 @@ def generate_survey(
 
     # Rank parameters by importance with dependency-aware ordering
     # (inputs come before outputs that use them)
-    ranked_params = rank_parameters_with_dependencies(parameters_to_rank, sensitivity_data, usage_data)
+    ranked_params = rank_parameters_with_dependencies(parameters_to_rank, sensitivity_data, usage_data, elasticity_data)
 
     # Select top N for survey
     selected_params = ranked_params[:top_n]
@@ -783,7 +787,7 @@ def generate_survey(
         affected_outcomes = []
         if calculate_sensitivity:
             try:
-                affected_outcomes = _calculate_parameter_impact(param_name, parameters)
+                affected_outcomes = _calculate_parameter_impact(param_name, parameters, graph)
             except Exception:
                 pass  # Silently fall back to empty list
         elif sensitivity_data and param_name in sensitivity_data:
@@ -876,14 +880,21 @@ def generate_survey(
 def rank_parameters(
     parameters: Dict[str, Dict[str, Any]],
     sensitivity_data: Dict[str, Any] = None,
-    usage_data: Dict[str, Any] = None
+    usage_data: Dict[str, Any] = None,
+    elasticity_data: Dict[str, Any] = None
 ) -> List[Tuple[str, float, Dict]]:
     """
     Rank parameters by composite importance score.
 
+    The sensitivity score comes from the variance share in `sensitivity_data`
+    when available, else from `elasticity_data` (_analysis/elasticities.json):
+    a parameter's largest |elasticity| over all outcomes, 20 points per unit
+    (an input that moves some outcome 1:1 in % terms scores 20).
+
     Returns: List of (param_name, total_score, breakdown) tuples, sorted by score
     """
     scores = []
+    leaf_importance = (elasticity_data or {}).get("leaf_importance", {})
 
     for param_name, param_data in parameters.items():
         value = param_data.get("value")
@@ -912,6 +923,8 @@ def rank_parameters(
             # Assuming sensitivity has "total_variance_explained" or similar
             variance_pct = param_sens.get("total_variance_pct", 0)
             breakdown["sensitivity"] = min(40, variance_pct * 4)  # Scale to 0-40
+        elif param_name in leaf_importance:
+            breakdown["sensitivity"] = min(40, leaf_importance[param_name] * 20)
 
         # 2. Usage score (0-30 points)
         if usage_data and param_name in usage_data:
@@ -954,7 +967,8 @@ def rank_parameters(
 def rank_parameters_with_dependencies(
     parameters: Dict[str, Dict[str, Any]],
     sensitivity_data: Dict[str, Any] = None,
-    usage_data: Dict[str, Any] = None
+    usage_data: Dict[str, Any] = None,
+    elasticity_data: Dict[str, Any] = None
 ) -> List[Tuple[str, float, Dict]]:
     """
     Rank parameters by importance, but respect dependency order.
@@ -965,7 +979,7 @@ def rank_parameters_with_dependencies(
     Returns: List of (param_name, total_score, breakdown) tuples in dependency-aware order
     """
     # Step 1: Get importance scores
-    ranked = rank_parameters(parameters, sensitivity_data, usage_data)
+    ranked = rank_parameters(parameters, sensitivity_data, usage_data, elasticity_data)
     score_map = {name: (score, breakdown) for name, score, breakdown in ranked}
 
     # Step 2: Build dependency graph (who depends on whom)
@@ -12,11 +12,31 @@ Design goals:
 - Deterministic seeds for reproducibility when requested.
 
 Exports:
-- sample_parameter(param, n, seed=None): numpy array of samples
-- simulate(parameters: dict, n: int = 10000, seed: int | None = None):
-    Returns dict of sampled arrays for each parameter name.
+- sample_parameter(param, n, seed=None, u=None): numpy array of samples
+- simulate(parameters: dict, n: int = 10000, seed: int | None = None, sampler="random"):
+    Returns dict of sampled arrays for each parameter name. `sampler` selects
+    pseudo-random draws or a joint Latin Hypercube / scrambled Sobol / Halton
+    design across all uncertain parameters (see SAMPLERS).
+- iman_conover(samples: dict, correlations: dict, seed=None):
+    Reorders sampled columns to target rank correlations without changing
+    their marginals; simulate(..., correlations=...) applies it.
+- simulate_with_propagation(parameters: dict, n: int = 10000, seed=None, vectorize=True, sampler="random"):
+    Like simulate(), but recomputes calculated parameters from sampled inputs,
+    passing whole numpy arrays through compute lambdas where possible.
+- simulate_adaptive(parameters: dict, tolerance=0.01, batch_size=200, max_n=10000, ...):
+    Propagated sampling over a growing prefix of rows that stops each outcome
+    once its mean, p5 and p95 are within `tolerance`; returns (samples, precision).
 - one_at_a_time_sensitivity(parameters: dict, target_name: str, n: int = 1000):
     Varies each input parameter ±1 std and measures effect on target.
+- tornado_deltas(parameters, outcome) / TornadoEngine(parameters):
+    Low/high tornado deltas; the engine caches baseline node values and only
+    re-evaluates descendants of the perturbed input.
+- tornado_deltas_batched(parameters, outcomes):
+    All outcomes' tornado deltas from one vectorized evaluation of a
+    (2*k)-row low/high scenario matrix (see evaluate_graph_batch).
+- sobol_indices(parameters, outcomes, n=1024, seed=None):
+    First- and total-order Sobol indices (Saltelli sampling), evaluating
+    only the descendants of each resampled input.
 
 Note: We avoid heavy external deps. If numpy is unavailable, we fallback
 to Python's random and basic math with reduced performance.
@@ -26,13 +46,22 @@ from __future__ import annotations
 
 import math
 import random
-from typing import TYPE_CHECKING, Dict, Any, Tuple, Sequence, cast, Callable, List, Optional, Union
+import warnings
+from typing import TYPE_CHECKING, Dict, Any, Tuple, Sequence, Set, cast, Callable, List, Optional, Union
 
 try:
     import numpy as np  # type: ignore
 except Exception:  # pragma: no cover
     np = None  # Fallback handled below
 
+try:
+    # Inverse CDFs and low-discrepancy designs for the non-random samplers
+    from scipy import special as _special  # type: ignore
+    from scipy.stats import qmc as _qmc  # type: ignore
+except Exception:  # pragma: no cover
+    _special = None
+    _qmc = None
+
 # Import types for type checking only (avoids runtime issues)
 if TYPE_CHECKING:
     from .parameters import Parameter as ParameterType, DistributionType as DistType
@@ -40,6 +69,10 @@ else:
     ParameterType = Any
     DistType = Any
 
+from .compute_compiler import checked_kernel
+from .parameter_graph import ParameterGraph, build_parameter_graph, has_uncertainty
+from .pipeline_profile import count_calls
+
 try:
     # Import Parameter and DistributionType for runtime use
     from .parameters import Parameter, DistributionType
@@ -77,7 +110,12 @@ def _get_bounds(param: Any) -> Tuple[Optional[float], Optional[float]]:
     return lo, hi
 
 
-def sample_parameter(param: Any, n: int = 10000, seed: Optional[int] = None) -> Union[List[float], Any]:
+def sample_parameter(
+    param: Any,
+    n: int = 10000,
+    seed: Optional[int] = None,
+    u: Optional[Any] = None,
+) -> Union[List[float], Any]:
     """Sample from a Parameter's uncertainty distribution.
 
     Strategy:
@@ -86,6 +124,10 @@ def sample_parameter(param: Any, n: int = 10000, seed: Optional[int] = None) ->
     - Gamma: shape/scale from mean and std_error
     - If no distribution metadata: return constant array of param value
     - Respect validation_min/max and clip
+
+    If `u` (n uniform values in (0, 1), e.g. one column of a Latin Hypercube
+    or Sobol design) is given, samples are its inverse-CDF transform instead
+    of pseudo-random draws; this requires numpy and scipy.
     """
     mean = float(param)
     dist = getattr(param, "distribution", None)
@@ -93,6 +135,12 @@ def sample_parameter(param: Any, n: int = 10000, seed: Optional[int] = None) ->
     ci = getattr(param, "confidence_interval", None)
     bounds = _get_bounds(param)
 
+    if u is not None:
+        if np is None or _special is None:
+            raise RuntimeError("Inverse-CDF sampling requires numpy and scipy")
+        u = np.clip(np.asarray(u, dtype=float), _U_EPS, 1 - _U_EPS)
+        n = len(u)
+
     rng = _rng(seed)
 
     def infer_std_from_ci(ci_tuple):
@@ -113,6 +161,10 @@ def sample_parameter(param: Any, n: int = 10000, seed: Optional[int] = None) ->
 
     # Sampling per distribution
     if dist == getattr(DistributionType, "NORMAL", "NORMAL"):
+        if u is not None:
+            samples = mean + std * _special.ndtri(u)
+            return np.clip(samples, bounds[0] if bounds[0] is not None else -np.inf,
+                           bounds[1] if bounds[1] is not None else np.inf)
         if np is not None and rng is not None:
             samples = rng.normal(loc=mean, scale=std, size=n)
             return np.clip(samples, bounds[0] if bounds[0] is not None else -np.inf,
@@ -132,6 +184,10 @@ def sample_parameter(param: Any, n: int = 10000, seed: Optional[int] = None) ->
         sigma2 = math.log(1 + variance / (mean ** 2))
         sigma = math.sqrt(sigma2)
         mu = math.log(mean) - 0.5 * sigma2
+        if u is not None:
+            samples = np.exp(mu + sigma * _special.ndtri(u))
+            return np.clip(samples, bounds[0] if bounds[0] is not None else -np.inf,
+                           bounds[1] if bounds[1] is not None else np.inf)
         if np is not None and rng is not None:
             samples = rng.lognormal(mean=mu, sigma=sigma, size=n)
             return np.clip(samples, bounds[0] if bounds[0] is not None else -np.inf,
@@ -148,6 +204,10 @@ def sample_parameter(param: Any, n: int = 10000, seed: Optional[int] = None) ->
         var = std ** 2
         theta = var / mean
         k = mean / theta
+        if u is not None:
+            samples = theta * _special.gammaincinv(k, u)
+            return np.clip(samples, bounds[0] if bounds[0] is not None else -np.inf,
+                           bounds[1] if bounds[1] is not None else np.inf)
         if np is not None and rng is not None:
             samples = rng.gamma(shape=k, scale=theta, size=n)
             return np.clip(samples, bounds[0] if bounds[0] is not None else -np.inf,
@@ -192,6 +252,10 @@ def sample_parameter(param: Any, n: int = 10000, seed: Optional[int] = None) ->
         alpha = max(0.1, alpha)
         beta_param = max(0.1, beta_param)
 
+        if u is not None:
+            samples = _special.betaincinv(alpha, beta_param, u)
+            return np.clip(samples, bounds[0] if bounds[0] is not None else 0,
+                           bounds[1] if bounds[1] is not None else 1)
         if np is not None and rng is not None:
             samples = rng.beta(alpha, beta_param, size=n)
             return np.clip(samples, bounds[0] if bounds[0] is not None else 0,
@@ -206,13 +270,145 @@ def sample_parameter(param: Any, n: int = 10000, seed: Optional[int] = None) ->
     return [_bounded(mean, bounds) for _ in range(n)]
 
 
-def simulate(parameters: Dict[str, Dict[str, Any]], n: int = 10000, seed: int | None = None):
+# Keeps inverse CDFs finite at the edges of a design
+_U_EPS = 1e-12
+
+# Sampling strategies accepted by simulate()/simulate_with_propagation()
+SAMPLERS = ("random", "lhs", "sobol", "halton")
+
+
+def _uniform_design(sampler: str, n: int, d: int, seed: Optional[int] = None):
+    """(n, d) array of uniforms in (0, 1) from a joint space-filling design.
+
+    - lhs: Latin Hypercube (each column stratified into n equal bins)
+    - sobol: scrambled Sobol sequence (best balance when n is a power of 2)
+    - halton: scrambled Halton sequence
+    """
+    if np is None or _qmc is None:
+        raise RuntimeError(f"The '{sampler}' sampler requires numpy and scipy")
+    if sampler == "lhs":
+        engine = _qmc.LatinHypercube(d=d, seed=seed)
+    elif sampler == "sobol":
+        engine = _qmc.Sobol(d=d, scramble=True, seed=seed)
+        if n & (n - 1) == 0:
+            return engine.random_base2(int(math.log2(n)))
+    elif sampler == "halton":
+        engine = _qmc.Halton(d=d, scramble=True, seed=seed)
+    else:
+        raise ValueError(f"Unknown sampler: {sampler} (expected one of {', '.join(SAMPLERS)})")
+    with warnings.catch_warnings():
+        # Sobol warns when n is not a power of 2; the design is still valid
+        warnings.simplefilter("ignore")
+        return engine.random(n)
+
+
+def _nearest_correlation(matrix: Any, floor: float = 1e-10) -> Any:
+    """Clip a symmetric matrix's eigenvalues so it is a valid (PD) correlation matrix."""
+    w, v = np.linalg.eigh(matrix)
+    if w.min() > floor:
+        return matrix
+    fixed = (v * np.clip(w, floor, None)) @ v.T
+    d = np.sqrt(np.diag(fixed))
+    return fixed / np.outer(d, d)
+
+
+def iman_conover(
+    samples: Dict[str, Any],
+    correlations: Dict[Tuple[str, str], float],
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Reorder samples so they follow target rank correlations (Iman-Conover).
+
+    `correlations` maps (name_a, name_b) -> target rank correlation in
+    [-1, 1]; unlisted pairs get 0. Only the parameters named in
+    `correlations` (and present in `samples` with non-constant values) are
+    reordered. Each column keeps its exact marginal values; only their
+    order changes.
+
+    The permuted normal-score matrix M is decorrelated by the Cholesky factor
+    F of its sample correlation and recorrelated by the factor P of the
+    target (T = M F^-T P^T). Each input column is then sorted into the rank
+    order of the matching column of T. Cost is O(n k log n) for n samples
+    and k parameters, all in numpy.
+
+    Returns a new dict; columns not involved are passed through unchanged.
+    """
+    if np is None:
+        raise RuntimeError("iman_conover requires numpy")
+    for pair, r in correlations.items():
+        if not -1 <= r <= 1:
+            raise ValueError(f"Rank correlation for {pair} must be in [-1, 1], got {r}")
+
+    names = sorted({
+        name for pair in correlations for name in pair
+        if name in samples and np.ptp(np.asarray(samples[name], dtype=float)) > 0
+    })
+    result = dict(samples)
+    if len(names) < 2:
+        return result
+    index = {name: i for i, name in enumerate(names)}
+    target = np.eye(len(names))
+    for (a, b), r in correlations.items():
+        if a in index and b in index and a != b:
+            target[index[a], index[b]] = target[index[b], index[a]] = r
+
+    # One row per parameter so every sort runs over contiguous memory
+    X = np.vstack([np.asarray(samples[name], dtype=float) for name in names])
+    k, n = X.shape
+    rng = _rng(seed)
+    if _special is not None:
+        scores = _special.ndtri(np.arange(1, n + 1) / (n + 1))  # van der Waerden scores
+    else:
+        scores = np.sort(rng.standard_normal(n))
+    M = rng.permuted(np.broadcast_to(scores, (k, n)), axis=1)
+
+    F = np.linalg.cholesky(_nearest_correlation(np.corrcoef(M)))
+    P = np.linalg.cholesky(_nearest_correlation(target))
+    T = P @ np.linalg.solve(F, M)
+
+    # Position order[j, i] of row j receives the i-th smallest value of X[j]
+    order = np.argsort(T, axis=1)
+    reordered = np.empty_like(X)
+    np.put_along_axis(reordered, order, np.sort(X, axis=1), axis=1)
+    for j, name in enumerate(names):
+        result[name] = reordered[j]
+    return result
+
+
+def simulate(
+    parameters: Dict[str, Dict[str, Any]],
+    n: int = 10000,
+    seed: int | None = None,
+    sampler: str = "random",
+    design_names: Optional[Sequence[str]] = None,
+    correlations: Optional[Dict[Tuple[str, str], float]] = None,
+):
     """Sample all Parameter values.
 
     `parameters` is the dict produced by parse_parameters_file(), where each
     value may hold a `Parameter` instance under `metadata['value']`.
+
+    `sampler` is one of SAMPLERS. "random" draws each parameter independently
+    from the RNG seeded with `seed`; the others build one joint design over
+    the uncertain parameters (one column each, in sorted name order, so the
+    result only depends on `seed` and the parameter set) and map each column
+    through that parameter's inverse CDF. `design_names` restricts the design
+    to the given parameters (the rest are sampled as with "random").
+
+    `correlations` ((name_a, name_b) -> rank correlation) imposes rank
+    correlations on the sampled columns via `iman_conover`.
     Returns a dict: name -> samples (numpy array or list).
     """
+    columns: Dict[str, Any] = {}
+    if sampler != "random":
+        names = sorted(
+            name for name in (parameters if design_names is None else design_names)
+            if name in parameters and has_uncertainty(parameters[name].get("value"))
+        )
+        if names:
+            design = _uniform_design(sampler, n, len(names), seed)
+            columns = {name: design[:, j] for j, name in enumerate(names)}
+
     results = {}
     for name, meta in parameters.items():
         val = meta.get("value")
@@ -220,7 +416,9 @@ def simulate(parameters: Dict[str, Dict[str, Any]], n: int = 10000, seed: int |
             continue
         # Use duck-typing to handle module reload issues
         # where Parameter class may be loaded from different module paths
-        if hasattr(val, 'distribution') or hasattr(val, 'std_error') or hasattr(val, 'confidence_interval'):
+        if name in columns:
+            results[name] = sample_parameter(val, n=n, u=columns[name])
+        elif hasattr(val, 'distribution') or hasattr(val, 'std_error') or hasattr(val, 'confidence_interval'):
             results[name] = sample_parameter(val, n=n, seed=seed)
         elif Parameter is not None and isinstance(val, Parameter):
             # Fallback for Parameter without uncertainty metadata
@@ -235,87 +433,273 @@ def simulate(parameters: Dict[str, Dict[str, Any]], n: int = 10000, seed: int |
                 results[name] = np.full(n, v)
             else:
                 results[name] = [v for _ in range(n)]
+    if correlations:
+        results = iman_conover(results, correlations, seed)
     return results
 
 
-def simulate_with_propagation(parameters: Dict[str, Dict[str, Any]], n: int = 10000, seed: int | None = None):
+def _compute_vectorized(compute_fn: Callable[[Dict[str, Any]], Any], ctx: Dict[str, Any], n: int):
+    """Evaluate a compute lambda once over whole sample arrays.
+
+    Lambdas that the compute compiler can parse are evaluated through their
+    generated NumPy kernel, which also covers scalar-only constructs
+    (`int(...)`, `min`/`max`, `sum` over `range`). Other lambdas are called
+    directly; most are plain arithmetic on `ctx[...]` and work unchanged when
+    handed numpy arrays. If the call raises (`math.*`, `if` branches) or the
+    result is not finite or has the wrong shape, return None so the caller
+    can fall back to the per-sample loop (which preserves the exact scalar
+    semantics, e.g. ZeroDivisionError handling).
+    """
+    if np is None:
+        return None
+    count_calls("compute_calls.vectorized")
+    kernel = checked_kernel(compute_fn, ctx) if ctx else None
+    try:
+        with np.errstate(all="ignore"):
+            out = (kernel or compute_fn)(ctx)
+            # Kernels of `int(...)` lambdas return int64 samples, as the per-sample loop does
+            if not (isinstance(out, np.ndarray) and out.dtype.kind == "i"):
+                out = np.asarray(out, dtype=float)
+    except Exception:
+        return None
+    if out.ndim == 0:
+        out = np.full(n, float(out))
+    if out.shape != (n,) or not np.all(np.isfinite(out)):
+        return None
+    return out
+
+
+def _compute_per_sample(compute_fn: Callable[[Dict[str, float]], float], inputs: Sequence[str], results: Dict[str, Any]):
+    """Evaluate a compute lambda sample-by-sample with scalar float inputs."""
+    n_samples = len(results[inputs[0]])
+    count_calls("compute_calls.scalar", n_samples)
+    new_samples = []
+    for i in range(n_samples):
+        ctx = {inp: float(results[inp][i]) for inp in inputs}
+        new_samples.append(compute_fn(ctx))
+    if np is not None:
+        return np.array(new_samples)
+    return new_samples
+
+
+def simulate_with_propagation(
+    parameters: Dict[str, Dict[str, Any]],
+    n: int = 10000,
+    seed: int | None = None,
+    vectorize: bool = True,
+    graph: Optional[ParameterGraph] = None,
+    sampler: str = "random",
+    correlations: Optional[Dict[Tuple[str, str], float]] = None,
+    unpropagated: Optional[Set[str]] = None,
+):
     """Sample all Parameter values with proper uncertainty propagation.
 
     Unlike simulate(), this function properly handles calculated parameters by:
     1. First sampling all leaf parameters (those with distribution metadata)
     2. Then computing calculated parameters from their sampled inputs
-    3. Recursively handling dependencies so intermediate calculated params work
-
-    `parameters` is the dict produced by parse_parameters_file().
+    3. Visiting calculated parameters in the topological order of `graph`
+       so intermediate calculated params are ready before their dependents
+
+    When `vectorize` is True (default) each compute lambda is called once with
+    whole numpy sample arrays in `ctx`; lambdas that only work on scalars fall
+    back to the per-sample loop automatically (see `_compute_vectorized`).
+
+    `sampler` selects the sampling strategy and `correlations` the target
+    rank correlations between inputs (see `simulate`); for the design based
+    samplers only the leaf parameters get design columns, since calculated
+    parameters are recomputed from them.
+
+    `parameters` is the dict produced by parse_parameters_file(); pass a
+    prebuilt `graph` to avoid rebuilding the dependency DAG. If given,
+    `unpropagated` receives the calculated parameters that could not be
+    recomputed and still hold their base samples (see `_propagate`).
     Returns a dict: name -> samples (numpy array or list).
     """
+    graph = build_parameter_graph(parameters, graph)
+
     # First, do basic sampling for all parameters
-    results = simulate(parameters, n=n, seed=seed)
+    leaves = [name for name in parameters if name not in graph.computed]
+    results = simulate(
+        parameters, n=n, seed=seed, sampler=sampler, design_names=leaves, correlations=correlations,
+    )
+    failed = _propagate(results, graph, vectorize)
+    if unpropagated is not None:
+        unpropagated.update(failed)
+    return results
 
-    # Build dependency graph: which params depend on which
-    has_compute = {}  # name -> (inputs, compute_fn)
-    for name, meta in parameters.items():
-        val = meta.get("value")
-        if val is None:
-            continue
-        compute_fn = getattr(val, 'compute', None)
-        inputs_list = getattr(val, 'inputs', None)
-        if compute_fn and inputs_list:
-            has_compute[name] = (inputs_list, compute_fn)
 
-    if not has_compute:
-        return results
+def _propagate(
+    results: Dict[str, Any],
+    graph: ParameterGraph,
+    vectorize: bool = True,
+    only: Optional[Set[str]] = None,
+) -> Set[str]:
+    """Recompute calculated parameters in `results` from their sampled inputs.
 
-    # Track which params have been finalized (either recomputed or confirmed deterministic)
-    finalized = set()
-    max_iterations = 100  # Prevent infinite loops (allow more for deep DAGs)
+    `only` restricts the recomputation to the given (upstream-closed) set of
+    parameters; the others keep their base samples.
 
-    for iteration in range(max_iterations):
-        progress = False
-        for name, (inputs, compute_fn) in has_compute.items():
-            if name in finalized:
-                continue
+    Returns the calculated parameters (within `only`) that could not be
+    recomputed: their compute function raised, an input is missing or was not
+    recomputed itself, or they are on a dependency cycle. Their entries in
+    `results` are still the base samples, so callers must not report them as
+    propagated.
+    """
+    has_compute = graph.computed  # name -> (inputs, compute_fn)
 
-            # Check if all inputs are available
-            all_inputs_ready = all(inp in results for inp in inputs)
-            if not all_inputs_ready:
-                continue
+    # Track which params have been recomputed. Parameters on a dependency
+    # cycle are never ready and keep their base samples.
+    finalized = set()
+    for name in graph.topological_order:
+        if name not in has_compute or (only is not None and name not in only):
+            continue
+        inputs, compute_fn = has_compute[name]
 
-            # Check if all inputs that are themselves computed have been finalized
-            # This ensures we process in correct dependency order
-            all_inputs_finalized = all(
-                inp not in has_compute or inp in finalized
-                for inp in inputs
-            )
-            if not all_inputs_finalized:
-                continue
+        # Check if all inputs are available
+        if not all(inp in results for inp in inputs):
+            continue
 
-            # Compute this parameter from its inputs
-            try:
-                # Recompute samples from input samples (regardless of variance)
-                # This propagates any variance that exists
+        # Check if all inputs that are themselves computed have been finalized
+        if not all(inp not in has_compute or inp in finalized for inp in inputs):
+            continue
+
+        # Compute this parameter from its inputs
+        try:
+            # Recompute samples from input samples (regardless of variance)
+            # This propagates any variance that exists
+            new_samples = None
+            if vectorize and np is not None:
                 n_samples = len(results[inputs[0]])
-                new_samples = []
-                for i in range(n_samples):
-                    ctx = {inp: float(results[inp][i]) for inp in inputs}
-                    new_samples.append(compute_fn(ctx))
+                ctx_arrays = {inp: np.asarray(results[inp], dtype=float) for inp in inputs}
+                new_samples = _compute_vectorized(compute_fn, ctx_arrays, n_samples)
+            if new_samples is None:
+                new_samples = _compute_per_sample(compute_fn, inputs, results)
+            results[name] = new_samples
+        except Exception:
+            # If computation fails, keep the base samples (reported below)
+            continue
+        finalized.add(name)
+    return {name for name in has_compute if name not in finalized and (only is None or name in only)}
 
-                if np is not None:
-                    results[name] = np.array(new_samples)
-                else:
-                    results[name] = new_samples
 
-                finalized.add(name)
-                progress = True
-            except Exception:
-                # If computation fails, mark as finalized to avoid infinite loop
-                finalized.add(name)
-                progress = True
+# Statistics tracked by simulate_adaptive() and their percentiles (None = mean)
+_ADAPTIVE_STATS = (("mean", None), ("p5", 5), ("p95", 95))
 
-        if not progress:
-            break
 
-    return results
+def _batch_precision(batch_stats: List[Tuple[float, float, float]]) -> Dict[str, float]:
+    """Relative 95% half-width of each tracked statistic from batch means.
+
+    With B equal, independent batches, the standard error of a statistic is
+    approximately std(per-batch estimates) / sqrt(B). The half-width is taken
+    relative to max(|estimate|, p95 - p5) so outcomes centred on zero still
+    converge.
+    """
+    stats = np.asarray(batch_stats, dtype=float)
+    estimates = stats.mean(axis=0)
+    scale = max(abs(estimates[2] - estimates[1]), 1e-300)
+    half_widths = 1.96 * stats.std(axis=0, ddof=1) / math.sqrt(len(stats))
+    return {
+        label: float(hw / max(abs(est), scale))
+        for (label, _), hw, est in zip(_ADAPTIVE_STATS, half_widths, estimates)
+    }
+
+
+def simulate_adaptive(
+    parameters: Dict[str, Dict[str, Any]],
+    tolerance: float = 0.01,
+    batch_size: int = 200,
+    max_n: int = 10000,
+    min_batches: int = 4,
+    seed: int | None = None,
+    vectorize: bool = True,
+    graph: Optional[ParameterGraph] = None,
+    sampler: str = "random",
+    track: Optional[Sequence[str]] = None,
+    correlations: Optional[Dict[Tuple[str, str], float]] = None,
+    unpropagated: Optional[Set[str]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Propagated Monte Carlo that stops each outcome once it has converged.
+
+    Leaf parameters are sampled once for `max_n` rows (exactly as
+    `simulate_with_propagation` would, including `sampler` and
+    `correlations`), then calculated parameters are
+    propagated over a growing prefix of those rows: first
+    `min_batches * batch_size`, then about 50% more per round. The mean, p5
+    and p95 of every outcome in `track` (default: all calculated parameters)
+    are estimated on consecutive `batch_size` batches; an outcome whose
+    statistics all have a relative 95% half-width within `tolerance` (see
+    `_batch_precision`) is frozen, and later rounds only recompute the
+    upstream closure of outcomes still running. Sampling stops when every
+    tracked outcome has converged or all `max_n` rows are used.
+
+    Deterministic and near-linear outcomes typically stop after the first
+    round. `unpropagated` works as in `simulate_with_propagation`, over all
+    rounds.
+
+    Returns (samples, precision):
+        samples: name -> numpy array; leaf parameters have `max_n` samples,
+            calculated parameters the prefix of rows evaluated while they (or
+            a dependent) were still running
+        precision: tracked name -> {"n", "mean", "p5", "p95", "converged"},
+            where the statistic entries are relative 95% half-widths
+    """
+    if np is None:
+        raise RuntimeError("simulate_adaptive requires numpy")
+
+    graph = build_parameter_graph(parameters, graph)
+    leaves = [name for name in parameters if name not in graph.computed]
+    base = simulate(
+        parameters, n=max_n, seed=seed, sampler=sampler, design_names=leaves, correlations=correlations,
+    )
+    base = {name: np.asarray(arr, dtype=float) for name, arr in base.items()}
+    tracked = [name for name in (track if track is not None else graph.computed) if name in base]
+
+    chunks: Dict[str, List[Any]] = {name: [] for name in graph.computed if name in base}
+    batch_stats: Dict[str, List[Tuple[float, float, float]]] = {name: [] for name in tracked}
+    precision: Dict[str, Dict[str, Any]] = {}
+    active = set(tracked)
+    running: Optional[Set[str]] = None
+    done = 0
+    target = min(max_n, min_batches * batch_size)
+    while done < max_n and (active or done == 0):
+        rows = {name: arr[done:target] for name, arr in base.items()}
+        failed = _propagate(rows, graph, vectorize, running)
+        if unpropagated is not None:
+            unpropagated.update(failed)
+        for name in chunks:
+            if running is None or name in running:
+                chunks[name].append(np.asarray(rows[name], dtype=float))
+
+        for name in list(active):
+            arr = np.asarray(rows[name], dtype=float)
+            batches = arr[:len(arr) // batch_size * batch_size].reshape(-1, batch_size)
+            with np.errstate(all="ignore"):
+                means = batches.mean(axis=1)
+                quantiles = np.percentile(batches, [q for _, q in _ADAPTIVE_STATS[1:]], axis=1)
+            batch_stats[name].extend(zip(means.tolist(), *quantiles.tolist()))
+            if len(batch_stats[name]) < max(min_batches, 2):
+                continue
+            rel = _batch_precision(batch_stats[name])
+            if all(math.isfinite(v) and v <= tolerance for v in rel.values()):
+                precision[name] = {"n": target, **rel, "converged": True}
+                active.discard(name)
+
+        done = target
+        target = min(max_n, done + max(batch_size, (done // 2) // batch_size * batch_size))
+        running = set()
+        for name in active:
+            running.update(graph.upstream(name))
+
+    for name in active:
+        rel = _batch_precision(batch_stats[name]) if len(batch_stats[name]) > 1 else {
+            label: float("nan") for label, _ in _ADAPTIVE_STATS
+        }
+        precision[name] = {"n": done, **rel, "converged": False}
+
+    samples = dict(base)
+    for name, parts in chunks.items():
+        samples[name] = np.concatenate(parts) if parts else base[name][:0]
+    return samples, {name: precision[name] for name in tracked}
 
 
 def one_at_a_time_sensitivity(parameters: Dict[str, Dict[str, Any]], target_name: str, n: int = 1000):
@@ -501,7 +885,239 @@ def get_fundamental_inputs(parameters: Dict[str, Dict[str, Any]], param_name: st
     return fundamental
 
 
-def tornado_deltas(parameters: Dict[str, Dict[str, Any]], outcome: Outcome, expand_inputs: bool = True) -> Dict[str, Dict[str, float]]:
+def _low_high(v: Any) -> Tuple[float, float]:
+    """Low/high tornado bounds from a Parameter's CI (preferred) or ±1 std_error."""
+    m = float(v)
+    std = getattr(v, "std_error", None)
+    ci = getattr(v, "confidence_interval", None)
+    if ci and isinstance(ci, Sequence) and len(cast(Sequence[Any], ci)) == 2:
+        return float(cast(Sequence[Any], ci)[0]), float(cast(Sequence[Any], ci)[1])
+    if std and std > 0:
+        return m - std, m + std
+    return m, m
+
+
+def _tornado_inputs(graph: ParameterGraph, outcome: Outcome, expand_inputs: bool = True) -> List[str]:
+    """Inputs whose low/high bounds the tornado varies for `outcome`."""
+    if not expand_inputs:
+        return list(outcome.inputs)
+    all_fundamental: Set[str] = set()
+    for direct_input in outcome.inputs:
+        all_fundamental.update(graph.fundamental_inputs(direct_input))
+    return sorted(all_fundamental)  # Sort for deterministic order
+
+
+def _tornado_baseline(graph: ParameterGraph, outcome: Outcome) -> float:
+    """Outcome value from the stored Parameter values of its direct inputs."""
+    ctx = {}
+    for name in outcome.inputs:
+        val = graph.value(name)
+        ctx[name] = float(val) if val is not None else 0.0
+    count_calls("compute_calls.scalar")
+    return outcome.compute(cast(Dict[str, float], ctx))
+
+
+def _sorted_deltas(deltas: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Sort by max abs delta for presentation (caller may sort again)."""
+    return dict(sorted(deltas.items(), key=lambda kv: max(abs(kv[1]["delta_minus"]), abs(kv[1]["delta_plus"])), reverse=True))
+
+
+class TornadoEngine:
+    """Incremental deterministic evaluator for tornado analysis.
+
+    Evaluates every parameter in the graph once at its base value and caches
+    the result. Perturbing a parameter then only recomputes its descendants
+    (in topological order) on top of the cached baseline, and each perturbed
+    state is memoized, so outcomes that share a fundamental input reuse the
+    same evaluation.
+
+    Compute errors are recorded per node rather than raised immediately; they
+    propagate to dependents and are re-raised when an outcome that needs the
+    failed value is evaluated (matching the recursive evaluator's behavior).
+    """
+
+    def __init__(self, parameters: Dict[str, Dict[str, Any]], graph: Optional[ParameterGraph] = None) -> None:
+        self.parameters = parameters
+        self.graph = build_parameter_graph(parameters, graph)
+        self._perturbed: Dict[Tuple[str, float], Tuple[Dict[str, float], Dict[str, Exception]]] = {}
+        self.baseline_values, self.baseline_errors = self._evaluate_nodes(self.graph.topological_order, {}, {}, {})
+        for name in self.graph.cyclic:
+            self.baseline_errors[name] = RecursionError(f"Parameter '{name}' is on a dependency cycle")
+
+    def _evaluate_nodes(
+        self,
+        nodes: Sequence[str],
+        overrides: Dict[str, float],
+        values: Dict[str, float],
+        errors: Dict[str, Exception],
+    ) -> Tuple[Dict[str, float], Dict[str, Exception]]:
+        """Evaluate `nodes` (topologically ordered) into `values`/`errors`.
+
+        Inputs not present in `values`/`errors` are read from the baseline.
+        """
+        graph = self.graph
+        calls = 0
+        for node in nodes:
+            if node in overrides:
+                values[node] = overrides[node]
+                continue
+            val = graph.value(node)
+            if val is None:
+                values[node] = 0.0
+            elif node in graph.computed:
+                inputs_list, compute_fn = graph.computed[node]
+                sub_ctx = {}
+                failed = None
+                for inp in inputs_list:
+                    if inp in errors or (inp not in values and inp in self.baseline_errors):
+                        failed = errors.get(inp) or self.baseline_errors[inp]
+                        break
+                    sub_ctx[inp] = values[inp] if inp in values else self.baseline_values[inp]
+                if failed is not None:
+                    errors[node] = failed
+                    continue
+                calls += 1
+                try:
+                    values[node] = compute_fn(sub_ctx)
+                except Exception as e:
+                    errors[node] = e
+            else:
+                values[node] = float(val)
+        count_calls("compute_calls.scalar", calls)
+        return values, errors
+
+    def perturb(self, name: str, value: float) -> Tuple[Dict[str, float], Dict[str, Exception]]:
+        """Values/errors that change when `name` is set to `value` (memoized).
+
+        Only `name` and its descendants are recomputed; everything else is
+        read from the cached baseline.
+        """
+        key = (name, value)
+        cached = self._perturbed.get(key)
+        if cached is not None:
+            return cached
+        dirty = self.graph.ordered(d for d in self.graph.descendants(name) if d not in self.graph.cyclic)
+        values, errors = self._evaluate_nodes([name, *dirty], {name: value}, {}, {})
+        self._perturbed[key] = (values, errors)
+        return values, errors
+
+    def evaluate(self, overrides: Dict[str, float]) -> Tuple[Dict[str, float], Dict[str, Exception]]:
+        """Values/errors that change under several simultaneous overrides."""
+        dirty: Set[str] = set()
+        for name in overrides:
+            dirty.update(self.graph.descendants(name))
+        dirty.difference_update(overrides)
+        dirty.difference_update(self.graph.cyclic)
+        nodes = [*overrides, *self.graph.ordered(dirty)]
+        return self._evaluate_nodes(nodes, dict(overrides), {}, {})
+
+    def outcome_value(self, outcome: Outcome, changed: Optional[Tuple[Dict[str, float], Dict[str, Exception]]] = None) -> float:
+        """Evaluate `outcome.compute` from baseline values plus `changed` overlay."""
+        values, errors = changed if changed is not None else ({}, {})
+        ctx = {}
+        for inp in outcome.inputs:
+            if inp in values:
+                ctx[inp] = values[inp]
+            elif inp in errors:
+                raise errors[inp]
+            elif inp in self.baseline_errors:
+                raise self.baseline_errors[inp]
+            else:
+                ctx[inp] = self.baseline_values.get(inp, 0.0)
+        count_calls("compute_calls.scalar")
+        return outcome.compute(ctx)
+
+    def inputs_to_analyze(self, outcome: Outcome, expand_inputs: bool = True) -> List[str]:
+        """Inputs whose low/high bounds the tornado varies for `outcome`."""
+        return _tornado_inputs(self.graph, outcome, expand_inputs)
+
+    def deltas(self, outcome: Outcome, expand_inputs: bool = True) -> Dict[str, Dict[str, float]]:
+        """Tornado deltas for one outcome; see `tornado_deltas`."""
+        baseline = _tornado_baseline(self.graph, outcome)
+
+        deltas: Dict[str, Dict[str, float]] = {}
+        for name in self.inputs_to_analyze(outcome, expand_inputs):
+            lo, hi = _low_high(self.graph.value(name))
+
+            # Skip if no uncertainty
+            if lo == hi:
+                continue
+
+            # Evaluate outcome with input varied (propagates through calc chain)
+            y_minus = self.outcome_value(outcome, self.perturb(name, lo))
+            y_plus = self.outcome_value(outcome, self.perturb(name, hi))
+
+            deltas[name] = {
+                "delta_minus": float(y_minus - baseline),
+                "delta_plus": float(y_plus - baseline),
+            }
+
+        return _sorted_deltas(deltas)
+
+    def deltas_for_outcomes(self, outcomes: Sequence[Outcome], expand_inputs: bool = True) -> Dict[str, Any]:
+        """Tornado deltas for many outcomes in a single leaf-major pass.
+
+        Each perturbed input is evaluated once, and every outcome that depends
+        on it is read off that same perturbed state. Returns outcome name ->
+        deltas dict, or the Exception raised while evaluating that outcome.
+        """
+        results: Dict[str, Any] = {}
+        baselines: Dict[str, float] = {}
+        partial: Dict[str, Dict[str, Dict[str, float]]] = {}
+        users: Dict[str, List[Outcome]] = {}
+        for outcome in outcomes:
+            try:
+                baselines[outcome.name] = _tornado_baseline(self.graph, outcome)
+            except Exception as e:
+                results[outcome.name] = e
+                continue
+            partial[outcome.name] = {}
+            for name in self.inputs_to_analyze(outcome, expand_inputs):
+                users.setdefault(name, []).append(outcome)
+
+        for name in sorted(users):
+            pending = [o for o in users[name] if o.name not in results]
+            if not pending:
+                continue
+            try:
+                lo, hi = _low_high(self.graph.value(name))
+            except Exception as e:
+                for outcome in pending:
+                    results[outcome.name] = e
+                continue
+            if lo == hi:
+                continue
+            changed_minus = self.perturb(name, lo)
+            changed_plus = self.perturb(name, hi)
+            for outcome in pending:
+                try:
+                    y_minus = self.outcome_value(outcome, changed_minus)
+                    y_plus = self.outcome_value(outcome, changed_plus)
+                except Exception as e:
+                    results[outcome.name] = e
+                    continue
+                baseline = baselines[outcome.name]
+                partial[outcome.name][name] = {
+                    "delta_minus": float(y_minus - baseline),
+                    "delta_plus": float(y_plus - baseline),
+                }
+
+        for outcome in outcomes:
+            if outcome.name not in results:
+                # Re-insert in analysis order so ties sort exactly as in deltas()
+                found = partial[outcome.name]
+                ordered = {n: found[n] for n in self.inputs_to_analyze(outcome, expand_inputs) if n in found}
+                results[outcome.name] = _sorted_deltas(ordered)
+        return {outcome.name: results[outcome.name] for outcome in outcomes}
+
+
+def tornado_deltas(
+    parameters: Dict[str, Dict[str, Any]],
+    outcome: Outcome,
+    expand_inputs: bool = True,
+    graph: Optional[ParameterGraph] = None,
+    engine: Optional[TornadoEngine] = None,
+) -> Dict[str, Dict[str, float]]:
     """Deterministic sensitivity (tornado) using low/high per input.
 
     Uses each input's `std_error` or `confidence_interval` to derive low/high.
@@ -511,92 +1127,342 @@ def tornado_deltas(parameters: Dict[str, Dict[str, Any]], outcome: Outcome, expa
         parameters: Full parameters dictionary
         outcome: Outcome with compute function and inputs
         expand_inputs: If True, recursively expand calculated inputs to fundamental parameters
+        graph: Optional prebuilt ParameterGraph for `parameters` (reused across outcomes)
+        engine: Optional TornadoEngine; pass one shared engine when analyzing many
+            outcomes so baseline values and perturbed states are computed once
     """
-    # Decide which inputs to analyze
-    if expand_inputs:
-        # Recursively find all fundamental inputs
-        all_fundamental = set()
-        for direct_input in outcome.inputs:
-            all_fundamental.update(get_fundamental_inputs(parameters, direct_input))
-        inputs_to_analyze = sorted(all_fundamental)  # Sort for deterministic order
-    else:
-        # Use only direct inputs (old behavior)
-        inputs_to_analyze = outcome.inputs
+    if engine is None or engine.parameters is not parameters:
+        engine = TornadoEngine(parameters, graph)
+    return engine.deltas(outcome, expand_inputs)
 
-    # Build baseline context (need ALL inputs for compute, not just fundamental)
-    ctx = {}
-    for name in outcome.inputs:
-        meta = parameters.get(name, {})
-        val = meta.get("value")
-        ctx[name] = float(val) if val is not None else 0.0
-    baseline = outcome.compute(cast(Dict[str, float], ctx))
-
-    def low_high(v: Any) -> Tuple[float, float]:
-        m = float(v)
-        std = getattr(v, "std_error", None)
-        ci = getattr(v, "confidence_interval", None)
-        if ci and isinstance(ci, Sequence) and len(cast(Sequence[Any], ci)) == 2:
-            return float(cast(Sequence[Any], ci)[0]), float(cast(Sequence[Any], ci)[1])
-        if std and std > 0:
-            return m - std, m + std
-        return m, m
-
-    def evaluate_param(param_name: str, overrides: Dict[str, float]) -> float:
-        """Evaluate a parameter with overrides propagated through dependencies."""
-        meta = parameters.get(param_name, {})
-        val = meta.get("value")
 
-        # If overridden directly, use that
-        if param_name in overrides:
-            return overrides[param_name]
+def _compute_rows(
+    compute_fn: Callable[[Dict[str, float]], float],
+    ctx: Dict[str, Any],
+    n: int,
+    failed: Any,
+) -> Tuple[Any, Any, Optional[Exception]]:
+    """Row-by-row fallback for `evaluate_graph_batch`.
 
-        if val is None:
-            return 0.0
+    Rows already marked in `failed` are skipped; rows whose compute raises are
+    added to the mask. Returns (values, failed mask, first exception).
+    """
+    out = np.full(n, np.nan)
+    failed = failed.copy()
+    count_calls("compute_calls.scalar", n - int(failed.sum()))
+    first_error: Optional[Exception] = None
+    for i in range(n):
+        if failed[i]:
+            continue
+        try:
+            out[i] = compute_fn({k: float(v[i]) for k, v in ctx.items()})
+        except Exception as e:
+            failed[i] = True
+            if first_error is None:
+                first_error = e
+    return out, failed, first_error
+
+
+def evaluate_graph_batch(
+    graph: ParameterGraph,
+    n: int,
+    overrides: Dict[str, Any],
+    targets: Optional[Sequence[str]] = None,
+    base: Optional[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Exception]]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Exception]]:
+    """Evaluate the compute graph over `n` scenario rows at once.
+
+    Every parameter starts at its deterministic value; `overrides` replaces
+    values per row. An override is either a full length-`n` array or a
+    `(row_indices, values)` pair that only replaces the listed rows (other rows
+    keep the value computed from the node's inputs). Computed parameters are
+    evaluated in topological order with whole-column numpy arrays, falling
+    back to row-by-row scalar calls for lambdas that need scalars.
 
-        # If has compute function, recursively evaluate inputs
-        compute_fn = getattr(val, "compute", None)
-        inputs_list = getattr(val, "inputs", None)
-        if compute_fn and inputs_list:
-            sub_ctx = {}
-            for inp in inputs_list:
-                sub_ctx[inp] = evaluate_param(inp, overrides)
-            return compute_fn(sub_ctx)
+    Args:
+        graph: ParameterGraph of the parameters to evaluate
+        n: Number of scenario rows
+        overrides: name -> array(n) or (row_indices, values)
+        targets: Optional names whose upstream closure is all that gets evaluated
+        base: Optional result of a previous call over the same `n` rows; only
+            the overridden parameters and their descendants are re-evaluated,
+            everything else is read from `base`
 
-        # Otherwise use base value
-        return float(val) if val is not None else 0.0
+    Returns:
+        (values, failed, errors): name -> array(n); name -> bool mask of rows
+        whose evaluation raised; name -> first exception raised for that node
+    """
+    if np is None:
+        raise RuntimeError("evaluate_graph_batch requires numpy")
 
-    deltas: Dict[str, Dict[str, float]] = {}
-    for name in inputs_to_analyze:
-        meta = parameters.get(name, {})
-        val = meta.get("value")
-        lo, hi = low_high(val)
+    if targets is None:
+        nodes = list(graph.topological_order)
+    else:
+        closure: Set[str] = set()
+        for target in targets:
+            closure.update(graph.upstream(target))
+        nodes = graph.ordered(closure)
+
+    values: Dict[str, Any] = {}
+    failed: Dict[str, Any] = {}
+    errors: Dict[str, Exception] = {}
+    if base is not None:
+        values, failed, errors = dict(base[0]), dict(base[1]), dict(base[2])
+        dirty: Set[str] = set(overrides)
+        for name in overrides:
+            dirty.update(graph.descendants(name))
+        nodes = [node for node in nodes if node in dirty]
+        for node in nodes:
+            errors.pop(node, None)
+    no_failures = np.zeros(n, dtype=bool)
+    for node in nodes:
+        override = overrides.get(node)
+        if override is not None and not isinstance(override, tuple):
+            values[node] = np.asarray(override, dtype=float)
+            failed[node] = no_failures
+            continue
 
-        # Skip if no uncertainty
+        val = graph.value(node)
+        if val is None:
+            col = np.zeros(n)
+            mask = no_failures
+        elif node in graph.computed:
+            inputs_list, compute_fn = graph.computed[node]
+            ctx = {inp: values[inp] if inp in values else np.zeros(n) for inp in inputs_list}
+            mask = no_failures
+            for inp in inputs_list:
+                if inp in failed and failed[inp].any():
+                    mask = mask | failed[inp]
+                    if errors.get(inp) is not None:
+                        errors.setdefault(node, errors[inp])
+            col = None
+            if not mask.any():
+                col = _compute_vectorized(compute_fn, ctx, n)
+            if col is None:
+                col, mask, err = _compute_rows(compute_fn, ctx, n, mask)
+                if err is not None:
+                    errors.setdefault(node, err)
+        else:
+            col = np.full(n, float(val))
+            mask = no_failures
+
+        if override is not None:
+            rows, row_values = override
+            col = np.array(col, dtype=float)
+            col[rows] = row_values
+            mask = mask.copy()
+            mask[rows] = False
+        values[node] = col
+        failed[node] = mask
+
+    return values, failed, errors
+
+
+def _evaluate_outcome_batch(
+    outcome: Outcome,
+    n: int,
+    values: Dict[str, Any],
+    failed: Dict[str, Any],
+    errors: Dict[str, Exception],
+) -> Tuple[Any, Any, Optional[Exception]]:
+    """Apply an outcome's compute to the columns from `evaluate_graph_batch`.
+
+    Returns (values, failed mask, first error).
+    """
+    ctx = {inp: values[inp] if inp in values else np.zeros(n) for inp in outcome.inputs}
+    mask = np.zeros(n, dtype=bool)
+    first_error = None
+    for inp in outcome.inputs:
+        if inp in failed and failed[inp].any():
+            mask = mask | failed[inp]
+            first_error = first_error or errors.get(inp)
+    y = _compute_vectorized(outcome.compute, ctx, n) if not mask.any() else None
+    if y is None:
+        y, mask, err = _compute_rows(outcome.compute, ctx, n, mask)
+        first_error = first_error or err
+    return y, mask, first_error
+
+
+def tornado_deltas_batched(
+    parameters: Dict[str, Dict[str, Any]],
+    outcomes: Sequence[Outcome],
+    expand_inputs: bool = True,
+    graph: Optional[ParameterGraph] = None,
+) -> Dict[str, Any]:
+    """Tornado deltas for all outcomes from one vectorized graph evaluation.
+
+    Builds a (2*k)-row scenario matrix with one low/high row pair per analyzed
+    input, pushes it through the compute graph as array columns (see
+    `evaluate_graph_batch`) and reads every outcome's deltas off the result.
+    Equivalent to `TornadoEngine.deltas_for_outcomes` up to floating-point
+    rounding of numpy vs scalar arithmetic.
+
+    Returns outcome name -> deltas dict (as `tornado_deltas`), or the Exception
+    raised while evaluating that outcome.
+    """
+    engine_graph = build_parameter_graph(parameters, graph)
+    if np is None:
+        return TornadoEngine(parameters, engine_graph).deltas_for_outcomes(outcomes, expand_inputs)
+
+    results: Dict[str, Any] = {}
+    baselines: Dict[str, float] = {}
+    analyzed: Dict[str, List[str]] = {}
+    for outcome in outcomes:
+        try:
+            baselines[outcome.name] = _tornado_baseline(engine_graph, outcome)
+        except Exception as e:
+            results[outcome.name] = e
+            continue
+        analyzed[outcome.name] = _tornado_inputs(engine_graph, outcome, expand_inputs)
+
+    # One low/high row pair per input with a non-degenerate range
+    rows: Dict[str, int] = {}
+    bounds_errors: Dict[str, Exception] = {}
+    grouped: Dict[str, List[Tuple[int, float]]] = {}
+    for name in sorted({n for names in analyzed.values() for n in names}):
+        try:
+            lo, hi = _low_high(engine_graph.value(name))
+        except Exception as e:
+            bounds_errors[name] = e
+            continue
         if lo == hi:
             continue
+        rows[name] = 2 * len(rows)
+        grouped[name] = [(rows[name], lo), (rows[name] + 1, hi)]
+
+    n_rows = max(1, 2 * len(rows))
+    overrides = {
+        name: (np.array([r for r, _ in pairs]), np.array([v for _, v in pairs], dtype=float))
+        for name, pairs in grouped.items()
+    }
+    needed = {inp for outcome in outcomes if outcome.name in analyzed for inp in outcome.inputs}
+    values, failed, errors = evaluate_graph_batch(engine_graph, n_rows, overrides, targets=sorted(needed))
+
+    for outcome in outcomes:
+        if outcome.name in results:
+            continue
+        names = analyzed[outcome.name]
+        bad = next((bounds_errors[n] for n in names if n in bounds_errors), None)
+        if bad is not None:
+            results[outcome.name] = bad
+            continue
 
-        # Evaluate outcome with fundamental input varied (propagates through calc chain)
-        # minus
-        overrides_minus = {name: lo}
-        ctx_minus = {}
-        for direct_inp in outcome.inputs:
-            ctx_minus[direct_inp] = evaluate_param(direct_inp, overrides_minus)
-        y_minus = outcome.compute(ctx_minus)
-
-        # plus
-        overrides_plus = {name: hi}
-        ctx_plus = {}
-        for direct_inp in outcome.inputs:
-            ctx_plus[direct_inp] = evaluate_param(direct_inp, overrides_plus)
-        y_plus = outcome.compute(ctx_plus)
-
-        deltas[name] = {
-            "delta_minus": float(y_minus - baseline),
-            "delta_plus": float(y_plus - baseline),
-        }
+        y, mask, first_error = _evaluate_outcome_batch(outcome, n_rows, values, failed, errors)
+        baseline = baselines[outcome.name]
+        deltas: Dict[str, Dict[str, float]] = {}
+        for name in names:
+            if name not in rows:
+                continue
+            r = rows[name]
+            if mask[r] or mask[r + 1]:
+                results[outcome.name] = first_error or ValueError(f"Evaluation failed for {outcome.name}")
+                break
+            deltas[name] = {
+                "delta_minus": float(y[r] - baseline),
+                "delta_plus": float(y[r + 1] - baseline),
+            }
+        if outcome.name not in results:
+            results[outcome.name] = _sorted_deltas(deltas)
+
+    return {outcome.name: results[outcome.name] for outcome in outcomes}
+
+
+def sobol_indices(
+    parameters: Dict[str, Dict[str, Any]],
+    outcomes: Sequence[Outcome],
+    n: int = 1024,
+    seed: Optional[int] = None,
+    graph: Optional[ParameterGraph] = None,
+) -> Dict[str, Any]:
+    """Variance-based (Sobol) sensitivity indices via the Saltelli scheme.
+
+    Draws two independent sample matrices A and B over every uncertain leaf
+    the outcomes depend on, then for each leaf i evaluates A with column i
+    taken from B (AB_i). Only the descendants of leaf i are re-evaluated for
+    AB_i, so the cost is n * (k + 2) graph rows for k leaves, shared by all
+    outcomes.
+
+    Estimators (Saltelli et al. 2010):
+    - first order  S_i  = mean(f_B * (f_ABi - f_A)) / Var(f)
+    - total order  ST_i = mean((f_A - f_ABi)^2) / (2 * Var(f))
+
+    Unlike standardized regression coefficients these capture non-linear
+    effects and interactions (ST_i - S_i).
+
+    Returns outcome name -> {"first_order": {input: S_i}, "total_order":
+    {input: ST_i}, "variance": Var(f), "n": rows used}, or the Exception
+    raised while evaluating that outcome. Indices cover the outcome's
+    fundamental inputs, ordered by total-order index (descending).
+    """
+    if np is None:
+        raise RuntimeError("sobol_indices requires numpy")
+
+    engine_graph = build_parameter_graph(parameters, graph)
+    fundamentals = {
+        outcome.name: engine_graph.fundamental_inputs(outcome.name)
+        if outcome.name in engine_graph.parameters
+        else frozenset().union(*(engine_graph.fundamental_inputs(i) for i in outcome.inputs))
+        for outcome in outcomes
+    }
+
+    # Split 2n draws per leaf into A and B; constant leaves contribute nothing
+    A: Dict[str, Any] = {}
+    B: Dict[str, Any] = {}
+    leaves = sorted(set().union(*fundamentals.values())) if fundamentals else []
+    for i, name in enumerate(leaves):
+        draws = np.asarray(
+            sample_parameter(engine_graph.value(name), n=2 * n, seed=None if seed is None else seed + i),
+            dtype=float,
+        )
+        if np.ptp(draws) == 0:
+            continue
+        A[name], B[name] = draws[:n], draws[n:]
+
+    needed = sorted({inp for outcome in outcomes for inp in outcome.inputs})
+    base_a = evaluate_graph_batch(engine_graph, n, A, targets=needed)
+    base_b = evaluate_graph_batch(engine_graph, n, B, targets=needed)
+    f_a = {o.name: _evaluate_outcome_batch(o, n, *base_a) for o in outcomes}
+    f_b = {o.name: _evaluate_outcome_batch(o, n, *base_b) for o in outcomes}
+
+    interested = {name: [o for o in outcomes if name in fundamentals[o.name]] for name in A}
+    f_ab: Dict[str, Dict[str, Any]] = {}
+    for name in A:
+        if not interested[name]:
+            continue
+        ab = evaluate_graph_batch(engine_graph, n, {name: B[name]}, targets=needed, base=base_a)
+        f_ab[name] = {o.name: _evaluate_outcome_batch(o, n, *ab) for o in interested[name]}
+
+    results: Dict[str, Any] = {}
+    for outcome in outcomes:
+        ya, mask_a, err_a = f_a[outcome.name]
+        yb, mask_b, err_b = f_b[outcome.name]
+        ok = ~(mask_a | mask_b)
+        inputs = [name for name in A if name in fundamentals[outcome.name]]
+        for name in inputs:
+            ok &= ~f_ab[name][outcome.name][1]
+        if not ok.any():
+            results[outcome.name] = err_a or err_b or ValueError(f"Evaluation failed for {outcome.name}")
+            continue
 
-    # Sort by max abs delta for presentation (caller may sort again)
-    return dict(sorted(deltas.items(), key=lambda kv: max(abs(kv[1]["delta_minus"]), abs(kv[1]["delta_plus"])), reverse=True))
+        with np.errstate(all="ignore"):
+            variance = float(np.var(np.concatenate([ya[ok], yb[ok]])))
+            first: Dict[str, float] = {}
+            total: Dict[str, float] = {}
+            for name in inputs:
+                yab = f_ab[name][outcome.name][0][ok]
+                if variance > 0 and math.isfinite(variance):
+                    first[name] = float(np.mean(yb[ok] * (yab - ya[ok])) / variance)
+                    total[name] = float(0.5 * np.mean((ya[ok] - yab) ** 2) / variance)
+                else:
+                    first[name] = total[name] = 0.0
+        order = sorted(total, key=lambda k: total[k], reverse=True)
+        results[outcome.name] = {
+            "first_order": {k: first[k] for k in order},
+            "total_order": {k: total[k] for k in order},
+            "variance": variance,
+            "n": int(ok.sum()),
+        }
+    return results
 
 
 def regression_sensitivity(samples: Dict[str, Any], outcome_samples: Sequence[float]) -> Dict[str, float]:
@@ -32,6 +32,8 @@ import re
 from pathlib import Path
 from typing import Any, Dict
 
+from .compute_compiler import compile_compute, parse_compute_lambdas
+
 
 def validate_references(parameters: Dict[str, Dict[str, Any]], available_refs: set) -> tuple[list, list]:
     """
@@ -211,6 +213,10 @@ def validate_compute_inputs_match(parameters: Dict[str, Dict[str, Any]], params_
     - compute uses ctx["X"] but X is not in inputs list (will break uncertainty propagation)
     - inputs lists X but compute doesn't use ctx["X"] (unnecessary dependency)
 
+    The ctx["X"] references come from the AST of each compute lambda
+    (compute_compiler.parse_compute_lambdas), not from a text search of the
+    whole Parameter(...) definition.
+
     Args:
         parameters: Dict of parameter metadata
         params_file: Path to parameters.py file for source code inspection
@@ -223,7 +229,8 @@ def validate_compute_inputs_match(parameters: Dict[str, Dict[str, Any]], params_
     if not params_file or not params_file.exists():
         return issues
 
-    content = params_file.read_text(encoding="utf-8")
+    # ctx["X"] keys of each compute lambda, from the shared AST parse
+    parsed = parse_compute_lambdas(params_file)
 
     for param_name, param_data in parameters.items():
         value = param_data["value"]
@@ -232,37 +239,19 @@ def validate_compute_inputs_match(parameters: Dict[str, Dict[str, Any]], params_
         if not hasattr(value, 'compute') or not value.compute:
             continue
 
-        inputs = getattr(value, 'inputs', []) or []
-        input_set = set(inputs)
-
-        # Find the parameter definition in the source
-        start_pattern = rf'{param_name}\s*=\s*Parameter\('
-        start_match = re.search(start_pattern, content)
-        if not start_match:
+        # Aliases (OLD_NAME = NEW_NAME) share the lambda of the Parameter they point to
+        compiled = parsed.by_name.get(param_name) or compile_compute(value.compute)
+        if compiled is None:
             continue
 
-        start = start_match.start()
-
-        # Find matching closing paren
-        depth = 0
-        end = start
-        for i, c in enumerate(content[start:], start):
-            if c == '(':
-                depth += 1
-            elif c == ')':
-                depth -= 1
-                if depth == 0:
-                    end = i + 1
-                    break
-
-        param_def = content[start:end]
-
-        # Find all ctx["X"] references in the compute lambda
-        ctx_refs = set(re.findall(r'ctx\["([^"]+)"\]', param_def))
+        inputs = getattr(value, 'inputs', []) or []
+        input_set = set(inputs)
+        ctx_refs = set(compiled.inputs)
 
         # Check for mismatches
         missing_from_inputs = ctx_refs - input_set
-        extra_in_inputs = input_set - ctx_refs
+        # With computed ctx keys the used set is not known exactly
+        extra_in_inputs = set() if compiled.dynamic else input_set - ctx_refs
 
         if missing_from_inputs:
             issues.append((param_name, 'missing_from_inputs', sorted(missing_from_inputs)))
@@ -8,7 +8,8 @@ Fully programmatic survey generation from parameter metadata.
 
 Steps:
 1. Load parameters from parameters.py
-2. Load sensitivity analysis from _analysis/sensitivity.json (if exists)
+2. Load sensitivity analysis from _analysis/sensitivity.json and local
+   elasticities from _analysis/elasticities.json (if they exist)
 3. Analyze document usage from economics.qmd
 4. Rank parameters by composite importance
 5. Generate survey questions for top N parameters
@@ -31,6 +32,7 @@ if sys.platform == 'win32':
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dih_models import parameters as params_module
+from dih_models.elasticities import ELASTICITIES_FILE, load_elasticities
 from dih_models.survey_generator import generate_survey, rank_parameters
 from dih_models.usage_analyzer import analyze_document_usage
 
@@ -102,12 +104,15 @@ def main():
     sensitivity_data = load_sensitivity_data(sensitivity_path)
     if sensitivity_data:
         print(f"      Loaded sensitivity data for {len(sensitivity_data)} parameters")
-    else:
+    elasticity_data = load_elasticities(Path("_analysis") / ELASTICITIES_FILE)
+    if elasticity_data:
+        print(f"      Loaded elasticities for {len(elasticity_data['leaf_importance'])} input parameters")
+    elif not sensitivity_data:
         print(f"      No sensitivity data available - using usage and type only")
 
     # Step 4: Rank parameters by importance
     print(f"\n[4/5] Ranking parameters by composite importance...")
-    ranked = rank_parameters(parameters, sensitivity_data, usage_data)
+    ranked = rank_parameters(parameters, sensitivity_data, usage_data, elasticity_data)
 
     # Show top 10
     print(f"\n      Top 10 Parameters by Importance:")
@@ -126,7 +131,8 @@ def main():
         sensitivity_data=sensitivity_data,
         usage_data=usage_data,
         top_n=args.top_n,
-        focused=not args.comprehensive  # Default to focused mode
+        focused=not args.comprehensive,  # Default to focused mode
+        elasticity_data=elasticity_data
     )
 
     # Count total questions
@@ -24,6 +24,71 @@ Options:
     --inject-citations    Add [@citation] tags to economics.qmd variables
                           (legacy option, use --cite-mode=inline instead)
 
+    --recompute-outcomes  Re-evaluate each outcome's compute() per Monte Carlo
+                          sample instead of reusing the propagated samples
+
+    --no-cache            Ignore the content-addressed build cache in
+                          _analysis/.build-cache.json and regenerate every
+                          figure/analysis artifact (unchanged files are still
+                          left untouched)
+
+    --tornado-mode=MODE   How tornado deltas are evaluated:
+                          - incremental: memoized per-leaf graph evaluation (default)
+                          - batched: all low/high perturbations as one vectorized sweep
+
+    --sampler=MODE        Monte Carlo sampling strategy for the leaf parameters:
+                          - random: independent pseudo-random draws, 10,000 samples (default)
+                          - lhs: joint Latin Hypercube design, 1,024 samples
+                          - sobol: joint scrambled Sobol sequence, 1,024 samples
+                          - halton: joint scrambled Halton sequence, 1,024 samples
+                          The design-based samplers reach the same percentile
+                          accuracy with ~1/10 of the samples (seeded with 42)
+
+    --correlated          Impose the rank correlations in
+                          dih_models/parameters.py INPUT_RANK_CORRELATIONS on the
+                          sampled inputs (Iman-Conover reordering) instead of
+                          sampling them independently
+
+    --adaptive[=TOL]      Stop sampling each outcome once its mean/p5/p95 are
+                          within a relative tolerance TOL (default 0.01) instead
+                          of always drawing the full sample count (10,000 is then
+                          the cap for every sampler); the achieved
+                          precision is reported per outcome in _analysis/outcomes.json
+
+    --jobs=N              Worker processes for writing per-outcome figure QMDs and
+                          analysis JSON (default: number of CPUs; 1 = serial).
+                          Output is identical to a serial run
+
+    --sobol               Also compute variance-based (Sobol) sensitivity indices
+                          via Saltelli sampling, write them to
+                          _analysis/sobol_indices_{name}.json and use them for
+                          the sensitivity tables instead of regression coefficients
+
+    --chart-backend=MODE  How tornado/distribution/MC/exceedance charts are produced:
+                          - qmd: QMDs with python cells that plot at render time (default)
+                          - batch: render every PNG here in one multiprocess pass
+                            (--jobs workers) and write QMDs that only reference
+                            the image, so Quarto executes no code for them
+
+    --stages=A,B          Run only the named stages (references, parameters,
+                          variables, bibtex, typescript, uncertainty, appendix,
+                          outline); references.qmd and parameters.py are still
+                          parsed whenever a stage needs them
+
+    --if-changed          Run only the stages whose inputs (parameters.py,
+                          references.qmd, generator sources, flags) or outputs
+                          changed since their last successful run, per the stage
+                          graph in dih_models/pipeline_stages.py; exits at once
+                          when everything is up to date (used by the pre-render hook)
+
+    --profile[=MODE]      Also profile the whole run at function level:
+                          - cprofile: dump _analysis/pipeline-profile.prof (default)
+                          - pyinstrument: write _analysis/pipeline-profile.html
+                            (requires pyinstrument; falls back to cprofile)
+                          Stage timings, compute-lambda call counts, sample-matrix
+                          size and per-outcome times are always written to
+                          _analysis/pipeline-profile.json
+
 Examples:
     # Default: no citations
     python scripts/generate-everything-parameters-variables-calculations-references.py
@@ -45,11 +110,14 @@ Output:
 The generated files enable academic rigor with zero manual maintenance.
 """
 
+import multiprocessing
+import os
 import re
 import subprocess
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
 import yaml
 
@@ -62,6 +130,8 @@ from generate_references_json import generate_references_json  # noqa: E402
 
 # Import all generator modules
 from dih_models.bibtex_generator import generate_bibtex
+from dih_models.build_cache import BuildCache, write_json_if_changed
+from dih_models.chart_renderer import CHART_BACKENDS, ChartBatch, render_chart_batch, write_code_qmds
 from dih_models.chart_generators import (
     generate_tornado_chart_qmd,
     generate_sensitivity_table_qmd,
@@ -69,6 +139,9 @@ from dih_models.chart_generators import (
     generate_monte_carlo_distribution_chart_qmd,
     generate_cdf_chart_qmd,
 )
+from dih_models.parameter_graph import ParameterGraph, has_uncertainty
+from dih_models.pipeline_profile import PROFILE_FILE, PROFILE_MODES, PROFILER, run_profiled
+from dih_models.pipeline_stages import STAGE_NAMES, StagePlan, get_stage, stage_settings
 from dih_models.latex_generation import (
     generate_auto_latex,
     format_latex_value,
@@ -290,63 +363,14 @@ def inject_citations_into_qmd(parameters: Dict[str, Dict[str, Any]], qmd_path: P
         print("[OK] No citation injection needed (already present or no external params)")
 
 
-# Chart generation functions moved to scripts/chart_generators.py
-# - generate_tornado_chart_qmd() -> chart_generators
-# - generate_sensitivity_table_qmd() -> chart_generators
-# - generate_input_distribution_chart_qmd() -> chart_generators
-# - generate_monte_carlo_distribution_chart_qmd() -> chart_generators
-# - generate_cdf_chart_qmd() -> chart_generators
-
-
-def main():
-    # Parse command-line arguments
-    inject_citations = "--inject-citations" in sys.argv
-
-    # Citation mode: --cite-mode=inline|separate|both|none
-    citation_mode = "separate"  # Default: always generate _cite variables for convenience
-    for arg in sys.argv:
-        if arg.startswith("--cite-mode="):
-            citation_mode = arg.split("=")[1]
-            if citation_mode not in ("none", "inline", "separate", "both"):
-                print(f"[ERROR] Invalid citation mode: {citation_mode}", file=sys.stderr)
-                print("Valid modes: none, inline, separate, both", file=sys.stderr)
-                sys.exit(1)
-
-    # Get project root
-    project_root = Path(__file__).parent.parent.absolute()
-
-    # Parse references.qmd FIRST (before parameters.py, to avoid circular dependency)
-    print("[*] Parsing knowledge/references.qmd...")
-    references_path = project_root / "knowledge" / "references.qmd"
-    available_refs = parse_references_qmd(references_path)
-    print(f"[OK] Found {len(available_refs)} reference entries")
-    print()
-
-    # Generate references.json from references.qmd
-    print("[*] Generating knowledge/references.json...")
-    references_json_path = project_root / "knowledge" / "references.json"
-    generate_references_json(references_path, references_json_path)
-    print()
-
-    # Generate reference_ids.py enum SECOND (before loading parameters.py which imports it)
-    print("[*] Generating dih_models/reference_ids.py...")
-    reference_ids_path = project_root / "dih_models" / "reference_ids.py"
-    generate_reference_ids_enum(available_refs, reference_ids_path)
-
-    # Initialize uncertainty module now that dependencies are ready
-    init_uncertainty()
-
-    # Parse parameters file THIRD (now reference_ids.py is up to date)
-    parameters_path = project_root / "dih_models" / "parameters.py"
-    if not parameters_path.exists():
-        print(f"[ERROR] Parameters file not found: {parameters_path}", file=sys.stderr)
-        sys.exit(1)
-
-    print(f"[*] Parsing {parameters_path}...")
-    parameters = parse_parameters_file(parameters_path)
-    print(f"[OK] Found {len(parameters)} numeric parameters")
-    print()
+def validate_parameters(
+    parameters: Dict[str, Dict[str, Any]], available_refs: Any, references_path: Path, parameters_path: Path
+) -> bool:
+    """
+    Run the parameter validations, printing each result.
 
+    Returns True if any fatal validation error was found.
+    """
     # Track fatal validation errors
     has_fatal_error = False
 
@@ -465,39 +489,447 @@ def main():
         print("[OK] All inline calculations have inputs/compute metadata")
         print()
 
-    # Exit early if validation errors found
-    if has_fatal_error:
-        print("[FATAL] Validation errors found. Fix the issues above before continuing.", file=sys.stderr)
-        sys.exit(1)
+    return has_fatal_error
 
-    # Generate _variables.yml
-    print(f"[*] Generating _variables.yml (citation mode: {citation_mode})...")
-    output_path = project_root / "_variables.yml"
-    generate_variables_yml(parameters, output_path, citation_mode=citation_mode, params_file=parameters_path)
-    print()
 
-    # Generate references.bib (with full citation data from references.qmd)
-    print("[*] Generating references.bib...")
-    bib_output = project_root / "references.bib"
-    generate_bibtex(parameters, bib_output, available_refs=available_refs, references_path=references_path)
-    print()
+def regenerate_outline(project_root: Path) -> bool:
+    """Regenerate OUTLINE-GENERATED.MD from chapter headings; True on success."""
+    print("[*] Regenerating outline from chapter headings...")
+    generate_outline_script = project_root / "scripts" / "generate-outline.py"
+    if not generate_outline_script.exists():
+        print(f"[WARN] Outline script not found: {generate_outline_script}", file=sys.stderr)
+        return False
+    try:
+        result = subprocess.run(
+            [sys.executable, str(generate_outline_script), "--output", "OUTLINE-GENERATED.MD"],
+            cwd=str(project_root),
+            capture_output=True,
+            text=True,
+            encoding='utf-8'
+        )
+    except Exception as e:
+        print(f"[WARN] Could not regenerate outline: {e}", file=sys.stderr)
+        return False
+    if result.returncode != 0:
+        print(f"[WARN] Outline generation had issues: {result.stderr}", file=sys.stderr)
+        return False
+    print("[OK] Outline regenerated")
+    return True
+
+
+# Chart generation functions moved to scripts/chart_generators.py
+# - generate_tornado_chart_qmd() -> chart_generators
+# - generate_sensitivity_table_qmd() -> chart_generators
+# - generate_input_distribution_chart_qmd() -> chart_generators
+# - generate_monte_carlo_distribution_chart_qmd() -> chart_generators
+# - generate_cdf_chart_qmd() -> chart_generators
 
-    # Generate TypeScript parameters file for Next.js/React apps
-    print("[*] Generating TypeScript parameters file...")
+
+# State shared with outcome workers. It is filled in before the pool forks, so
+# workers inherit the sample arrays and Parameter objects (whose compute
+# lambdas cannot be pickled) copy-on-write instead of receiving copies.
+_OUTCOME_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _outcome_workers(requested: int, n_tasks: int) -> int:
+    """Number of worker processes to use for `n_tasks` outcome jobs."""
+    if requested <= 1 or n_tasks < 2:
+        return 1
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return 1  # Workers rely on inheriting state; run serially elsewhere
+    return min(requested, n_tasks)
+
+
+def _run_outcome_jobs(n_tasks: int, workers: int) -> List[Dict[str, Any]]:
+    """Run `_emit_outcome_artifacts` for every job, returning results in job order."""
+    if workers <= 1:
+        return [_timed_outcome_job(i) for i in range(n_tasks)]
+    with multiprocessing.get_context("fork").Pool(workers) as pool:
+        return pool.map(_timed_outcome_job, range(n_tasks), chunksize=1)
+
+
+def _timed_outcome_job(index: int) -> Dict[str, Any]:
+    """`_emit_outcome_artifacts` plus its wall time in the result's "seconds"."""
+    start = time.perf_counter()
+    result = _emit_outcome_artifacts(index)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _render_charts(jobs: List[Any], workers: int, project_root: Path) -> set:
+    """Render batch-backend chart PNGs, report failures, and return the failed paths.
+
+    Failed charts get their code-executing QMD back, so Quarto runs (and
+    reports) the chart code instead of linking a missing PNG.
+    """
+    start = time.perf_counter()
+    report = render_chart_batch(jobs, workers)
+    failures = report["failures"]
+    print(f"[OK] Rendered {len(jobs) - len(failures)} chart PNGs with {report['workers']} worker process(es) "
+          f"in {time.perf_counter() - start:.1f}s")
+    write_code_qmds(jobs, failures)
+    for png, error in sorted(failures.items()):
+        reason = error.strip().splitlines()[-1] if error.strip() else "unknown error"
+        print(f"[WARN] Failed to render {Path(png).relative_to(project_root)}: {reason} (kept the code-executing QMD)")
+    return {Path(png) for png in failures}
+
+
+def _emit_outcome_artifacts(index: int) -> Dict[str, Any]:
+    """Write the tornado, sensitivity, MC distribution and exceedance artifacts of one outcome.
+
+    Runs in a worker process (or inline for serial runs). Console output is
+    collected instead of printed so the parent can replay it in outcome order.
+
+    Returns a dict with:
+        artifacts: Paths written (or left unchanged) for this outcome
+        charts: Chart render jobs queued for the batch chart backend
+        messages: List of (stream, text) to print, stream "stdout" or "stderr"
+        complete: True if every artifact was generated cleanly (safe to cache)
+        fatal: True if the run must stop (incomplete tornado data)
+    """
+    state = _OUTCOME_WORKER_STATE
+    np = state["np"]
+    parameters = state["parameters"]
+    analysis_dir = state["analysis_dir"]
+    figures_dir = state["figures_dir"]
+    outcome, baseline, input_sims, outcome_samples, sample_digest = state["jobs"][index]
+
+    outcome_artifacts = []
+    messages = []
+    outcome_complete = True
+    chart_batch = ChartBatch(state["project_root"]) if state["chart_backend"] == "batch" else None
+    result = {"artifacts": outcome_artifacts, "charts": [], "messages": messages, "complete": False, "fatal": False}
+
+    try:
+        # Tornado deltas for this outcome
+        tornado = state["tornado_results"][outcome.name]
+        if isinstance(tornado, Exception):
+            raise tornado
+        tornado_json = analysis_dir / f"tornado_{outcome.name}.json"
+        write_json_if_changed(tornado_json, tornado)
+        outcome_artifacts.append(tornado_json)
+
+        # Generate tornado chart QMD
+        param_meta = parameters.get(outcome.name, {})
+        try:
+            tornado_qmd = generate_tornado_chart_qmd(
+                outcome.name, tornado, figures_dir, param_meta,
+                baseline=float(baseline),
+                units=outcome.units,
+                batch=chart_batch,
+            )
+            outcome_artifacts.append(tornado_qmd)
+        except ValueError as val_err:
+            # STRICT MODE: Fail fast when tornado data is incomplete
+            # This forces developers to either:
+            # 1. Add proper inputs/compute to intermediate calculated parameters
+            # 2. Change source_type to "definition" if not truly calculated
+            # 3. Add uncertainty distributions to leaf input parameters
+            messages.extend(("stderr", line) for line in (
+                f"[ERROR] {val_err}",
+                f"[ERROR] Parameter '{outcome.name}' has inputs/compute but no tornado sensitivity.",
+                "[ERROR] This usually means:",
+                "[ERROR]   - Input parameters need uncertainty distributions (std_error, confidence_interval, or distribution)",
+                "[ERROR]   - OR intermediate inputs need their own inputs/compute definitions",
+                "[ERROR]   - OR this should be source_type='definition' instead of 'calculated'",
+            ))
+            result["fatal"] = True
+            return result
+        except Exception as chart_err:
+            messages.append(("stderr", f"[ERROR] Failed to generate tornado chart for {outcome.name}: {chart_err}"))
+            result["fatal"] = True
+            return result
+
+        # Regression sensitivity indices (filter out zero-variance inputs)
+        filtered_input_sims = {}
+        for inp_name, inp_vals in input_sims.items():
+            if np is not None:
+                std = float(np.std(np.asarray(inp_vals)))
+            else:
+                vals = list(inp_vals)
+                mean = sum(vals) / len(vals)
+                variance = sum((v - mean) ** 2 for v in vals) / len(vals)
+                std = variance ** 0.5
+
+            # Only include inputs that actually vary
+            if std > 1e-10:
+                filtered_input_sims[inp_name] = inp_vals
+
+        if filtered_input_sims:
+            sens_indices = regression_sensitivity(filtered_input_sims, outcome_samples)
+        else:
+            sens_indices = {inp: 0.0 for inp in input_sims.keys()}
+
+        sens_json = analysis_dir / f"sensitivity_indices_{outcome.name}.json"
+        write_json_if_changed(sens_json, sens_indices)
+        outcome_artifacts.append(sens_json)
+
+        # Variance-based indices replace the regression table when requested
+        table_data, table_method = sens_indices, "regression"
+        sobol = state["sobol_results"].get(outcome.name)
+        if isinstance(sobol, Exception):
+            outcome_complete = False
+            messages.append(("stdout", f"[WARN] Failed to compute Sobol indices for {outcome.name}: {sobol}"))
+        elif sobol is not None:
+            sobol_json = analysis_dir / f"sobol_indices_{outcome.name}.json"
+            write_json_if_changed(sobol_json, sobol)
+            outcome_artifacts.append(sobol_json)
+            table_data, table_method = sobol, "sobol"
+
+        # Generate sensitivity table QMD only if there's meaningful variance
+        # Skip tables where all coefficients are effectively zero (< 0.001)
+        table_values = table_data["total_order"] if table_method == "sobol" else table_data
+        max_coef = max(abs(v) for v in table_values.values()) if table_values else 0
+        if max_coef >= 0.001:
+            try:
+                sens_qmd = generate_sensitivity_table_qmd(
+                    outcome.name, table_data, figures_dir, param_meta, method=table_method
+                )
+                outcome_artifacts.append(sens_qmd)
+            except Exception as table_err:
+                outcome_complete = False
+                messages.append(("stdout", f"[WARN] Failed to generate sensitivity table for {outcome.name}: {table_err}"))
+
+        # Generate Monte Carlo distribution chart
+        # Skip if zero variance (all samples identical) - these are meaningless
+        try:
+            outcome_info = state["outcomes_data"].get(outcome.name, {})
+            outcome_std = outcome_info.get("std", 0)
+            if outcome_samples and len(outcome_samples) > 100 and outcome_std > 0:
+                mc_qmd = generate_monte_carlo_distribution_chart_qmd(
+                    outcome.name,
+                    outcome_info,
+                    outcome_samples,
+                    figures_dir,
+                    param_meta,
+                    sample_digest=sample_digest,
+                    batch=chart_batch,
+                )
+                outcome_artifacts.append(mc_qmd)
+
+                # Generate standalone CDF/exceedance chart
+                cdf_qmd = generate_cdf_chart_qmd(
+                    outcome.name,
+                    outcome_samples,
+                    figures_dir,
+                    param_meta,
+                    sample_digest=sample_digest,
+                    batch=chart_batch,
+                )
+                outcome_artifacts.append(cdf_qmd)
+            elif outcome_samples and outcome_std == 0:
+                messages.append(("stdout", f"[SKIP] MC distribution chart for {outcome.name}: zero variance (deterministic)"))
+        except Exception as mc_err:
+            outcome_complete = False
+            messages.append(("stdout", f"[WARN] Failed to generate MC distribution charts for {outcome.name}: {mc_err}"))
+    except Exception as e:
+        messages.append(("stdout", f"[WARN] Skipped outcome {outcome.name}: {e}"))
+        return result
+
+    if chart_batch is not None:
+        # Rendered by the parent in one pass over all outcomes
+        result["charts"] = chart_batch.jobs
+        outcome_artifacts.extend(chart_batch.png_paths)
+    result["complete"] = outcome_complete
+    return result
+
+
+def main():
+    # Parse command-line arguments
+    inject_citations = "--inject-citations" in sys.argv
+    recompute_outcomes = "--recompute-outcomes" in sys.argv
+    use_cache = "--no-cache" not in sys.argv
+    use_sobol = "--sobol" in sys.argv
+    use_correlations = "--correlated" in sys.argv
+
+    n_jobs = os.cpu_count() or 1
+    for arg in sys.argv:
+        if arg.startswith("--jobs="):
+            try:
+                n_jobs = int(arg.split("=")[1])
+            except ValueError:
+                n_jobs = 0
+            if n_jobs < 1:
+                print(f"[ERROR] Invalid job count: {arg.split('=')[1]}", file=sys.stderr)
+                sys.exit(1)
+
+    adaptive_tolerance = None
+    for arg in sys.argv:
+        if arg == "--adaptive":
+            adaptive_tolerance = 0.01
+        elif arg.startswith("--adaptive="):
+            try:
+                adaptive_tolerance = float(arg.split("=")[1])
+            except ValueError:
+                adaptive_tolerance = -1.0
+            if not adaptive_tolerance > 0:
+                print(f"[ERROR] Invalid adaptive tolerance: {arg.split('=')[1]}", file=sys.stderr)
+                sys.exit(1)
+
+    sampler = "random"
+    for arg in sys.argv:
+        if arg.startswith("--sampler="):
+            sampler = arg.split("=")[1]
+            if sampler not in ("random", "lhs", "sobol", "halton"):
+                print(f"[ERROR] Invalid sampler: {sampler}", file=sys.stderr)
+                print("Valid samplers: random, lhs, sobol, halton", file=sys.stderr)
+                sys.exit(1)
+
+    chart_backend = "qmd"
+    for arg in sys.argv:
+        if arg.startswith("--chart-backend="):
+            chart_backend = arg.split("=")[1]
+            if chart_backend not in CHART_BACKENDS:
+                print(f"[ERROR] Invalid chart backend: {chart_backend}", file=sys.stderr)
+                print(f"Valid backends: {', '.join(CHART_BACKENDS)}", file=sys.stderr)
+                sys.exit(1)
+
+    tornado_mode = "incremental"
+    for arg in sys.argv:
+        if arg.startswith("--tornado-mode="):
+            tornado_mode = arg.split("=")[1]
+            if tornado_mode not in ("incremental", "batched"):
+                print(f"[ERROR] Invalid tornado mode: {tornado_mode}", file=sys.stderr)
+                print("Valid modes: incremental, batched", file=sys.stderr)
+                sys.exit(1)
+
+    # Citation mode: --cite-mode=inline|separate|both|none
+    citation_mode = "separate"  # Default: always generate _cite variables for convenience
+    for arg in sys.argv:
+        if arg.startswith("--cite-mode="):
+            citation_mode = arg.split("=")[1]
+            if citation_mode not in ("none", "inline", "separate", "both"):
+                print(f"[ERROR] Invalid citation mode: {citation_mode}", file=sys.stderr)
+                print("Valid modes: none, inline, separate, both", file=sys.stderr)
+                sys.exit(1)
+
+    # Get project root
+    project_root = Path(__file__).parent.parent.absolute()
+
+    # Stages to run: all by default, --stages=a,b to pick, --if-changed for stale ones only
+    plan = StagePlan(project_root, settings=stage_settings(sys.argv[1:]))
+    stale_stages = plan.stale()
+    run_stages = list(STAGE_NAMES)
+    for arg in sys.argv:
+        if arg.startswith("--stages="):
+            requested = {name.strip() for name in arg.split("=")[1].split(",") if name.strip()}
+            unknown = sorted(requested - set(STAGE_NAMES))
+            if unknown:
+                print(f"[ERROR] Unknown stage(s): {', '.join(unknown)}", file=sys.stderr)
+                print(f"Valid stages: {', '.join(STAGE_NAMES)}", file=sys.stderr)
+                sys.exit(1)
+            run_stages = [name for name in STAGE_NAMES if name in requested]
+    if "--if-changed" in sys.argv:
+        run_stages = [name for name in run_stages if name in stale_stages]
+        if not run_stages:
+            print("[OK] Generated outputs are up to date (no stage inputs changed)")
+            return
+    if run_stages != list(STAGE_NAMES):
+        print(f"[*] Running stages: {', '.join(run_stages)}")
+        print()
+    load_inputs = any(get_stage(name).loads_inputs for name in run_stages)
+
+    references_path = project_root / "knowledge" / "references.qmd"
+    references_json_path = project_root / "knowledge" / "references.json"
+    reference_ids_path = project_root / "dih_models" / "reference_ids.py"
+    parameters_path = project_root / "dih_models" / "parameters.py"
+    output_path = project_root / "_variables.yml"
+    bib_output = project_root / "references.bib"
     ts_output = project_root / "dih_models" / "parameters-calculations-citations.ts"
-    generate_typescript_parameters(parameters, ts_output, include_metadata=True, references_path=references_path)
-    print()
+    qmd_output = project_root / "knowledge" / "appendix" / "parameters-and-calculations.qmd"
+    available_refs = {}
+    parameters = {}
 
-    # Generate TypeScript survey file (if survey exists)
-    print("[*] Generating TypeScript survey file...")
-    survey_json = project_root / "_analysis" / "economist-survey.json"
-    ts_survey_output = project_root / "dih_models" / "economist-survey.ts"
-    generate_typescript_survey(survey_json, ts_survey_output)
-    print()
+    # Parse references.qmd FIRST (before parameters.py, to avoid circular dependency)
+    if load_inputs:
+        print("[*] Parsing knowledge/references.qmd...")
+        with PROFILER.stage("parse.references"):
+            available_refs = parse_references_qmd(references_path)
+        print(f"[OK] Found {len(available_refs)} reference entries")
+        print()
+
+    if "references" in run_stages:
+        PROFILER.start("references")
+        # Generate references.json from references.qmd
+        print("[*] Generating knowledge/references.json...")
+        generate_references_json(references_path, references_json_path)
+        print()
+
+        # Generate reference_ids.py enum SECOND (before loading parameters.py which imports it)
+        print("[*] Generating dih_models/reference_ids.py...")
+        generate_reference_ids_enum(available_refs, reference_ids_path)
+        PROFILER.stop("references")
+        plan.complete("references")
+
+    if load_inputs:
+        # Initialize uncertainty module now that dependencies are ready
+        init_uncertainty()
+
+        # Parse parameters file THIRD (now reference_ids.py is up to date)
+        if not parameters_path.exists():
+            print(f"[ERROR] Parameters file not found: {parameters_path}", file=sys.stderr)
+            sys.exit(1)
+
+        print(f"[*] Parsing {parameters_path}...")
+        with PROFILER.stage("parse.parameters"):
+            parameters = parse_parameters_file(parameters_path)
+        PROFILER.gauge("parameters", len(parameters))
+        print(f"[OK] Found {len(parameters)} numeric parameters")
+
+    if "parameters" in run_stages:
+        PROFILER.start("parameters")
+        # Precompiled value table for dih_models.params_fast (QMD renders skip the full import)
+        from dih_models.params_fast import DEFAULT_SNAPSHOT_PATH, write_parameter_snapshot
+
+        if write_parameter_snapshot({name: meta["value"] for name, meta in parameters.items()}):
+            print(f"[OK] Wrote parameter snapshot {Path(DEFAULT_SNAPSHOT_PATH).relative_to(project_root)}")
+        print()
+
+        # Exit early if validation errors found
+        if validate_parameters(parameters, available_refs, references_path, parameters_path):
+            print("[FATAL] Validation errors found. Fix the issues above before continuing.", file=sys.stderr)
+            sys.exit(1)
+        PROFILER.stop("parameters")
+        plan.complete("parameters")
+    elif load_inputs:
+        print()
+
+    if "variables" in run_stages:
+        # Generate _variables.yml
+        print(f"[*] Generating _variables.yml (citation mode: {citation_mode})...")
+        with PROFILER.stage("variables"):
+            generate_variables_yml(parameters, output_path, citation_mode=citation_mode, params_file=parameters_path)
+        plan.complete("variables")
+        print()
+
+    if "bibtex" in run_stages:
+        # Generate references.bib (with full citation data from references.qmd)
+        print("[*] Generating references.bib...")
+        with PROFILER.stage("bibtex"):
+            generate_bibtex(parameters, bib_output, available_refs=available_refs, references_path=references_path)
+        plan.complete("bibtex")
+        print()
+
+    if "typescript" in run_stages:
+        PROFILER.start("typescript")
+        # Generate TypeScript parameters file for Next.js/React apps
+        print("[*] Generating TypeScript parameters file...")
+        generate_typescript_parameters(parameters, ts_output, include_metadata=True, references_path=references_path)
+        print()
+
+        # Generate TypeScript survey file (if survey exists)
+        print("[*] Generating TypeScript survey file...")
+        survey_json = project_root / "_analysis" / "economist-survey.json"
+        ts_survey_output = project_root / "dih_models" / "economist-survey.ts"
+        generate_typescript_survey(survey_json, ts_survey_output)
+        PROFILER.stop("typescript")
+        plan.complete("typescript")
+        print()
 
-    # Always generate uncertainty outputs when module is available
+    # Generate uncertainty outputs when the stage runs and the module is available
     try:
-        if simulate is not None:
+        if "uncertainty" in run_stages and simulate is not None:
+            PROFILER.start("uncertainty")
             print("[*] Generating uncertainty summaries...")
             # Choose a target calculated parameter if any
             target = next((name for name, meta in parameters.items()
@@ -505,26 +937,84 @@ def main():
             # Summaries directory
             analysis_dir = project_root / "_analysis"
 
-            # Clean up stale analysis files before regenerating
-            # This handles deleted/renamed parameters that would leave orphan files
-            if analysis_dir.exists():
-                import shutil
-                stale_count = len(list(analysis_dir.glob("*.json")))
-                if stale_count > 0:
-                    print(f"[*] Cleaning {stale_count} stale analysis files...")
-                    shutil.rmtree(analysis_dir)
-
             analysis_dir.mkdir(exist_ok=True)
+
+            # Content-addressed cache: artifacts whose parameter metadata, upstream
+            # closure and generator version are unchanged are not regenerated.
+            # Stale/orphaned files are removed after generation instead of up front.
+            build_cache = BuildCache(analysis_dir / ".build-cache.json", project_root, enabled=use_cache)
             # Minimal inline summary generation to avoid duplicating logic
-            from dih_models.uncertainty import simulate_with_propagation as _sim, one_at_a_time_sensitivity as _sens
+            from dih_models.uncertainty import (
+                simulate_with_propagation as _sim,
+                simulate_adaptive,
+                one_at_a_time_sensitivity as _sens,
+                TornadoEngine,
+                tornado_deltas_batched,
+                sobol_indices,
+            )
+            from dih_models.elasticities import ELASTICITIES_FILE, compute_elasticities, write_elasticities
             # Use fixed seed for reproducibility (avoids git churn from random variation)
             RANDOM_SEED = 42
-            sims = _sim(parameters, n=10000, seed=RANDOM_SEED)
-            import json
+            # Space-filling designs converge ~10x faster than pseudo-random draws;
+            # adaptive runs use the full count as a cap and stop early instead
+            N_SAMPLES = 10000 if sampler == "random" or adaptive_tolerance is not None else 1024
+            # Base sample size per Saltelli matrix (cost is N_SOBOL * (k + 2) rows)
+            N_SOBOL = 1024
+            # Points per axis of the treaty size x discount rate scenario sweep
+            SWEEP_POINTS = 100
+            SWEEP_FILE = "scenario-sweep.npz"
+            run_settings = f"n={N_SAMPLES};seed={RANDOM_SEED}"
+            if sampler != "random":
+                run_settings += f";sampler={sampler}"
+            if adaptive_tolerance is not None:
+                run_settings += f";adaptive={adaptive_tolerance}"
+            input_correlations = None
+            if use_correlations:
+                from dih_models.parameters import INPUT_RANK_CORRELATIONS as input_correlations
+                unknown = sorted({n for pair in input_correlations for n in pair if n not in parameters})
+                if unknown:
+                    print(f"[WARN] INPUT_RANK_CORRELATIONS names unknown parameters: {', '.join(unknown)}")
+                run_settings += f";correlations={sorted(input_correlations.items())}"
+            if use_sobol:
+                run_settings += f";sobol={N_SOBOL}"
+            # Batch-rendered charts are different artifacts (static QMD + PNG)
+            chart_settings = ("charts=batch",) if chart_backend == "batch" else ()
+            run_settings += "".join(f";{setting}" for setting in chart_settings)
+            # Dependency DAG built once and shared by propagation and tornado analysis
+            param_graph = ParameterGraph(parameters)
+            try:
+                param_graph.check_acyclic()
+            except ValueError as cycle_err:
+                # Propagation and the outcome analysis skip these (see _propagate)
+                print(f"[WARN] {cycle_err} - skipped in the uncertainty analysis")
+            sim_precision = {}
+            unpropagated = set()  # Calculated parameters left with their base samples
+            PROFILER.start("uncertainty.sampling")
+            if adaptive_tolerance is not None:
+                sims, sim_precision = simulate_adaptive(
+                    parameters, tolerance=adaptive_tolerance, max_n=N_SAMPLES,
+                    seed=RANDOM_SEED, graph=param_graph, sampler=sampler,
+                    correlations=input_correlations, unpropagated=unpropagated,
+                )
+                converged = sum(1 for p in sim_precision.values() if p["converged"])
+                print(f"[*] Adaptive Monte Carlo: {converged}/{len(sim_precision)} outcomes converged "
+                      f"within {adaptive_tolerance:g} (max {N_SAMPLES} samples)")
+            else:
+                sims = _sim(
+                    parameters, n=N_SAMPLES, seed=RANDOM_SEED, graph=param_graph,
+                    sampler=sampler, correlations=input_correlations, unpropagated=unpropagated,
+                )
+            PROFILER.stop("uncertainty.sampling")
             try:
                 import numpy as np
             except Exception:
                 np = None  # type: ignore
+            if np is not None and sims:
+                PROFILER.gauge("sample_matrix", {
+                    "rows": max(len(arr) for arr in sims.values()),
+                    "columns": len(sims),
+                    "bytes": sum(np.asarray(arr).nbytes for arr in sims.values()),
+                })
             summaries = {}
             for name, arr in sims.items():
                 if np is not None:
@@ -553,39 +1043,71 @@ def main():
                         "p50": pct(50),
                         "p95": pct(95),
                     }
-            with open(analysis_dir / "samples.json", "w", encoding="utf-8") as f:
-                json.dump(summaries, f, indent=2)
+            write_json_if_changed(analysis_dir / "samples.json", summaries)
             print(f"[OK] Wrote {(analysis_dir / 'samples.json').relative_to(project_root)}")
 
+            # Raw samples as a memory-mappable store; chart QMDs load their column from it
+            sample_digests = {}
+            if np is not None:
+                from dih_models.sample_store import SAMPLES_FILE, write_sample_store
+                with PROFILER.stage("uncertainty.sample_store"):
+                    sample_digests = write_sample_store(sims, analysis_dir)
+                print(f"[OK] Wrote {(analysis_dir / SAMPLES_FILE).relative_to(project_root)} ({len(sample_digests)} columns)")
+
             # Generate input distribution charts for parameters with uncertainty metadata
+            PROFILER.start("uncertainty.distribution_charts")
             print("[*] Generating input distribution charts...")
             input_dist_figures_dir = project_root / "knowledge" / "figures"
             input_dist_figures_dir.mkdir(parents=True, exist_ok=True)
 
-            # First, delete stale QMD files (we regenerate all)
-            stale_dist_qmd = list(input_dist_figures_dir.glob("distribution-*.qmd"))
-            if stale_dist_qmd:
-                print(f"[*] Cleaning {len(stale_dist_qmd)} existing distribution QMD files...")
-                for f in stale_dist_qmd:
-                    f.unlink()
-
             input_dist_count = 0
             input_dist_errors = []
-            generated_dist_qmds = set()  # Track what we generate
+            generated_dist_qmds = set()  # Track what we generate (or keep from cache)
+            dist_chart_jobs = []  # Batch backend: PNGs to render after the loop
+            dist_records = []  # Batch backend: cache entries recorded once their PNG exists
             for param_name, param_data in parameters.items():
                 try:
+                    dist_key = build_cache.parameter_key(param_graph, param_name, *chart_settings)
+                    cached = build_cache.lookup(f"distribution:{param_name}", dist_key)
+                    if cached is not None:
+                        if cached:  # An empty entry records a parameter without a distribution
+                            generated_dist_qmds.update(p.name for p in cached if p.suffix == ".qmd")
+                            input_dist_count += 1
+                        continue
                     # Only generate for parameters with uncertainty metadata
-                    dist_file = generate_input_distribution_chart_qmd(
-                        param_name, param_data, input_dist_figures_dir
-                    )
+                    chart_batch = ChartBatch(project_root) if chart_backend == "batch" else None
+                    try:
+                        dist_file = generate_input_distribution_chart_qmd(
+                            param_name, param_data, input_dist_figures_dir, batch=chart_batch
+                        )
+                    except ValueError:
+                        # Parameter doesn't have uncertainty metadata - skip silently, and
+                        # remember that so warm runs don't count it as a miss
+                        build_cache.record(f"distribution:{param_name}", dist_key, [])
+                        continue
+                    if chart_batch is None:
+                        build_cache.record(f"distribution:{param_name}", dist_key, [dist_file])
+                    else:
+                        dist_chart_jobs.extend(chart_batch.jobs)
+                        dist_records.append((f"distribution:{param_name}", dist_key, [dist_file, *chart_batch.png_paths]))
                     generated_dist_qmds.add(dist_file.name)
                     input_dist_count += 1
-                except ValueError:
-                    # Parameter doesn't have uncertainty metadata - skip silently
-                    pass
                 except Exception as e:
                     input_dist_errors.append(f"{param_name}: {e}")
 
+            if dist_chart_jobs:
+                failed_pngs = _render_charts(dist_chart_jobs, n_jobs, project_root)
+                for entry, key, artifacts in dist_records:
+                    if not failed_pngs.intersection(artifacts):
+                        build_cache.record(entry, key, artifacts)
+
+            # Clean up QMDs for parameters that no longer have distributions
+            stale_dist_qmd = [f for f in input_dist_figures_dir.glob("distribution-*.qmd") if f.name not in generated_dist_qmds]
+            if stale_dist_qmd:
+                print(f"[*] Cleaning {len(stale_dist_qmd)} stale distribution QMD files...")
+                for f in stale_dist_qmd:
+                    f.unlink()
+
             # Clean up orphaned PNG files (PNGs without matching QMD)
             orphaned_dist_pngs = []
             for png_file in input_dist_figures_dir.glob("distribution-*.png"):
@@ -600,36 +1122,27 @@ def main():
             print(f"[OK] Generated {input_dist_count} input distribution charts in knowledge/figures/")
             for err in input_dist_errors:
                 print(f"[WARN] {err}")
+            PROFILER.stop("uncertainty.distribution_charts")
 
             if target and _sens is not None:
-                sens = _sens(parameters, target_name=target, n=2000)
-                with open(analysis_dir / "sensitivity.json", "w", encoding="utf-8") as f:
-                    json.dump(sens, f, indent=2)
+                with PROFILER.stage("uncertainty.sensitivity"):
+                    sens = _sens(parameters, target_name=target, n=2000)
+                write_json_if_changed(analysis_dir / "sensitivity.json", sens)
                 print(f"[OK] Wrote {(analysis_dir / 'sensitivity.json').relative_to(project_root)}")
             else:
                 print("[WARN] No calculated target found for sensitivity analysis.")
 
             # Generate rigorous outcomes, tornado, and sensitivity indices for parameters with compute
             if tornado_deltas and regression_sensitivity and Outcome:
+                PROFILER.start("uncertainty.outcomes")
                 print("[*] Generating outcome distributions and sensitivity analysis...")
 
                 figures_dir = project_root / "knowledge" / "figures"
 
-                # Delete stale QMD files first (we regenerate all)
-                # PNGs will be cleaned up after generation (only orphans)
-                stale_tornado_qmd = list(figures_dir.glob("tornado-*.qmd"))
-                stale_sensitivity_qmd = list(figures_dir.glob("sensitivity-table-*.qmd"))
-                stale_mc_dist_qmd = list(figures_dir.glob("mc-distribution-*.qmd"))
-                stale_exceedance_qmd = list(figures_dir.glob("exceedance-*.qmd"))
-                stale_qmd_files = stale_tornado_qmd + stale_sensitivity_qmd + stale_mc_dist_qmd + stale_exceedance_qmd
-
-                if stale_qmd_files:
-                    print(f"[*] Cleaning {len(stale_qmd_files)} existing QMD files...")
-                    for f in stale_qmd_files:
-                        f.unlink()
-
-                # Track generated QMD files for orphan PNG cleanup later
+                # Track generated (or cached) QMD and JSON files; stale ones are
+                # removed after generation, then orphaned PNGs
                 generated_outcome_qmds = set()
+                generated_analysis_files = set()
 
                 # Validate: Find calculated parameters missing inputs/compute
                 validation_warnings = []
@@ -660,34 +1173,6 @@ def main():
                 # Validate: Check for leaf input parameters missing uncertainty metadata
                 # These cause zero-variance Monte Carlo outputs, making distribution charts meaningless
 
-                def get_all_leaf_inputs(param_name: str, visited: set = None) -> set:
-                    """Recursively find all leaf (non-calculated) inputs for a parameter."""
-                    if visited is None:
-                        visited = set()
-                    if param_name in visited:
-                        return set()
-                    visited.add(param_name)
-
-                    meta = parameters.get(param_name, {})
-                    val = meta.get("value")
-
-                    # If has inputs, recurse
-                    if hasattr(val, "inputs") and val.inputs:
-                        leaves = set()
-                        for inp in val.inputs:
-                            leaves.update(get_all_leaf_inputs(inp, visited))
-                        return leaves
-                    else:
-                        # This is a leaf parameter
-                        return {param_name}
-
-                def has_uncertainty(val) -> bool:
-                    """Check if a parameter has uncertainty metadata."""
-                    has_dist = hasattr(val, "distribution") and val.distribution
-                    has_std = hasattr(val, "std_error") and val.std_error
-                    has_ci = hasattr(val, "confidence_interval") and val.confidence_interval
-                    return bool(has_dist or has_std or has_ci)
-
                 # Collect ALL leaf parameters that are used in calculations but lack uncertainty
                 all_deterministic_leaves = set()
                 all_uncertain_leaves = set()
@@ -696,7 +1181,7 @@ def main():
                     val = meta.get("value")
                     if hasattr(val, "compute") and val.compute and hasattr(val, "inputs") and val.inputs:
                         # Find all leaf inputs for this calculated param
-                        leaf_inputs = get_all_leaf_inputs(param_name)
+                        leaf_inputs = param_graph.leaf_inputs(param_name)
                         for leaf in leaf_inputs:
                             leaf_meta = parameters.get(leaf, {})
                             leaf_val = leaf_meta.get("value")
@@ -741,6 +1226,7 @@ def main():
 
                 if not analyzable_params:
                     print("[WARN] No parameters found with compute() and inputs for sensitivity analysis")
+                PROFILER.gauge("outcomes", len(analyzable_params))
 
                 # Counters for summary output
                 tornado_count = 0
@@ -749,7 +1235,54 @@ def main():
                 exceedance_count = 0
                 analysis_json_count = 0
 
+                # Look up which outcomes' artifacts are still fresh in the build cache
+                outcome_keys = {}
+                cached_outcomes = {}
+                for outcome in analyzable_params:
+                    # The sample digest covers sampler effects that reach beyond the upstream
+                    # closure (joint designs, correlations) and the QMDs that embed it
+                    outcome_keys[outcome.name] = build_cache.parameter_key(
+                        param_graph, outcome.name, run_settings, sample_digests.get(outcome.name, ""),
+                    )
+                    cached = build_cache.lookup(f"outcome:{outcome.name}", outcome_keys[outcome.name])
+                    if cached is not None:
+                        cached_outcomes[outcome.name] = cached
+                stale_outcomes = [o for o in analyzable_params if o.name not in cached_outcomes]
+                if cached_outcomes:
+                    print(f"[*] Build cache: {len(cached_outcomes)} outcomes unchanged, {len(stale_outcomes)} to regenerate")
+
+                # Tornado deltas for every stale outcome in one pass: baseline node values are
+                # cached and each perturbed leaf is evaluated once for all outcomes using it
+                PROFILER.start("uncertainty.tornado")
+                tornado_engine = TornadoEngine(parameters, param_graph)
+                if tornado_mode == "batched":
+                    tornado_results = tornado_deltas_batched(parameters, stale_outcomes, graph=param_graph)
+                else:
+                    tornado_results = tornado_engine.deltas_for_outcomes(stale_outcomes)
+                PROFILER.stop("uncertainty.tornado")
+
+                # Local elasticities of every outcome w.r.t. every leaf, from one
+                # differentiation pass over the compute graph (cheap; not cached)
+                with PROFILER.stage("uncertainty.elasticities"):
+                    elasticity_result = compute_elasticities(
+                        parameters, [o.name for o in analyzable_params], graph=param_graph, engine=tornado_engine,
+                    )
+                write_elasticities(elasticity_result, analysis_dir / ELASTICITIES_FILE)
+                print(f"[OK] Wrote _analysis/{ELASTICITIES_FILE} ({len(elasticity_result.elasticities)} outcomes x {len(elasticity_result.leaf_importance())} leaves)")
+                for name, error in elasticity_result.errors.items():
+                    print(f"[WARN] No elasticities for {name}: {error}")
+
+                sobol_results = {}
+                if use_sobol and stale_outcomes:
+                    if np is None:
+                        print("[WARN] --sobol requires numpy; using regression sensitivity tables")
+                    else:
+                        print(f"[*] Computing Sobol indices for {len(stale_outcomes)} outcomes (N={N_SOBOL})...")
+                        with PROFILER.stage("uncertainty.sobol"):
+                            sobol_results = sobol_indices(parameters, stale_outcomes, n=N_SOBOL, seed=RANDOM_SEED, graph=param_graph)
+
                 outcomes_data = {}
+                outcome_jobs = []
                 for outcome in analyzable_params:
                     try:
                         # Build baseline context
@@ -761,13 +1294,33 @@ def main():
                         baseline = outcome.compute(ctx)
 
                         # MC samples for outcome
+                        failed_inputs = [name for name in outcome.inputs if name in unpropagated]
+                        if failed_inputs:
+                            raise ValueError(f"samples of {', '.join(failed_inputs)} could not be propagated")
                         input_sims = {name: sims[name] for name in outcome.inputs if name in sims}
+                        if outcome.name in sims:
+                            # Adaptive runs stop outcomes early; their rows are a prefix of the inputs'
+                            n_outcome = len(sims[outcome.name])
+                            input_sims = {name: arr[:n_outcome] for name, arr in input_sims.items()}
                         if input_sims:
-                            n_samples = len(list(input_sims.values())[0])
-                            outcome_samples = []
-                            for i in range(n_samples):
-                                ctx_i = {name: float(arr[i]) for name, arr in input_sims.items()}
-                                outcome_samples.append(outcome.compute(ctx_i))
+                            sample_digest = None
+                            # Outcomes propagation could not recompute still hold their base
+                            # samples; evaluate them row by row so a failure is reported
+                            if recompute_outcomes or outcome.name not in sims or outcome.name in unpropagated:
+                                n_samples = len(list(input_sims.values())[0])
+                                outcome_samples = []
+                                for i in range(n_samples):
+                                    ctx_i = {name: float(arr[i]) for name, arr in input_sims.items()}
+                                    outcome_samples.append(outcome.compute(ctx_i))
+                            else:
+                                # Reuse the propagated samples: simulate_with_propagation already
+                                # evaluated this outcome from the same input samples
+                                if np is not None:
+                                    outcome_samples = np.asarray(sims[outcome.name]).tolist()
+                                else:
+                                    outcome_samples = list(sims[outcome.name])
+                                # Charts read these samples from the store instead of embedding them
+                                sample_digest = sample_digests.get(outcome.name)
 
                             if np is not None:
                                 oa = np.asarray(outcome_samples)
@@ -780,6 +1333,8 @@ def main():
                                     "p95": float(np.percentile(oa, 95)),
                                     "units": outcome.units,
                                 }
+                                if outcome.name in sim_precision:
+                                    outcomes_data[outcome.name]["precision"] = sim_precision[outcome.name]
                             else:
                                 m = sum(outcome_samples) / len(outcome_samples)
                                 var = sum((v - m) ** 2 for v in outcome_samples) / len(outcome_samples)
@@ -798,109 +1353,94 @@ def main():
                                     "units": outcome.units,
                                 }
 
-                            # Tornado deltas for this outcome
-                            tornado = tornado_deltas(parameters, outcome)
-                            with open(analysis_dir / f"tornado_{outcome.name}.json", "w", encoding="utf-8") as f:
-                                json.dump(tornado, f, indent=2)
-                            analysis_json_count += 1
-
-                            # Generate tornado chart QMD
-                            try:
-                                figures_dir = project_root / "knowledge" / "figures"
-                                param_meta = parameters.get(outcome.name, {})
-                                tornado_qmd = generate_tornado_chart_qmd(
-                                    outcome.name, tornado, figures_dir, param_meta,
-                                    baseline=float(baseline),
-                                    units=outcome.units
-                                )
-                                generated_outcome_qmds.add(tornado_qmd.name)
-                                tornado_count += 1
-                            except ValueError as val_err:
-                                # STRICT MODE: Fail fast when tornado data is incomplete
-                                # This forces developers to either:
-                                # 1. Add proper inputs/compute to intermediate calculated parameters
-                                # 2. Change source_type to "definition" if not truly calculated
-                                # 3. Add uncertainty distributions to leaf input parameters
-                                print(f"[ERROR] {val_err}", file=sys.stderr)
-                                print(f"[ERROR] Parameter '{outcome.name}' has inputs/compute but no tornado sensitivity.", file=sys.stderr)
-                                print("[ERROR] This usually means:", file=sys.stderr)
-                                print("[ERROR]   - Input parameters need uncertainty distributions (std_error, confidence_interval, or distribution)", file=sys.stderr)
-                                print("[ERROR]   - OR intermediate inputs need their own inputs/compute definitions", file=sys.stderr)
-                                print("[ERROR]   - OR this should be source_type='definition' instead of 'calculated'", file=sys.stderr)
-                                sys.exit(1)
-                            except Exception as chart_err:
-                                print(f"[ERROR] Failed to generate tornado chart for {outcome.name}: {chart_err}", file=sys.stderr)
-                                sys.exit(1)
-
-                            # Regression sensitivity indices (filter out zero-variance inputs)
-                            filtered_input_sims = {}
-                            for inp_name, inp_vals in input_sims.items():
-                                if np is not None:
-                                    std = float(np.std(np.asarray(inp_vals)))
-                                else:
-                                    vals = list(inp_vals)
-                                    mean = sum(vals) / len(vals)
-                                    variance = sum((v - mean) ** 2 for v in vals) / len(vals)
-                                    std = variance ** 0.5
-
-                                # Only include inputs that actually vary
-                                if std > 1e-10:
-                                    filtered_input_sims[inp_name] = inp_vals
-
-                            if filtered_input_sims:
-                                sens_indices = regression_sensitivity(filtered_input_sims, outcome_samples)
-                            else:
-                                sens_indices = {inp: 0.0 for inp in input_sims.keys()}
-
-                            with open(analysis_dir / f"sensitivity_indices_{outcome.name}.json", "w", encoding="utf-8") as f:
-                                json.dump(sens_indices, f, indent=2)
-                            analysis_json_count += 1
-
-                            # Generate sensitivity table QMD only if there's meaningful variance
-                            # Skip tables where all coefficients are effectively zero (< 0.001)
-                            max_coef = max(abs(v) for v in sens_indices.values()) if sens_indices else 0
-                            if max_coef >= 0.001:
-                                try:
-                                    sens_qmd = generate_sensitivity_table_qmd(outcome.name, sens_indices, figures_dir, param_meta)
-                                    generated_outcome_qmds.add(sens_qmd.name)
-                                    sensitivity_count += 1
-                                except Exception as table_err:
-                                    print(f"[WARN] Failed to generate sensitivity table for {outcome.name}: {table_err}")
-
-                            # Generate Monte Carlo distribution chart
-                            # Skip if zero variance (all samples identical) - these are meaningless
-                            try:
-                                outcome_info = outcomes_data.get(outcome.name, {})
-                                outcome_std = outcome_info.get("std", 0)
-                                if outcome_samples and len(outcome_samples) > 100 and outcome_std > 0:
-                                    mc_qmd = generate_monte_carlo_distribution_chart_qmd(
-                                        outcome.name,
-                                        outcome_info,
-                                        outcome_samples,
-                                        figures_dir,
-                                        param_meta
-                                    )
-                                    generated_outcome_qmds.add(mc_qmd.name)
-                                    mc_dist_count += 1
-
-                                    # Generate standalone CDF/exceedance chart
-                                    cdf_qmd = generate_cdf_chart_qmd(
-                                        outcome.name,
-                                        outcome_samples,
-                                        figures_dir,
-                                        param_meta
-                                    )
-                                    generated_outcome_qmds.add(cdf_qmd.name)
-                                    exceedance_count += 1
-                                elif outcome_samples and outcome_std == 0:
-                                    print(f"[SKIP] MC distribution chart for {outcome.name}: zero variance (deterministic)")
-                            except Exception as mc_err:
-                                print(f"[WARN] Failed to generate MC distribution charts for {outcome.name}: {mc_err}")
+                            # Unchanged since the last run: keep the cached artifacts as they are
+                            cached = cached_outcomes.get(outcome.name)
+                            if cached is not None:
+                                for path in cached:
+                                    if path.suffix == ".png":
+                                        continue
+                                    if path.suffix == ".json":
+                                        generated_analysis_files.add(path.name)
+                                        analysis_json_count += 1
+                                        continue
+                                    generated_outcome_qmds.add(path.name)
+                                    tornado_count += path.name.startswith("tornado-")
+                                    sensitivity_count += path.name.startswith("sensitivity-table-")
+                                    mc_dist_count += path.name.startswith("mc-distribution-")
+                                    exceedance_count += path.name.startswith("exceedance-")
+                                continue
+
+                            # Stale: artifacts are emitted below, possibly by worker processes
+                            outcome_jobs.append((outcome, baseline, input_sims, outcome_samples, sample_digest))
                     except Exception as e:
                         print(f"[WARN] Skipped outcome {outcome.name}: {e}")
 
-                with open(analysis_dir / "outcomes.json", "w", encoding="utf-8") as f:
-                    json.dump(outcomes_data, f, indent=2)
+                # Emit tornado/sensitivity/MC/exceedance artifacts for stale outcomes.
+                # Workers are forked after everything above exists, so they share the
+                # sample arrays and parameters copy-on-write; results are replayed in
+                # outcome order, so the output matches a serial run byte for byte.
+                _OUTCOME_WORKER_STATE.update(
+                    jobs=outcome_jobs,
+                    parameters=parameters,
+                    outcomes_data=outcomes_data,
+                    tornado_results=tornado_results,
+                    sobol_results=sobol_results,
+                    analysis_dir=analysis_dir,
+                    figures_dir=figures_dir,
+                    project_root=project_root,
+                    chart_backend=chart_backend,
+                    np=np,
+                )
+                PROFILER.gauge("outcomes_regenerated", len(outcome_jobs))
+                if outcome_jobs:
+                    workers = _outcome_workers(n_jobs, len(outcome_jobs))
+                    if workers > 1:
+                        print(f"[*] Writing artifacts for {len(outcome_jobs)} outcomes with {workers} worker processes...")
+                    with PROFILER.stage("uncertainty.outcome_artifacts"):
+                        job_results = _run_outcome_jobs(len(outcome_jobs), workers)
+                else:
+                    job_results = []
+                _OUTCOME_WORKER_STATE.clear()
+
+                # Batch chart backend: every outcome's PNGs in one multiprocess pass
+                chart_jobs = [job for result in job_results if not result["fatal"] for job in result["charts"]]
+                with PROFILER.stage("uncertainty.chart_render"):
+                    failed_pngs = _render_charts(chart_jobs, n_jobs, project_root) if chart_jobs else set()
+
+                for (outcome, *_), result in zip(outcome_jobs, job_results):
+                    PROFILER.add_outcome(outcome.name, result["seconds"])
+                    for stream, message in result["messages"]:
+                        print(message, file=sys.stderr if stream == "stderr" else sys.stdout)
+                    if result["fatal"]:
+                        sys.exit(1)
+                    for path in result["artifacts"]:
+                        if path.suffix == ".png":
+                            continue
+                        if path.suffix == ".json":
+                            generated_analysis_files.add(path.name)
+                            analysis_json_count += 1
+                            continue
+                        generated_outcome_qmds.add(path.name)
+                        tornado_count += path.name.startswith("tornado-")
+                        sensitivity_count += path.name.startswith("sensitivity-table-")
+                        mc_dist_count += path.name.startswith("mc-distribution-")
+                        exceedance_count += path.name.startswith("exceedance-")
+                    if result["complete"] and not failed_pngs.intersection(result["artifacts"]):
+                        build_cache.record(f"outcome:{outcome.name}", outcome_keys[outcome.name], result["artifacts"])
+
+                write_json_if_changed(analysis_dir / "outcomes.json", outcomes_data)
+
+                # Clean up QMD/JSON files for outcomes that were deleted, renamed or
+                # no longer produce that chart (we no longer wipe everything up front)
+                stale_files = []
+                for pattern in ("tornado-*.qmd", "sensitivity-table-*.qmd", "mc-distribution-*.qmd", "exceedance-*.qmd"):
+                    stale_files.extend(f for f in figures_dir.glob(pattern) if f.name not in generated_outcome_qmds)
+                for pattern in ("tornado_*.json", "sensitivity_indices_*.json", "sobol_indices_*.json"):
+                    stale_files.extend(f for f in analysis_dir.glob(pattern) if f.name not in generated_analysis_files)
+                if stale_files:
+                    print(f"[*] Cleaning {len(stale_files)} stale QMD/analysis files...")
+                    for f in stale_files:
+                        f.unlink()
 
                 # Clean up orphaned PNG files (PNGs without matching QMD)
                 orphaned_pngs = []
@@ -932,98 +1472,115 @@ def main():
                 print(f"[OK] Generated {mc_dist_count} MC distribution charts in knowledge/figures/")
                 print(f"[OK] Generated {exceedance_count} exceedance charts in knowledge/figures/")
                 print(f"[OK] Wrote {analysis_json_count + 2} analysis JSON files to _analysis/")
+                PROFILER.stop("uncertainty.outcomes")
 
-                # Discount rate sensitivity for ROI_complete
-                try:
-                    roi_outcome = next((o for o in analyzable_params if "ROI" in o.name.upper() and "COMPLETE" in o.name.upper()), None)
-                    if roi_outcome:
-                        discount_curve = []
-                        for rate in [0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07]:
-                            ctx_disc = {}
-                            for inp in roi_outcome.inputs:
-                                meta = parameters.get(inp, {})
-                                val = meta.get("value")
-                                if inp == "NPV_DISCOUNT_RATE_STANDARD":
-                                    ctx_disc[inp] = rate
-                                else:
-                                    ctx_disc[inp] = float(val) if val is not None else 0.0
-                            roi_val = roi_outcome.compute(ctx_disc)
-                            discount_curve.append({"discount_rate": rate, "roi": float(roi_val)})
-                        with open(analysis_dir / "discount_curve_ROI.json", "w", encoding="utf-8") as f:
-                            json.dump(discount_curve, f, indent=2)
-                except Exception as e:
-                    print(f"[WARN] Discount curve generation skipped: {e}")
+                # ROI discount curve, ROI scenario bands and the treaty size x discount rate
+                # sweep, each evaluated as one batched pass through the compute graph
+                PROFILER.start("uncertainty.roi_scenarios")
+                if np is None:
+                    print("[WARN] Scenario sweeps require numpy; skipped")
+                else:
+                    from dih_models.scenario_sweep import run_sweep, write_sweep
 
-                # Scenario bands for ROI_complete
-                try:
                     roi_outcome = next((o for o in analyzable_params if "ROI" in o.name.upper() and "COMPLETE" in o.name.upper()), None)
-                    if roi_outcome:
-                        scenarios = {
-                            "worst": 0.5,  # benefits half
-                            "conservative": 0.8,
-                            "baseline": 1.0,
-                            "optimistic": 1.5,
+
+                    def _sweep_roi(**kwargs):
+                        result = run_sweep(parameters, [roi_outcome.name], graph=param_graph, **kwargs)
+                        if result.failed[roi_outcome.name].any():
+                            raise RuntimeError(result.errors.get(roi_outcome.name, f"{roi_outcome.name} evaluation failed"))
+                        return [float(v) for v in result.outcomes[roi_outcome.name]]
+
+                    # Discount rate sensitivity for ROI_complete
+                    try:
+                        if roi_outcome:
+                            rates = [0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07]
+                            roi_values = _sweep_roi(axes={"NPV_DISCOUNT_RATE_STANDARD": rates})
+                            discount_curve = [{"discount_rate": rate, "roi": roi} for rate, roi in zip(rates, roi_values)]
+                            write_json_if_changed(analysis_dir / "discount_curve_ROI.json", discount_curve)
+                    except Exception as e:
+                        print(f"[WARN] Discount curve generation skipped: {e}")
+
+                    # Scenario bands for ROI_complete: scale benefits, keep costs fixed
+                    try:
+                        if roi_outcome:
+                            scenarios = {
+                                "worst": 0.5,  # benefits half
+                                "conservative": 0.8,
+                                "baseline": 1.0,
+                                "optimistic": 1.5,
+                            }
+                            multipliers = np.array(list(scenarios.values()))
+                            benefit_inputs = ["GLOBAL_CLINICAL_TRIALS_SPENDING_ANNUAL", "PEACE_DIVIDEND_ANNUAL_SOCIETAL_BENEFIT", "TRIAL_COST_REDUCTION_PCT"]
+                            roi_values = _sweep_roi(overrides={
+                                inp: float(parameters[inp]["value"]) * multipliers for inp in benefit_inputs if inp in parameters
+                            })
+                            scenario_results = [{"scenario": name, "roi": roi} for name, roi in zip(scenarios, roi_values)]
+                            write_json_if_changed(analysis_dir / "scenario_bands_ROI.json", scenario_results)
+                    except Exception as e:
+                        print(f"[WARN] Scenario bands generation skipped: {e}")
+
+                    # Every outcome that depends on treaty size or the discount rate, over
+                    # a SWEEP_POINTS x SWEEP_POINTS grid of both
+                    try:
+                        sweep_axes = {
+                            "TREATY_REDUCTION_PCT": np.linspace(0.001, 0.10, SWEEP_POINTS),
+                            "NPV_DISCOUNT_RATE_STANDARD": np.linspace(0.01, 0.07, SWEEP_POINTS),
                         }
-                        scenario_results = []
-                        for scenario_name, multiplier in scenarios.items():
-                            ctx_scen = {}
-                            for inp in roi_outcome.inputs:
-                                meta = parameters.get(inp, {})
-                                val = meta.get("value")
-                                v = float(val) if val is not None else 0.0
-                                # Scale benefits, keep costs fixed
-                                if inp in ["GLOBAL_CLINICAL_TRIALS_SPENDING_ANNUAL", "PEACE_DIVIDEND_ANNUAL_SOCIETAL_BENEFIT", "TRIAL_COST_REDUCTION_PCT"]:
-                                    v *= multiplier
-                                ctx_scen[inp] = v
-                            roi_val = roi_outcome.compute(ctx_scen)
-                            scenario_results.append({"scenario": scenario_name, "roi": float(roi_val)})
-                        with open(analysis_dir / "scenario_bands_ROI.json", "w", encoding="utf-8") as f:
-                            json.dump(scenario_results, f, indent=2)
-                except Exception as e:
-                    print(f"[WARN] Scenario bands generation skipped: {e}")
+                        sweep_axes = {name: values for name, values in sweep_axes.items() if name in parameters}
+                        swept = set().union(*(param_graph.descendants(name) for name in sweep_axes))
+                        sweep_outcomes = [o.name for o in analyzable_params if o.name in swept]
+                        if sweep_outcomes:
+                            sweep = run_sweep(parameters, sweep_outcomes, axes=sweep_axes, graph=param_graph)
+                            write_sweep(sweep, analysis_dir / SWEEP_FILE)
+                            print(f"[OK] Wrote _analysis/{SWEEP_FILE} ({len(sweep_outcomes)} outcomes x {sweep.n:,} scenarios)")
+                    except Exception as e:
+                        print(f"[WARN] Scenario sweep skipped: {e}")
+                PROFILER.stop("uncertainty.roi_scenarios")
 
+            build_cache.save()
+            print(f"[OK] Build cache: {build_cache.hits} entries reused, {build_cache.misses} rebuilt or uncached")
+            PROFILER.stop("uncertainty")
+            plan.complete("uncertainty")
             print()
-        else:
+        elif "uncertainty" in run_stages:
             print("[WARN] Uncertainty module unavailable; skipping uncertainty summaries.")
             print()
     except Exception as e:
+        PROFILER.stop("uncertainty")
         print(f"[WARN] Uncertainty generation skipped: {e}")
         print()
 
     # Generate parameters-and-calculations.qmd AFTER uncertainty charts are created
     # so the file existence checks work correctly
-    print("[*] Generating parameters-and-calculations.qmd...")
-    qmd_output = project_root / "knowledge" / "appendix" / "parameters-and-calculations.qmd"
-    generate_parameters_and_calculations_qmd(parameters, qmd_output, available_refs=available_refs, params_file=parameters_path)
-    print()
+    if "appendix" in run_stages:
+        print("[*] Generating parameters-and-calculations.qmd...")
+        with PROFILER.stage("appendix"):
+            generate_parameters_and_calculations_qmd(parameters, qmd_output, available_refs=available_refs, params_file=parameters_path)
+        plan.complete("appendix")
+        print()
 
     # Optionally inject citations
-    if inject_citations:
+    if inject_citations and load_inputs:
         print("[*] Injecting citations into economics.qmd...")
         economics_qmd = project_root / "knowledge" / "economics" / "economics.qmd"
         inject_citations_into_qmd(parameters, economics_qmd)
         print()
 
     # Generate outline from updated headings
-    print("[*] Regenerating outline from chapter headings...")
-    generate_outline_script = project_root / "scripts" / "generate-outline.py"
-    if generate_outline_script.exists():
-        try:
-            result = subprocess.run(
-                [sys.executable, str(generate_outline_script), "--output", "OUTLINE-GENERATED.MD"],
-                cwd=str(project_root),
-                capture_output=True,
-                text=True,
-                encoding='utf-8'
-            )
-            if result.returncode == 0:
-                print("[OK] Outline regenerated")
-            else:
-                print(f"[WARN] Outline generation had issues: {result.stderr}", file=sys.stderr)
-        except Exception as e:
-            print(f"[WARN] Could not regenerate outline: {e}", file=sys.stderr)
-    else:
-        print(f"[WARN] Outline script not found: {generate_outline_script}", file=sys.stderr)
+    if "outline" in run_stages:
+        with PROFILER.stage("outline"):
+            outline_ok = regenerate_outline(project_root)
+        if outline_ok:
+            plan.complete("outline")
+        print()
+
+    plan.save()
+
+    # Timing report for tracking regressions as parameters.py grows
+    for line in PROFILER.summary():
+        print(line)
+    profile_path = PROFILER.write(project_root / "_analysis" / PROFILE_FILE)
+    print(f"[OK] Wrote {profile_path.relative_to(project_root)}")
     print()
 
     print("[OK] All academic outputs generated successfully!")
@@ -1050,4 +1607,17 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    profile_mode = None
+    for arg in sys.argv:
+        if arg == "--profile":
+            profile_mode = "cprofile"
+        elif arg.startswith("--profile="):
+            profile_mode = arg.split("=")[1]
+            if profile_mode not in PROFILE_MODES:
+                print(f"[ERROR] Invalid profile mode: {profile_mode}", file=sys.stderr)
+                print(f"Valid modes: {', '.join(PROFILE_MODES)}", file=sys.stderr)
+                sys.exit(1)
+    if profile_mode is None:
+        main()
+    else:
+        run_profiled(main, profile_mode, Path(__file__).parent.parent.absolute() / "_analysis" / "pipeline-profile")
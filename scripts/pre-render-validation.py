@@ -16,14 +16,45 @@ Validates .qmd and .md files before Quarto rendering to catch errors early:
 - Missing citations ([@citation-id]) not found in references.bib
 - _quarto.yml configuration (validates all chapter paths exist)
 
+Each file is read and tokenized once into a ParsedDocument (lines, a lazy
+line-offset index, code fences, math state, python blocks, links and
+variable shortcodes). The checks are visitors over that parse and run in a
+fixed order, so errors are reported in the same order as before. Files are
+validated across a process pool (--workers, default: one per CPU).
+
+Results are cached per file in _analysis/.validation-cache.json together
+with the lookups they depended on (referenced paths, variables, citations,
+anchors); only changed files and files whose references changed are
+revalidated. Use --no-cache to validate everything.
+
+Before validating, the generated files (_variables.yml, references.bib, ...)
+are brought up to date by the generate-everything pipeline, but only the
+stages whose inputs changed are run (see dih_models/pipeline_stages.py);
+when parameters.py, references.qmd, the generator sources and the generated
+outputs are all unchanged, the pipeline is not started at all.
+
 Runs automatically via _quarto.yml pre-render hook
 """
 
+import argparse
+import hashlib
+import json
+import multiprocessing
 import os
 import re
 import sys
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from glob import glob
-from typing import Dict, List, Optional, Set
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from dih_models.pipeline_stages import PIPELINE_SCRIPT, StagePlan  # noqa: E402
 
 # Set UTF-8 encoding for stdout and stderr on Windows
 if sys.platform == 'win32':
@@ -40,6 +71,7 @@ class ValidationError:
         self.context = context
 
 
+# Errors not tied to a validated file (e.g. _quarto.yml)
 errors: List[ValidationError] = []
 
 # Common LaTeX error patterns to check for
@@ -67,6 +99,51 @@ latex_patterns = [
     },
 ]
 
+# Shared token patterns
+LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+VAR_PATTERN = re.compile(r"\{\{<\s*var\s+([^\s>]+)\s*>\}\}")
+WORD_PATTERN = re.compile(r"\w+")
+
+# Check-specific patterns (compiled once, not per line)
+MATH_VAR_PATTERN = re.compile(r"\{\{<\s*var\s+[^>]+\s*>\}\}")
+SHORTCODE_PATTERN = re.compile(r"\{\{<[^>]+>\}\}")
+MATH_BULLET_PATTERN = re.compile(r"^\s+\*\s+")
+TEXT_BLOCK_PATTERN = re.compile(r"\\text\{[^}]*\}")
+ESCAPED_DOLLAR_PATTERN = re.compile(r"\\\$")
+MARKDOWN_IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+HTML_IMAGE_PATTERN = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+EM_DASH_PATTERN = re.compile(r"—")
+INLINE_CODE_EM_DASH_PATTERN = re.compile(r"`[^`]*—[^`]*`")
+URL_EM_DASH_PATTERN = re.compile(r"https?://[^\s]*—[^\s]*")
+QMD_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)#]+\.qmd[^)]*)\)")
+PARAM_IMPORT_PATTERN = re.compile(r"from\s+dih_models\.parameters\s+import", re.DOTALL)
+GRAPHVIZ_PATTERN = re.compile(r"graphviz|dot\.node|dot\.edge|dot\.attr|Digraph|Graph")
+HARDCODED_PATH_PATTERN = re.compile(r"output_dir\s*=.*['\"]brain['\"].*['\"]figures['\"]")
+MANUAL_PATH_PATTERN = re.compile(r"output_path\s*=\s*output_dir\s*/")
+MARKDOWN_GIF_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)]*\.gif[^)]*)\)", re.IGNORECASE)
+HTML_GIF_PATTERN = re.compile(r'<img[^>]+src=["\']([^"\']*\.gif[^"\']*)["\']', re.IGNORECASE)
+INCLUDE_PATTERN = re.compile(r"\{\{<\s*include\s+([^\s>]+)\s*>\}\}")
+LINK_WITH_VAR_PATTERN = re.compile(r"\[([^\]]*\{\{<\s*var\s+[^>]+\s*>\}\}[^\]]*)\]\([^)]+\)")
+CITATION_PATTERN = re.compile(r'\[@([^\]]+)\]')
+INLINE_EXPR_PATTERNS = [
+    re.compile(r"`\{python\}[^`]+`"),
+    re.compile(r"`\{r\}[^`]+`"),
+    re.compile(r"`python [^`]+`"),
+    re.compile(r"`r [^`]+`"),
+]
+
+# Per-block import checks: (usage_pattern, import_patterns, module_name)
+# NOTE: We only check for imports that MUST be in each block that uses them.
+# Standard library imports (pd, np, plt) are available from first block in Quarto.
+# get_figure_output_path and get_project_root are checked by check_figure_file_imports() (whole-file check).
+MODULE_CHECKS = [
+    (
+        re.compile(r"\bnpf\."),
+        [re.compile(r"import\s+numpy_financial\s+as\s+npf", re.DOTALL), re.compile(r"from\s+numpy_financial\s+import", re.DOTALL)],
+        "numpy_financial (npf)",
+    ),
+]
+
 
 def check_brace_balance(match: str) -> bool:
     """Check if braces are balanced in a match"""
@@ -84,15 +161,15 @@ def check_brace_balance(match: str) -> bool:
 def resolve_link_path(link_path: str, file_dir: str) -> str:
     """
     Resolve a link path to an absolute filesystem path.
-    
+
     Handles:
     - Relative paths (resolved relative to file_dir)
     - Absolute paths starting with / (resolved from project root)
-    
+
     Args:
         link_path: The path from the markdown link (may start with / for absolute)
         file_dir: The directory containing the file with the link
-        
+
     Returns:
         Normalized absolute path to the target file
     """
@@ -105,213 +182,287 @@ def resolve_link_path(link_path: str, file_dir: str) -> str:
         return os.path.normpath(os.path.join(file_dir, link_path))
 
 
-def check_math_delimiters(content: str, filename: str):
-    """Check for unmatched dollar signs in math mode"""
-    lines = content.split("\n")
-    in_math_block = False
+# ---------------------------------------------------------------------------
+# Shared structural parse
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ValidationContext:
+    """Project-wide tables the checks look names up in (loaded once per run)"""
+
+    defined_vars: Set[str] = field(default_factory=set)
+    defined_parameters: Set[str] = field(default_factory=set)
+    anchor_map: Dict[str, Set[str]] = field(default_factory=dict)
+    defined_citations: Set[str] = field(default_factory=set)
+    _parameters_digest: Optional[str] = None
+
+    def resolve(self, kind: str, key: str) -> Any:
+        """
+        Answer one lookup a check depends on.
+
+        Kinds: "path" (file exists), "var" / "citation" (name defined; None
+        while the table is not loaded), "anchor" ("target#anchor" defined)
+        and "parameters" (digest of the parameter-name table).
+        """
+        if kind == "path":
+            return os.path.exists(key)
+        if kind == "var":
+            return key in self.defined_vars if self.defined_vars else None
+        if kind == "citation":
+            return key in self.defined_citations if self.defined_citations else None
+        if kind == "anchor":
+            target, _, anchor_id = key.partition("#")
+            return anchor_id in self.anchor_map.get(target, ())
+        if kind == "parameters":
+            if self._parameters_digest is None:
+                names = "\n".join(sorted(self.defined_parameters)).encode("utf-8")
+                self._parameters_digest = hashlib.sha256(names).hexdigest()
+            return self._parameters_digest
+        raise ValueError(f"Unknown lookup kind: {kind}")
+
+
+class PythonBlock:
+    """Body of a ```{python} block; fence_line is the 1-based line of the opening fence"""
+
+    __slots__ = ("fence_line", "lines", "text", "_words")
+
+    def __init__(self, fence_line: int, lines: List[str]):
+        self.fence_line = fence_line
+        self.lines = lines
+        self.text = "\n".join(lines)
+        self._words: Optional[Set[str]] = None
+
+    @property
+    def words(self) -> Set[str]:
+        """Every identifier-like token in the block"""
+        if self._words is None:
+            self._words = set(WORD_PATTERN.findall(self.text))
+        return self._words
+
+
+class ParsedDocument:
+    """
+    A file tokenized once for all checks.
+
+    Per line (0-based index): whether it is a ``` fence, inside a code block,
+    inside $$...$$ display math, or an HTML comment line. Plus the python
+    blocks, the [text](target) links and the {{< var >}} shortcodes found
+    outside comment lines. Errors are collected on the document.
+    """
+
+    def __init__(self, filepath: str, content: str):
+        self.path = filepath
+        self.dir = os.path.dirname(filepath)
+        self.content = content
+        self.lines = content.split("\n")
+        self.is_markdown = filepath.lower().endswith(".md")
+        self.errors: List[ValidationError] = []
+        # (kind, key) -> answer for every table/filesystem lookup the checks made;
+        # a cached result stays valid while all of them give the same answers
+        self.lookups: Dict[Tuple[str, str], Any] = {}
+        self._line_starts: Optional[List[int]] = None
+
+        count = len(self.lines)
+        self.stripped = [line.strip() for line in self.lines]
+        self.fence = [False] * count
+        self.in_code = [False] * count
+        self.in_math = [False] * count
+        self.comment = [False] * count
+        self.python_blocks: List[PythonBlock] = []
+        self.links: List[Tuple[int, re.Match[str]]] = []
+        self.var_refs: List[Tuple[int, re.Match[str]]] = []
+        self._parse()
+
+    def _parse(self) -> None:
+        in_code = False
+        in_math = False
+        python_block: Optional[List[str]] = None
+        fence_line = 0
+
+        for index, line in enumerate(self.lines):
+            stripped = self.stripped[index]
+
+            # Python blocks: ```{python} ... ``` (a new opening fence restarts the block)
+            if line.startswith("```{python}"):
+                python_block = []
+                fence_line = index + 1
+            elif python_block is not None and stripped == "```":
+                self.python_blocks.append(PythonBlock(fence_line, python_block))
+                python_block = None
+            elif python_block is not None:
+                python_block.append(line)
+
+            # Code fences; display math toggles on every $$ outside fence lines
+            if stripped.startswith("```"):
+                self.fence[index] = True
+                in_code = not in_code
+            else:
+                self.in_code[index] = in_code
+                if line.count("$$") % 2:
+                    in_math = not in_math
+                self.in_math[index] = in_math
+
+            is_comment = stripped.startswith("<!--") or ("<!--" in line and "-->" in line)
+            self.comment[index] = is_comment
+            if is_comment:
+                continue
+            if "](" in line:
+                self.links.extend((index, match) for match in LINK_PATTERN.finditer(line))
+            if "{{<" in line:
+                self.var_refs.extend((index, match) for match in VAR_PATTERN.finditer(line))
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number of a character offset into the content"""
+        if self._line_starts is None:
+            self._line_starts = [0] + list(accumulate(len(line) + 1 for line in self.lines))
+        return bisect_right(self._line_starts, offset)
+
+    def report(self, line: int, message: str, context: str, column: Optional[int] = None) -> None:
+        self.errors.append(ValidationError(file=self.path, line=line, message=message, context=context, column=column))
+
+    def lookup(self, ctx: ValidationContext, kind: str, key: str) -> Any:
+        """ctx.resolve(kind, key), recorded as a dependency of this document's result"""
+        value = ctx.resolve(kind, key)
+        self.lookups[(kind, key)] = value
+        return value
 
-    for line_index, line in enumerate(lines):
-        # Skip code blocks
-        if line.strip().startswith("```"):
-            continue
 
-        # Track display math mode ($$)
-        display_math_matches = re.findall(r"\$\$", line)
-        for _ in display_math_matches:
-            in_math_block = not in_math_block
+Check = Callable[[ParsedDocument, ValidationContext], None]
+
+
+# ---------------------------------------------------------------------------
+# Checks (visitors over a ParsedDocument)
+# ---------------------------------------------------------------------------
+
+
+def check_latex_patterns(doc: ParsedDocument, ctx: ValidationContext):
+    """Check for common LaTeX error patterns"""
+    for pattern_config in latex_patterns:
+        validator = pattern_config.get("validator")
+        for match in pattern_config["pattern"].finditer(doc.content):
+            # If there's a custom validator, use it
+            if validator and validator(match.group(0)):
+                continue  # Pattern is valid
+
+            line_number = doc.line_of(match.start())
+            line = doc.lines[line_number - 1] if line_number <= len(doc.lines) else ""
+            doc.report(line_number, pattern_config["message"], line.strip()[:80])
+
+
+def check_math_delimiters(doc: ParsedDocument, ctx: ValidationContext):
+    """Check for unmatched dollar signs in math mode"""
+    for line_index, line in enumerate(doc.lines):
+        # Skip code fences; the math state already accounts for this line's $$
+        if doc.fence[line_index] or not doc.in_math[line_index]:
+            continue
 
         # Check for single $ in display math mode (potential error)
         # BUT ignore \$ (escaped dollar signs, which are valid in \text{} blocks)
-        if in_math_block and "$" in line and "$$" not in line:
+        if "$" in line and "$$" not in line:
             # Remove all \$ (escaped dollar signs) and \text{...} blocks
-            cleaned_line = re.sub(r"\\text\{[^}]*\}", "", line)  # Remove \text{...} blocks
-            cleaned_line = re.sub(r"\\\$", "", cleaned_line)  # Remove escaped dollar signs
+            cleaned_line = TEXT_BLOCK_PATTERN.sub("", line)
+            cleaned_line = ESCAPED_DOLLAR_PATTERN.sub("", cleaned_line)
 
             # Now check if there are any remaining unescaped $ signs
             if "$" in cleaned_line:
-                context = line.strip()[:80]
-                errors.append(
-                    ValidationError(
-                        file=filename,
-                        line=line_index + 1,
-                        message="Unescaped $ inside display math mode ($$...$$)",
-                        context=context,
-                    )
-                )
+                doc.report(line_index + 1, "Unescaped $ inside display math mode ($$...$$)", line.strip()[:80])
 
         # Check for * at the start of a line inside math block (markdown bullet interfering)
-        if in_math_block and re.match(r"^\s+\*\s+", line):
-            context = line.strip()[:80]
-            errors.append(
-                ValidationError(
-                    file=filename,
-                    line=line_index + 1,
-                    message="Markdown bullet (*) inside math block - use + for addition or \\cdot for multiplication",
-                    context=context,
-                )
+        if MATH_BULLET_PATTERN.match(line):
+            doc.report(
+                line_index + 1,
+                "Markdown bullet (*) inside math block - use + for addition or \\cdot for multiplication",
+                line.strip()[:80],
             )
 
         # Check for blank lines inside math block (causes LaTeX errors)
-        if in_math_block and line.strip() == "" and "$$" not in line:
-            errors.append(
-                ValidationError(
-                    file=filename,
-                    line=line_index + 1,
-                    message="Blank line inside math block ($$...$$) - remove blank line or close math block first",
-                    context="(blank line)",
-                )
+        if doc.stripped[line_index] == "":
+            doc.report(
+                line_index + 1,
+                "Blank line inside math block ($$...$$) - remove blank line or close math block first",
+                "(blank line)",
             )
 
         # Check for Quarto variables/shortcodes inside math blocks (they don't work there)
-        if in_math_block:
-            # Check for Quarto variable syntax: {{< var name >}}
-            var_pattern = re.compile(r"\{\{<\s*var\s+[^>]+\s*>\}\}")
-            if var_pattern.search(line):
-                context = line.strip()[:80]
-                errors.append(
-                    ValidationError(
-                        file=filename,
-                        line=line_index + 1,
-                        message="Quarto variable ({{< var ... >}}) inside math block - variables do not work inside LaTeX. Use Python code block to print LaTeX string instead.",
-                        context=context,
-                    )
+        if "{{<" in line:
+            if MATH_VAR_PATTERN.search(line):
+                doc.report(
+                    line_index + 1,
+                    "Quarto variable ({{< var ... >}}) inside math block - variables do not work inside LaTeX. Use Python code block to print LaTeX string instead.",
+                    line.strip()[:80],
+                )
+            elif SHORTCODE_PATTERN.search(line):
+                doc.report(
+                    line_index + 1,
+                    "Quarto shortcode ({{< ... >}}) inside math block - shortcodes do not work inside LaTeX. Process values before math block or use Python code block.",
+                    line.strip()[:80],
                 )
-
-            # Check for other Quarto shortcodes: {{< include ... >}}, {{< ... >}}
-            shortcode_pattern = re.compile(r"\{\{<[^>]+>\}\}")
-            if shortcode_pattern.search(line):
-                # But allow if it's just a variable we already caught
-                if not var_pattern.search(line):
-                    context = line.strip()[:80]
-                    errors.append(
-                        ValidationError(
-                            file=filename,
-                            line=line_index + 1,
-                            message="Quarto shortcode ({{< ... >}}) inside math block - shortcodes do not work inside LaTeX. Process values before math block or use Python code block.",
-                            context=context,
-                        )
-                    )
 
 
-def check_image_paths(content: str, filepath: str):
+def check_image_paths(doc: ParsedDocument, ctx: ValidationContext):
     """Check for missing image files"""
-    lines = content.split("\n")
-    file_dir = os.path.dirname(filepath)
-
-    # Match markdown image syntax: ![alt text](path)
-    markdown_image_pattern = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
-    # Match HTML img tags: <img src="path" /> or <img src='path' />
-    html_image_pattern = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
-
-    for line_index, line in enumerate(lines):
-        # Check markdown image syntax
-        markdown_matches = markdown_image_pattern.finditer(line)
-        for match in markdown_matches:
-            image_path = match.group(2)
-            _check_single_image_path(image_path, filepath, file_dir, line_index + 1, line)
-
-        # Check HTML img tags
-        html_matches = html_image_pattern.finditer(line)
-        for match in html_matches:
-            image_path = match.group(1)
-            _check_single_image_path(image_path, filepath, file_dir, line_index + 1, line)
+    for line_index, line in enumerate(doc.lines):
+        # Check markdown image syntax: ![alt text](path)
+        if "![" in line:
+            for match in MARKDOWN_IMAGE_PATTERN.finditer(line):
+                _check_single_image_path(doc, ctx, match.group(2), line_index + 1, line)
+
+        # Check HTML img tags: <img src="path" /> or <img src='path' />
+        if "<img" in line.lower():
+            for match in HTML_IMAGE_PATTERN.finditer(line):
+                _check_single_image_path(doc, ctx, match.group(1), line_index + 1, line)
 
 
-def _check_single_image_path(image_path: str, filepath: str, file_dir: str, line_number: int, line: str):
+def _check_single_image_path(doc: ParsedDocument, ctx: ValidationContext, image_path: str, line_number: int, line: str):
     """Helper function to check a single image path"""
     # Skip URLs (http://, https://, etc.)
     if image_path.startswith("http://") or image_path.startswith("https://"):
         return
 
     # Resolve the image path (handles both relative and absolute /paths)
-    resolved_path = resolve_link_path(image_path, file_dir)
+    resolved_path = resolve_link_path(image_path, doc.dir)
 
-    if not os.path.exists(resolved_path):
-        errors.append(
-            ValidationError(
-                file=filepath,
-                line=line_number,
-                message=f"Image file not found: {image_path}",
-                context=line.strip()[:80],
-            )
-        )
+    if not doc.lookup(ctx, "path", resolved_path):
+        doc.report(line_number, f"Image file not found: {image_path}", line.strip()[:80])
 
 
-def check_em_dashes(content: str, filepath: str):
+def check_em_dashes(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check for em-dashes (—) which should be replaced with comma and space or other punctuation.
     Detects ALL em-dashes except those in safe contexts (code blocks, inline code, URLs).
     """
-    lines = content.split("\n")
-    in_code_block = False
-
-    # Pattern to match em-dashes
-    em_dash_pattern = re.compile(r"—")
-    # Pattern to detect inline code
-    inline_code_pattern = re.compile(r"`[^`]*—[^`]*`")
-    # Pattern to detect URLs
-    url_pattern = re.compile(r"https?://[^\s]*—[^\s]*")
-
-    for line_index, line in enumerate(lines):
-        # Track code blocks
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        # Skip lines inside code blocks
-        if in_code_block:
+    for line_index, line in enumerate(doc.lines):
+        if "—" not in line or doc.fence[line_index] or doc.in_code[line_index]:
             continue
 
-        # Skip if em-dash is inside inline code
-        if inline_code_pattern.search(line):
+        # Skip if em-dash is inside inline code or a URL
+        if INLINE_CODE_EM_DASH_PATTERN.search(line) or URL_EM_DASH_PATTERN.search(line):
             continue
 
-        # Skip if em-dash is inside a URL
-        if url_pattern.search(line):
-            continue
-
-        # Find all em-dashes
-        matches = list(em_dash_pattern.finditer(line))
-        if matches:
-            for match in matches:
-                # Find the column position of the em-dash
-                column = match.start() + 1
-                errors.append(
-                    ValidationError(
-                        file=filepath,
-                        line=line_index + 1,
-                        column=column,
-                        message='Em-dash (—) found. Replace with parenthesis, comma and space (", "), period, or semicolon as appropriate. Prefer periods and shortened sentences where appropriate.',
-                        context=line.strip()[:80],
-                    )
-                )
+        for match in EM_DASH_PATTERN.finditer(line):
+            doc.report(
+                line_index + 1,
+                'Em-dash (—) found. Replace with parenthesis, comma and space (", "), period, or semicolon as appropriate. Prefer periods and shortened sentences where appropriate.',
+                line.strip()[:80],
+                column=match.start() + 1,
+            )
 
 
-def check_cross_reference_links(content: str, filepath: str):
+def check_cross_reference_links(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check for broken cross-reference links to other .qmd files
     Matches patterns like: [text](path/to/file.qmd)
     """
-    lines = content.split("\n")
-    file_dir = os.path.dirname(filepath)
-
-    # Match markdown link syntax: [text](path)
-    # Only check links that reference .qmd files
-    link_pattern = re.compile(r"\[([^\]]+)\]\(([^)#]+\.qmd[^)]*)\)")
-
-    for line_index, line in enumerate(lines):
+    for line_index, line in enumerate(doc.lines):
         # Skip lines that are HTML comments
-        if re.match(r"^\s*<!--", line.strip()):
+        if ".qmd" not in line or doc.stripped[line_index].startswith("<!--"):
             continue
 
-        matches = link_pattern.finditer(line)
-        for match in matches:
-            # Skip if this match is inside an HTML comment
-            # Check if there's a <!-- before the match and --> after it on the same line
-            before_match = line[: match.start()]
-            after_match = line[match.end() :]
-            if "<!--" in before_match and "-->" in after_match:
-                continue  # Link is inside HTML comment, skip it
+        for match in QMD_LINK_PATTERN.finditer(line):
+            # Skip if this match is inside an HTML comment on the same line
+            if "<!--" in line[: match.start()] and "-->" in line[match.end() :]:
+                continue
 
             link_path = match.group(2).split("#")[0]  # Remove anchor if present
 
@@ -319,226 +470,83 @@ def check_cross_reference_links(content: str, filepath: str):
             if link_path.startswith("http://") or link_path.startswith("https://"):
                 continue
 
-            # Resolve the link path (handles both relative and absolute /paths)
-            resolved_path = resolve_link_path(link_path, file_dir)
-
-            if not os.path.exists(resolved_path):
-                errors.append(
-                    ValidationError(
-                        file=filepath,
-                        line=line_index + 1,
-                        message=f"Broken cross-reference link: {link_path} (target file not found)",
-                        context=line.strip()[:80],
-                    )
+            if not doc.lookup(ctx, "path", resolve_link_path(link_path, doc.dir)):
+                doc.report(
+                    line_index + 1,
+                    f"Broken cross-reference link: {link_path} (target file not found)",
+                    line.strip()[:80],
                 )
 
 
-def load_parameter_names() -> Set[str]:
-    """
-    Load all parameter names from dih_models/parameters.py.
-    Returns a set of uppercase parameter names (e.g., 'GLOBAL_MILITARY_SPENDING_ANNUAL_2024').
-    """
-    parameters_file = "dih_models/parameters.py"
-    parameter_names: Set[str] = set()
-
-    if not os.path.exists(parameters_file):
-        print(f"Warning: {parameters_file} not found, skipping parameter import validation\n")
-        return parameter_names
-
-    try:
-        with open(parameters_file, encoding="utf-8") as f:
-            content = f.read()
-
-        # Pattern: PARAMETER_NAME = Parameter(
-        # Match uppercase names followed by = Parameter(
-        param_pattern = re.compile(r"^([A-Z][A-Z0-9_]*)\s*=\s*Parameter\(", re.MULTILINE)
-        matches = param_pattern.finditer(content)
-
-        for match in matches:
-            parameter_names.add(match.group(1))
-
-        return parameter_names
-    except Exception as e:
-        print(f"Warning: Failed to parse {parameters_file}: {str(e)}\n")
-        return parameter_names
-
-
-def check_parameter_imports(content: str, filepath: str, defined_parameters: Set[str]):
+def check_parameter_imports(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check if parameters from dih_models.parameters are used but not imported.
     This catches errors like using GLOBAL_CLINICAL_TRIAL_MARKET_ANNUAL without importing it.
     """
-    if not defined_parameters:
+    if not doc.python_blocks:
+        return
+    # The result depends on the parameter-name table as a whole
+    doc.lookup(ctx, "parameters", "")
+    if not ctx.defined_parameters:
         # Skip if no parameters loaded
         return
 
-    lines = content.split("\n")
-    in_python_block = False
-    current_block = []
-    block_start_line = 0
-
-    for i, line in enumerate(lines):
-        if re.match(r"^```\{python\}", line):
-            in_python_block = True
-            block_start_line = i + 1
-            current_block = []
-        elif in_python_block and line.strip() == "```":
-            # End of Python block - check for parameter usage
-            block_content = "\n".join(current_block)
-
-            # Check if block imports from dih_models.parameters
-            has_param_import = bool(
-                re.search(
-                    r"from\s+dih_models\.parameters\s+import",
-                    block_content,
-                    re.DOTALL,
+    for block in doc.python_blocks:
+        # A parameter is "used" if it appears as a whole word in the block
+        if PARAM_IMPORT_PATTERN.search(block.text) or block.words.isdisjoint(ctx.defined_parameters):
+            continue
+
+        # Reported once per block, and only when the block's first line uses a
+        # parameter (the long-standing behaviour; later lines are not flagged)
+        first_line = block.lines[0]
+        for word in WORD_PATTERN.findall(first_line):
+            if word in ctx.defined_parameters:
+                doc.report(
+                    block.fence_line,
+                    f"Parameter '{word}' used but not imported from dih_models.parameters",
+                    first_line.strip()[:80],
                 )
-            )
+                break
+
 
-            # If no import, check if any parameters are used
-            if not has_param_import:
-                used_params = set()
-                for param_name in defined_parameters:
-                    # Check if parameter is used as a standalone identifier
-                    # Use word boundaries to avoid matching substrings
-                    if re.search(rf"\b{param_name}\b", block_content):
-                        used_params.add(param_name)
-
-                # Report error for first used parameter
-                if used_params:
-                    for line_num, block_line in enumerate(current_block, block_start_line):
-                        for param_name in used_params:
-                            if re.search(rf"\b{param_name}\b", block_line):
-                                errors.append(
-                                    ValidationError(
-                                        file=filepath,
-                                        line=line_num,
-                                        message=f"Parameter '{param_name}' used but not imported from dih_models.parameters",
-                                        context=block_line.strip()[:80],
-                                    )
-                                )
-                                # Only report once per block
-                                break
-                        if used_params:
-                            break
-
-            in_python_block = False
-        elif in_python_block:
-            current_block.append(line)
-
-
-def check_python_imports(content: str, filepath: str):
+def check_python_imports(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check for missing imports in Python code blocks.
     Detects cases where a module is used but not imported in that specific block.
     """
-    # Common module patterns to check
-    # Format: (usage_pattern, import_patterns, module_name)
-    # NOTE: We only check for imports that MUST be in each block that uses them.
-    # Standard library imports (pd, np, plt) are available from first block in Quarto.
-    # get_figure_output_path and get_project_root are checked by check_figure_file_imports() (whole-file check).
-    MODULE_CHECKS = [
-        (
-            r"\bnpf\.",
-            [r"import\s+numpy_financial\s+as\s+npf", r"from\s+numpy_financial\s+import"],
-            "numpy_financial (npf)",
-        ),
-    ]
+    for block in doc.python_blocks:
+        for usage_pattern, import_patterns, module_name in MODULE_CHECKS:
+            if not usage_pattern.search(block.text):
+                continue
+            if any(pattern.search(block.text) for pattern in import_patterns):
+                continue
 
-    lines = content.split("\n")
-    in_python_block = False
-    current_block = []
-    block_start_line = 0
-
-    for i, line in enumerate(lines):
-        if re.match(r"^```\{python\}", line):
-            in_python_block = True
-            block_start_line = i + 1
-            current_block = []
-        elif in_python_block and line.strip() == "```":
-            # End of Python block - check imports
-            block_content = "\n".join(current_block)
-
-            for usage_pattern, import_patterns, module_name in MODULE_CHECKS:
-                # Check if module is used
-                if re.search(usage_pattern, block_content):
-                    # Check if module is imported in this block (use re.DOTALL to match multi-line imports)
-                    has_import = any(re.search(pattern, block_content, re.DOTALL) for pattern in import_patterns)
-
-                    if not has_import:
-                        # Find first usage line in the block
-                        for line_num, block_line in enumerate(current_block, block_start_line):
-                            if re.search(usage_pattern, block_line):
-                                errors.append(
-                                    ValidationError(
-                                        file=filepath,
-                                        line=line_num,
-                                        message=f"Missing import in Python block: {module_name}",
-                                        context=block_line.strip()[:80],
-                                    )
-                                )
-                                break  # Only report once per module per block
-
-            in_python_block = False
-        elif in_python_block:
-            current_block.append(line)
-
-
-def check_graphviz_variables(content: str, filepath: str):
+            # Find first usage line in the block (only report once per module per block)
+            for line_num, block_line in enumerate(block.lines, block.fence_line):
+                if usage_pattern.search(block_line):
+                    doc.report(line_num, f"Missing import in Python block: {module_name}", block_line.strip()[:80])
+                    break
+
+
+def check_graphviz_variables(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check for Quarto variables ({{< var ... >}}) inside Python code blocks that generate Graphviz diagrams.
     Quarto variables don't work inside Python code blocks - use Python variables instead.
     """
-    lines = content.split("\n")
-    in_python_block = False
-    current_block = []
-    block_start_line = 0
-
-    # Pattern to detect Graphviz-related code
-    graphviz_patterns = [
-        r"graphviz",
-        r"dot\.node",
-        r"dot\.edge",
-        r"dot\.attr",
-        r"Digraph",
-        r"Graph",
-    ]
-
-    # Pattern to match Quarto variables
-    var_pattern = re.compile(r"\{\{<\s*var\s+[^>]+\s*>\}\}")
-
-    for i, line in enumerate(lines):
-        if re.match(r"^```\{python\}", line):
-            in_python_block = True
-            block_start_line = i + 1
-            current_block = []
-        elif in_python_block and line.strip() == "```":
-            # End of Python block - check if it contains Graphviz code
-            block_content = "\n".join(current_block)
-
-            # Check if this block contains Graphviz-related code
-            is_graphviz_block = any(re.search(pattern, block_content) for pattern in graphviz_patterns)
-
-            if is_graphviz_block:
-                # Check for Quarto variables in this block
-                for line_num, block_line in enumerate(current_block, block_start_line):
-                    if var_pattern.search(block_line):
-                        context = block_line.strip()[:80]
-                        errors.append(
-                            ValidationError(
-                                file=filepath,
-                                line=line_num,
-                                message="Quarto variable ({{< var ... >}}) inside Graphviz Python code block - variables do not work in Python. Use Python variables from dih_models.parameters instead.",
-                                context=context,
-                            )
-                        )
+    for block in doc.python_blocks:
+        if "{{<" not in block.text or not GRAPHVIZ_PATTERN.search(block.text):
+            continue
 
-            in_python_block = False
-        elif in_python_block:
-            current_block.append(line)
+        for line_num, block_line in enumerate(block.lines, block.fence_line):
+            if MATH_VAR_PATTERN.search(block_line):
+                doc.report(
+                    line_num,
+                    "Quarto variable ({{< var ... >}}) inside Graphviz Python code block - variables do not work in Python. Use Python variables from dih_models.parameters instead.",
+                    block_line.strip()[:80],
+                )
 
 
-def check_figure_file_imports(content: str, filepath: str):
+def check_figure_file_imports(doc: ParsedDocument, ctx: ValidationContext):
     """
     For ALL files, check that get_figure_output_path and get_project_root are imported
     if they are used ANYWHERE in the file (not per-block, since Quarto shares imports across blocks).
@@ -546,86 +554,57 @@ def check_figure_file_imports(content: str, filepath: str):
     This is a simpler check than check_python_imports() and avoids false positives
     from imports in one block being used in another block.
     """
+    content = doc.content
 
-    # Check if get_figure_output_path is used anywhere
-    uses_get_figure_output_path = "get_figure_output_path(" in content
-    # Check if it's imported anywhere (in any block)
-    # Support both old _chart_style and new dih_models.plotting.chart_style imports
-    imports_get_figure_output_path = bool(
-        re.search(
-            r"from\s+(?:figures\.)?(?:_chart_style|dih_models\.plotting\.chart_style)\s+import.*get_figure_output_path",
-            content,
-            re.DOTALL,
-        )
-    )
-
-    if uses_get_figure_output_path and not imports_get_figure_output_path:
-        errors.append(
-            ValidationError(
-                file=filepath,
-                line=1,
-                message="Figure file uses get_figure_output_path() but does not import it from _chart_style",
-                context="(Check all Python blocks for missing import)",
-            )
-        )
-
-    # Check if get_project_root is used anywhere
-    uses_get_project_root = "get_project_root(" in content
-    # Check if it's imported anywhere
     # Support both old _chart_style and new dih_models.plotting.chart_style imports
-    imports_get_project_root = bool(
-        re.search(
-            r"from\s+(?:figures\.)?(?:_chart_style|dih_models\.plotting\.chart_style)\s+import.*get_project_root",
-            content,
-            re.DOTALL,
+    if "get_figure_output_path(" in content and not re.search(
+        r"from\s+(?:figures\.)?(?:_chart_style|dih_models\.plotting\.chart_style)\s+import.*get_figure_output_path",
+        content,
+        re.DOTALL,
+    ):
+        doc.report(
+            1,
+            "Figure file uses get_figure_output_path() but does not import it from _chart_style",
+            "(Check all Python blocks for missing import)",
         )
-    )
 
-    if uses_get_project_root and not imports_get_project_root:
-        errors.append(
-            ValidationError(
-                file=filepath,
-                line=1,
-                message="Figure file uses get_project_root() but does not import it from _chart_style",
-                context="(Check all Python blocks for missing import)",
-            )
+    if "get_project_root(" in content and not re.search(
+        r"from\s+(?:figures\.)?(?:_chart_style|dih_models\.plotting\.chart_style)\s+import.*get_project_root",
+        content,
+        re.DOTALL,
+    ):
+        doc.report(
+            1,
+            "Figure file uses get_project_root() but does not import it from _chart_style",
+            "(Check all Python blocks for missing import)",
         )
 
 
-def check_hardcoded_figure_paths(content: str, filepath: str):
+def check_hardcoded_figure_paths(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check for hardcoded figure output paths instead of using get_figure_output_path().
     Figure files should use get_figure_output_path() for consistent output location.
     """
-    lines = content.split("\n")
-
-    # Pattern: output_dir = ... / 'brain' / 'figures' or similar manual path construction
-    hardcoded_path_pattern = re.compile(r"output_dir\s*=.*['\"]brain['\"].*['\"]figures['\"]")
-    # Pattern: output_path = output_dir / 'filename.png'
-    manual_path_pattern = re.compile(r"output_path\s*=\s*output_dir\s*/")
-
-    for line_index, line in enumerate(lines):
-        if hardcoded_path_pattern.search(line):
-            errors.append(
-                ValidationError(
-                    file=filepath,
-                    line=line_index + 1,
-                    message="Hardcoded figure path - use get_figure_output_path('filename.png') instead",
-                    context=line.strip()[:80],
-                )
+    for line_index, line in enumerate(doc.lines):
+        if "output_" not in line:
+            continue
+        # output_dir = ... / 'brain' / 'figures' or similar manual path construction
+        if HARDCODED_PATH_PATTERN.search(line):
+            doc.report(
+                line_index + 1,
+                "Hardcoded figure path - use get_figure_output_path('filename.png') instead",
+                line.strip()[:80],
             )
-        elif manual_path_pattern.search(line):
-            errors.append(
-                ValidationError(
-                    file=filepath,
-                    line=line_index + 1,
-                    message="Manual path construction - use get_figure_output_path('filename.png') instead",
-                    context=line.strip()[:80],
-                )
+        # output_path = output_dir / 'filename.png'
+        elif MANUAL_PATH_PATTERN.search(line):
+            doc.report(
+                line_index + 1,
+                "Manual path construction - use get_figure_output_path('filename.png') instead",
+                line.strip()[:80],
             )
 
 
-def check_gif_references(content: str, filepath: str):
+def check_gif_references(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check for GIF files that aren't wrapped in HTML-only blocks
     GIF files cannot be included in PDF output and must be wrapped in:
@@ -633,16 +612,15 @@ def check_gif_references(content: str, filepath: str):
     <img src="path/to/file.gif" />
     :::
     """
-    lines = content.split("\n")
     in_html_only_block = False
     block_depth = 0
 
-    for line_index, line in enumerate(lines):
+    for line_index, line in enumerate(doc.lines):
         # Track HTML-only conditional blocks
         if '{.content-visible when-format="html"}' in line:
             in_html_only_block = True
             block_depth = 0
-        elif in_html_only_block and line.strip().startswith(":::"):
+        elif in_html_only_block and doc.stripped[line_index].startswith(":::"):
             if block_depth == 0:
                 in_html_only_block = False
             else:
@@ -650,257 +628,288 @@ def check_gif_references(content: str, filepath: str):
         elif in_html_only_block and ":::" in line:
             block_depth += 1
 
-        # Check for GIF references (markdown or HTML)
-        markdown_gif_pattern = re.compile(r"!\[([^\]]*)\]\(([^)]*\.gif[^)]*)\)", re.IGNORECASE)
-        html_gif_pattern = re.compile(r'<img[^>]+src=["\']([^"\']*\.gif[^"\']*)["\']', re.IGNORECASE)
-
-        markdown_matches = markdown_gif_pattern.finditer(line)
-        html_matches = html_gif_pattern.finditer(line)
+        if ".gif" not in line.lower():
+            continue
 
         # Check markdown GIF references
-        for match in markdown_matches:
+        for _ in MARKDOWN_GIF_PATTERN.finditer(line):
             if not in_html_only_block:
-                errors.append(
-                    ValidationError(
-                        file=filepath,
-                        line=line_index + 1,
-                        message='GIF file not wrapped in HTML-only block - will fail in PDF output. Use HTML <img> tag inside ::: {.content-visible when-format="html"}',
-                        context=line.strip()[:80],
-                    )
+                doc.report(
+                    line_index + 1,
+                    'GIF file not wrapped in HTML-only block - will fail in PDF output. Use HTML <img> tag inside ::: {.content-visible when-format="html"}',
+                    line.strip()[:80],
                 )
             else:
                 # Even inside HTML-only block, markdown syntax might not work - warn to use HTML
-                errors.append(
-                    ValidationError(
-                        file=filepath,
-                        line=line_index + 1,
-                        message="GIF uses markdown syntax - use HTML <img> tag instead for better compatibility",
-                        context=line.strip()[:80],
-                    )
+                doc.report(
+                    line_index + 1,
+                    "GIF uses markdown syntax - use HTML <img> tag instead for better compatibility",
+                    line.strip()[:80],
                 )
 
         # Check HTML GIF references
-        for match in html_matches:
+        for _ in HTML_GIF_PATTERN.finditer(line):
             if not in_html_only_block:
-                errors.append(
-                    ValidationError(
-                        file=filepath,
-                        line=line_index + 1,
-                        message='GIF file not wrapped in HTML-only block - will fail in PDF output. Wrap in ::: {.content-visible when-format="html"}',
-                        context=line.strip()[:80],
-                    )
+                doc.report(
+                    line_index + 1,
+                    'GIF file not wrapped in HTML-only block - will fail in PDF output. Wrap in ::: {.content-visible when-format="html"}',
+                    line.strip()[:80],
                 )
 
 
-def check_include_directives(content: str, filepath: str):
+def check_include_directives(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check for broken Quarto include directives: {{< include path.qmd >}}
     Ensures that all included files exist relative to the current file.
     """
-    lines = content.split("\n")
-    file_dir = os.path.dirname(filepath)
-
-    # Match Quarto include syntax: {{< include path.qmd >}}
-    include_pattern = re.compile(r"\{\{<\s*include\s+([^\s>]+)\s*>\}\}")
-
-    for line_index, line in enumerate(lines):
-        # Skip lines that are HTML comments
-        if re.match(r"^\s*<!--", line.strip()):
-            continue
-        # Skip if this line contains <!-- before the include and --> after it
-        if "<!--" in line and "-->" in line:
+    for line_index, line in enumerate(doc.lines):
+        # Skip HTML comment lines
+        if "include" not in line or doc.comment[line_index]:
             continue
 
-        matches = include_pattern.finditer(line)
-        for match in matches:
+        for match in INCLUDE_PATTERN.finditer(line):
             include_path = match.group(1).strip()
 
             # Skip URLs
             if include_path.startswith("http://") or include_path.startswith("https://"):
                 continue
 
-            # Resolve the include path (handles both relative and absolute /paths)
-            resolved_path = resolve_link_path(include_path, file_dir)
-
-            if not os.path.exists(resolved_path):
-                errors.append(
-                    ValidationError(
-                        file=filepath,
-                        line=line_index + 1,
-                        message=f"Broken include directive: {include_path} (target file not found)",
-                        context=line.strip()[:80],
-                    )
+            if not doc.lookup(ctx, "path", resolve_link_path(include_path, doc.dir)):
+                doc.report(
+                    line_index + 1,
+                    f"Broken include directive: {include_path} (target file not found)",
+                    line.strip()[:80],
                 )
 
 
-def check_inline_expressions(content: str, filepath: str):
+def check_inline_expressions(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check for inline code expressions which are incompatible with Jupyter Cache.
     Inline expressions like `{python} variable` or `{r} code` cannot be used with cache: true.
     Users should use regular Python code blocks instead.
     """
-    lines = content.split("\n")
-
-    # Pattern to match inline code expressions: `{python} ...` or `{r} ...`
-    # Also match variations like `python ...` without braces
-    inline_expr_patterns = [
-        re.compile(r"`\{python\}[^`]+`"),
-        re.compile(r"`\{r\}[^`]+`"),
-        re.compile(r"`python [^`]+`"),
-        re.compile(r"`r [^`]+`"),
-    ]
-
-    for line_index, line in enumerate(lines):
+    for line_index, line in enumerate(doc.lines):
         # Skip code blocks
-        if line.strip().startswith("```"):
+        if doc.fence[line_index] or "`" not in line:
             continue
 
-        for pattern in inline_expr_patterns:
-            matches = pattern.finditer(line)
-            for match in matches:
-                errors.append(
-                    ValidationError(
-                        file=filepath,
-                        line=line_index + 1,
-                        message="Inline code expression found - these are incompatible with Jupyter Cache (cache: true). Use a regular Python code block instead.",
-                        context=line.strip()[:80],
-                    )
+        for pattern in INLINE_EXPR_PATTERNS:
+            for _ in pattern.finditer(line):
+                doc.report(
+                    line_index + 1,
+                    "Inline code expression found - these are incompatible with Jupyter Cache (cache: true). Use a regular Python code block instead.",
+                    line.strip()[:80],
                 )
 
 
-def check_quarto_variables_in_links(content: str, filepath: str):
+def check_quarto_variables_in_links(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check for Quarto variables inside markdown link text.
     Quarto variables don't work inside link text: [{{< var ... >}}](url)
     They should be moved outside the link or replaced with plain text.
     """
-    lines = content.split("\n")
-
-    # Pattern to match markdown links with Quarto variables in link text
-    # [text with {{< var ... >}}](url)
-    link_with_var_pattern = re.compile(r"\[([^\]]*\{\{<\s*var\s+[^>]+\s*>\}\}[^\]]*)\]\([^)]+\)")
-
-    for line_index, line in enumerate(lines):
-        # Skip HTML comments
-        if re.match(r"^\s*<!--", line.strip()) or ("<!--" in line and "-->" in line):
+    for line_index, line in enumerate(doc.lines):
+        if doc.comment[line_index] or "{{<" not in line or "](" not in line:
             continue
 
-        matches = link_with_var_pattern.finditer(line)
-        for match in matches:
-            context = line.strip()[:80]
-            errors.append(
-                ValidationError(
-                    file=filepath,
-                    line=line_index + 1,
-                    message="Quarto variable inside link text - variables do not work as link text. Move variable outside the link or use plain text.",
-                    context=context,
-                )
+        for _ in LINK_WITH_VAR_PATTERN.finditer(line):
+            doc.report(
+                line_index + 1,
+                "Quarto variable inside link text - variables do not work as link text. Move variable outside the link or use plain text.",
+                line.strip()[:80],
             )
 
 
-def check_markdown_links(content: str, filepath: str):
+def check_markdown_links(doc: ParsedDocument, ctx: ValidationContext):
     """
     Check all markdown links in the file for:
     - Broken file references (for local files)
     - Malformed paths with '...'
     - References to old migration directories
     """
-    lines = content.split("\n")
-    file_dir = os.path.dirname(filepath)
+    for line_index, match in doc.links:
+        line = doc.lines[line_index]
+        link_path = match.group(2).strip()
 
-    # Match markdown links: [text](path)
-    link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+        # Skip URLs, mailto links and same-page anchors
+        if link_path.startswith(("http://", "https://", "mailto:", "#")):
+            continue
 
-    for line_index, line in enumerate(lines):
-        # Skip HTML comments
-        if re.match(r"^\s*<!--", line.strip()) or ("<!--" in line and "-->" in line):
+        # Check for malformed paths with '...'
+        if ".../" in link_path:
+            doc.report(line_index + 1, f'Malformed path with "...": {link_path}', line.strip()[:80])
             continue
 
-        matches = link_pattern.finditer(line)
-        for match in matches:
-            match.group(1)
-            link_path = match.group(2).strip()
+        # For local file links, check if the file exists
+        # Split off any anchor (#section)
+        link_file = link_path.split("#")[0] if "#" in link_path else link_path
+        if not link_file:
+            continue
 
-            # Skip URLs
-            if link_path.startswith("http://") or link_path.startswith("https://"):
-                continue
-            # Skip mailto links
-            if link_path.startswith("mailto:"):
-                continue
-            # Skip anchors
-            if link_path.startswith("#"):
-                continue
+        # Resolve the path (handles both relative and absolute /paths)
+        resolved_path = resolve_link_path(link_file, doc.dir)
+        if doc.lookup(ctx, "path", resolved_path):
+            continue  # File exists, link is valid
+
+        # If link has .html extension but file doesn't exist, check for corresponding .qmd
+        # (since .html files are generated from .qmd during rendering)
+        if link_file.endswith(".html"):
+            if doc.lookup(ctx, "path", resolved_path[:-5] + ".qmd"):
+                continue  # Source .qmd exists, will be rendered to .html - link is valid
+            message = f"Broken link: {link_path} (target file not found, and no corresponding .qmd file)"
+        # If link is extensionless (format-agnostic), check for .qmd source file
+        # Quarto will resolve extensionless paths appropriately for each output format
+        elif not link_file.endswith((".html", ".qmd", ".md", ".pdf", ".epub")):
+            if doc.lookup(ctx, "path", resolved_path + ".qmd"):
+                continue  # Source .qmd exists, Quarto will resolve the link - valid
+            message = f"Broken link: {link_path} (no corresponding .qmd source file found)"
+        else:
+            # File with extension doesn't exist
+            message = f"Broken link: {link_path} (target file not found)"
+        doc.report(line_index + 1, message, line.strip()[:80])
 
-            # Check for malformed paths with '...'
-            if ".../" in link_path:
-                errors.append(
-                    ValidationError(
-                        file=filepath,
-                        line=line_index + 1,
-                        message=f'Malformed path with "...": {link_path}',
-                        context=line.strip()[:80],
-                    )
-                )
-                continue
 
+def check_anchor_ids(doc: ParsedDocument, ctx: ValidationContext):
+    """
+    Check that all anchor IDs referenced in links actually exist in the target files.
+    Validates patterns like: [text](path/to/file.qmd#anchor-id)
+    """
+    for line_index, match in doc.links:
+        link_path = match.group(2).strip()
 
-            # For local file links, check if the file exists
-            # Split off any anchor (#section)
-            link_file = link_path.split("#")[0] if "#" in link_path else link_path
+        # Skip URLs, same-page anchors and links without an anchor
+        if link_path.startswith(("http://", "https://", "#")) or "#" not in link_path:
+            continue
 
-            if link_file:  # If there's actually a file path (not just an anchor)
-                # Resolve the path (handles both relative and absolute /paths)
-                resolved_path = resolve_link_path(link_file, file_dir)
+        link_file, anchor_id = link_path.split("#", 1)
 
-                # Check if file exists as-is
-                if os.path.exists(resolved_path):
-                    continue  # File exists, link is valid
+        # Resolve the link path (handles both relative and absolute /paths)
+        resolved_path = resolve_link_path(link_file, doc.dir)
 
-                # If link has .html extension but file doesn't exist, check for corresponding .qmd
-                # (since .html files are generated from .qmd during rendering)
-                if link_file.endswith(".html"):
-                    qmd_path = resolved_path[:-5] + ".qmd"  # Replace .html with .qmd
-                    if os.path.exists(qmd_path):
-                        continue  # Source .qmd exists, will be rendered to .html - link is valid
-                    else:
-                        # Neither .html nor .qmd exists - broken link
-                        errors.append(
-                            ValidationError(
-                                file=filepath,
-                                line=line_index + 1,
-                                message=f"Broken link: {link_path} (target file not found, and no corresponding .qmd file)",
-                                context=line.strip()[:80],
-                            )
-                        )
-                # If link is extensionless (format-agnostic), check for .qmd source file
-                # Quarto will resolve extensionless paths appropriately for each output format
-                elif not any(link_file.endswith(ext) for ext in [".html", ".qmd", ".md", ".pdf", ".epub"]):
-                    # Extensionless path - check for .qmd source file
-                    qmd_path = resolved_path + ".qmd"
-                    if os.path.exists(qmd_path):
-                        continue  # Source .qmd exists, Quarto will resolve the link - valid
-                    else:
-                        # No .qmd source found - broken link
-                        errors.append(
-                            ValidationError(
-                                file=filepath,
-                                line=line_index + 1,
-                                message=f"Broken link: {link_path} (no corresponding .qmd source file found)",
-                                context=line.strip()[:80],
-                            )
-                        )
-                else:
-                    # File with extension doesn't exist
-                    errors.append(
-                        ValidationError(
-                            file=filepath,
-                            line=line_index + 1,
-                            message=f"Broken link: {link_path} (target file not found)",
-                            context=line.strip()[:80],
-                        )
+        # File doesn't exist - will be caught by other checks
+        if not doc.lookup(ctx, "path", resolved_path):
+            continue
+
+        if not doc.lookup(ctx, "anchor", f"{os.path.normpath(resolved_path)}#{anchor_id}"):
+            doc.report(
+                line_index + 1,
+                f"Broken anchor link: {link_path} (anchor ID '{anchor_id}' not found in target file)",
+                doc.lines[line_index].strip()[:80],
+            )
+
+
+def check_unknown_variables(doc: ParsedDocument, ctx: ValidationContext):
+    """
+    Check for Quarto variables that are referenced but not defined in _variables.yml
+    Pattern: {{< var variable_name >}}
+    """
+    for line_index, match in doc.var_refs:
+        var_name = match.group(1).strip()
+        # None: no variables loaded (PyYAML not installed or file not found)
+        if doc.lookup(ctx, "var", var_name) is False:
+            doc.report(
+                line_index + 1,
+                f"Unknown Quarto variable: {{{{< var {var_name} >}}}} - not defined in _variables.yml",
+                doc.lines[line_index].strip()[:80],
+            )
+
+
+def check_citations(doc: ParsedDocument, ctx: ValidationContext):
+    """
+    Check for citations that are referenced but not defined in references.bib
+    Pattern: [@citation-id] or @citation-id (in some contexts)
+    """
+    for line_index, line in enumerate(doc.lines):
+        # Skip HTML comments and code fences
+        stripped = doc.stripped[line_index]
+        if "[@" not in line or stripped.startswith("<!--") or stripped.startswith("```"):
+            continue
+
+        for match in CITATION_PATTERN.finditer(line):
+            # Handles multiple citations like [@a; @b]
+            citation_ids = [c.strip() for c in re.split(r'[;@]', match.group(1)) if c.strip()]
+
+            for citation_id in citation_ids:
+                # Remove any trailing punctuation or spaces
+                citation_id = re.sub(r'[,\s]+$', '', citation_id)
+
+                # None: no citations loaded
+                if citation_id and doc.lookup(ctx, "citation", citation_id) is False:
+                    doc.report(
+                        line_index + 1,
+                        f"Missing citation: [@{citation_id}] - not found in references.bib",
+                        line.strip()[:80],
                     )
 
 
+# Visitors run over every .qmd file, in reporting order
+QMD_CHECKS: List[Check] = [
+    check_latex_patterns,
+    check_math_delimiters,
+    check_image_paths,
+    check_cross_reference_links,
+    # Whole-file get_figure_output_path/get_project_root imports, then per-block imports
+    check_figure_file_imports,
+    check_python_imports,
+    check_parameter_imports,
+    check_graphviz_variables,
+    check_em_dashes,
+    check_hardcoded_figure_paths,
+    check_gif_references,
+    check_include_directives,
+    check_markdown_links,
+    check_anchor_ids,
+    check_quarto_variables_in_links,
+    check_unknown_variables,
+    check_citations,
+    # check_inline_expressions is DISABLED: cache: true is off in the Quarto
+    # configs, so inline expressions are fine
+]
+
+# .md files only get link and citation checks
+MD_CHECKS: List[Check] = [
+    check_cross_reference_links,
+    check_markdown_links,
+    check_anchor_ids,
+    check_citations,
+]
+
+
+# ---------------------------------------------------------------------------
+# Project-wide tables
+# ---------------------------------------------------------------------------
+
+
+def load_parameter_names() -> Set[str]:
+    """
+    Load all parameter names from dih_models/parameters.py.
+    Returns a set of uppercase parameter names (e.g., 'GLOBAL_MILITARY_SPENDING_ANNUAL_2024').
+    """
+    parameters_file = "dih_models/parameters.py"
+    parameter_names: Set[str] = set()
+
+    if not os.path.exists(parameters_file):
+        print(f"Warning: {parameters_file} not found, skipping parameter import validation\n")
+        return parameter_names
+
+    try:
+        with open(parameters_file, encoding="utf-8") as f:
+            content = f.read()
+
+        # Pattern: PARAMETER_NAME = Parameter(
+        # Match uppercase names followed by = Parameter(
+        param_pattern = re.compile(r"^([A-Z][A-Z0-9_]*)\s*=\s*Parameter\(", re.MULTILINE)
+        matches = param_pattern.finditer(content)
+
+        for match in matches:
+            parameter_names.add(match.group(1))
+
+        return parameter_names
+    except Exception as e:
+        print(f"Warning: Failed to parse {parameters_file}: {str(e)}\n")
+        return parameter_names
+
+
 def load_anchor_ids(filepath: str) -> Set[str]:
     """
     Load all anchor IDs from a .qmd or .md file.
@@ -954,10 +963,11 @@ def load_anchor_ids(filepath: str) -> Set[str]:
         return anchor_ids
 
 
-def load_all_anchor_ids() -> Dict[str, Set[str]]:
+def load_all_anchor_ids(cache: Optional["ValidationCache"] = None) -> Dict[str, Set[str]]:
     """
     Load anchor IDs from all .qmd and .md files in the project.
     Returns a dictionary mapping file paths to sets of anchor IDs.
+    With a cache, only files whose content changed are re-read.
     """
     anchor_map: Dict[str, Set[str]] = {}
 
@@ -973,7 +983,7 @@ def load_all_anchor_ids() -> Dict[str, Set[str]]:
     ]
 
     for filepath in all_files:
-        anchor_ids = load_anchor_ids(filepath)
+        anchor_ids = cache.anchor_ids(filepath) if cache else load_anchor_ids(filepath)
         if anchor_ids:
             # Store as normalized path for consistent lookups
             normalized_path = os.path.normpath(filepath)
@@ -982,67 +992,6 @@ def load_all_anchor_ids() -> Dict[str, Set[str]]:
     return anchor_map
 
 
-def check_anchor_ids(content: str, filepath: str, anchor_map: Dict[str, Set[str]]):
-    """
-    Check that all anchor IDs referenced in links actually exist in the target files.
-    Validates patterns like: [text](path/to/file.qmd#anchor-id)
-    """
-    lines = content.split("\n")
-    file_dir = os.path.dirname(filepath)
-
-    # Match markdown links with anchors: [text](path#anchor-id)
-    link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-
-    for line_index, line in enumerate(lines):
-        # Skip HTML comments
-        if re.match(r"^\s*<!--", line.strip()) or ("<!--" in line and "-->" in line):
-            continue
-
-        matches = link_pattern.finditer(line)
-        for match in matches:
-            link_path = match.group(2).strip()
-
-            # Skip URLs
-            if link_path.startswith("http://") or link_path.startswith("https://"):
-                continue
-
-            # Skip anchors-only (same-page anchors)
-            if link_path.startswith("#"):
-                continue
-
-            # Check if link has an anchor
-            if "#" in link_path:
-                link_file, anchor_id = link_path.split("#", 1)
-            else:
-                continue  # No anchor to validate
-
-            # Skip if no file path (just an anchor)
-            if not link_file:
-                continue
-
-            # Resolve the link path (handles both relative and absolute /paths)
-            resolved_path = resolve_link_path(link_file, file_dir)
-
-            # Check if file exists
-            if not os.path.exists(resolved_path):
-                continue  # File doesn't exist - will be caught by other checks
-
-            # Look up anchor IDs for this file
-            normalized_target = os.path.normpath(resolved_path)
-            target_anchors = anchor_map.get(normalized_target, set())
-
-            # Check if anchor ID exists
-            if anchor_id not in target_anchors:
-                errors.append(
-                    ValidationError(
-                        file=filepath,
-                        line=line_index + 1,
-                        message=f"Broken anchor link: {link_path} (anchor ID '{anchor_id}' not found in target file)",
-                        context=line.strip()[:80],
-                    )
-                )
-
-
 def load_defined_variables() -> Set[str]:
     """
     Load all defined variables from _variables.yml
@@ -1076,41 +1025,6 @@ def load_defined_variables() -> Set[str]:
         return defined_vars
 
 
-def check_unknown_variables(content: str, filepath: str, defined_vars: Set[str]):
-    """
-    Check for Quarto variables that are referenced but not defined in _variables.yml
-    Pattern: {{< var variable_name >}}
-    """
-    if not defined_vars:
-        # Skip if no variables loaded (PyYAML not installed or file not found)
-        return
-
-    lines = content.split("\n")
-
-    # Pattern to match Quarto variable references: {{< var variable_name >}}
-    var_pattern = re.compile(r"\{\{<\s*var\s+([^\s>]+)\s*>\}\}")
-
-    for line_index, line in enumerate(lines):
-        # Skip HTML comments
-        if re.match(r"^\s*<!--", line.strip()) or ("<!--" in line and "-->" in line):
-            continue
-
-        matches = var_pattern.finditer(line)
-        for match in matches:
-            var_name = match.group(1).strip()
-
-            # Check if variable is defined
-            if var_name not in defined_vars:
-                errors.append(
-                    ValidationError(
-                        file=filepath,
-                        line=line_index + 1,
-                        message=f"Unknown Quarto variable: {{{{< var {var_name} >}}}} - not defined in _variables.yml",
-                        context=line.strip()[:80],
-                    )
-                )
-
-
 def load_citations_from_bib() -> Set[str]:
     """
     Load citation IDs from references.bib and knowledge/appendix/iab-references.bib.
@@ -1158,48 +1072,6 @@ def load_citations_from_bib() -> Set[str]:
     return citation_ids
 
 
-def check_citations(content: str, filepath: str, defined_citations: Set[str]):
-    """
-    Check for citations that are referenced but not defined in references.bib
-    Pattern: [@citation-id] or @citation-id (in some contexts)
-    """
-    if not defined_citations:
-        # Skip if no citations loaded
-        return
-
-    lines = content.split("\n")
-
-    # Pattern to match Pandoc citations: [@citation-id] or [@cite1; @cite2]
-    citation_pattern = re.compile(r'\[@([^\]]+)\]')
-
-    for line_index, line in enumerate(lines):
-        # Skip HTML comments and code blocks
-        if re.match(r"^\s*<!--", line.strip()) or line.strip().startswith("```"):
-            continue
-
-        matches = citation_pattern.finditer(line)
-        for match in matches:
-            # Extract all citation IDs from the match (handles multiple citations like [@a; @b])
-            citation_text = match.group(1)
-            # Split by semicolon and @ to get individual citation IDs
-            citation_ids = [c.strip() for c in re.split(r'[;@]', citation_text) if c.strip()]
-
-            for citation_id in citation_ids:
-                # Remove any trailing punctuation or spaces
-                citation_id = re.sub(r'[,\s]+$', '', citation_id)
-
-                # Check if citation is defined in references.bib
-                if citation_id and citation_id not in defined_citations:
-                    errors.append(
-                        ValidationError(
-                            file=filepath,
-                            line=line_index + 1,
-                            message=f"Missing citation: [@{citation_id}] - not found in references.bib",
-                            context=line.strip()[:80],
-                        )
-                    )
-
-
 def validate_quarto_config():
     """
     Validate _quarto.yml configuration file.
@@ -1268,110 +1140,224 @@ def validate_quarto_config():
         if "appendices" in config["book"]:
             check_file_refs(config["book"]["appendices"], "book.appendices")
 
+# ---------------------------------------------------------------------------
+# Incremental cache
+# ---------------------------------------------------------------------------
 
-def validate_file(filepath: str, defined_vars: Set[str], defined_parameters: Set[str], anchor_map: Dict[str, Set[str]], defined_citations: Set[str]):
-    """Validate a single file"""
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}", file=sys.stderr)
-        return
+VALIDATION_CACHE_PATH = os.path.join("_analysis", ".validation-cache.json")
 
-    with open(filepath, encoding="utf-8") as f:
-        content = f.read()
+# Bump when the cache layout changes
+VALIDATION_CACHE_SCHEMA = 1
 
-    lines = content.split("\n")
-
-    # For .md files, only check broken links
-    if filepath.lower().endswith(".md"):
-        # Check cross-reference links
-        check_cross_reference_links(content, filepath)
-        # Check markdown links
-        check_markdown_links(content, filepath)
-        # Check anchor IDs
-        check_anchor_ids(content, filepath, anchor_map)
-        # Check citations
-        check_citations(content, filepath, defined_citations)
-        return
 
-    # For .qmd files, run all validation checks
+def _read_stamp(filepath: str, previous: Optional[List[Any]] = None) -> Optional[List[Any]]:
+    """
+    [size, mtime_ns, sha256] of a file, or None if it is missing.
 
-    # Check for common LaTeX patterns
-    for pattern_config in latex_patterns:
-        pattern = pattern_config["pattern"]
-        message = pattern_config["message"]
-        validator = pattern_config.get("validator")
+    If size and mtime match `previous`, its hash is reused without reading
+    the file; otherwise the content is hashed, so a touched but unchanged
+    file still matches its cache entry.
+    """
+    try:
+        stat = os.stat(filepath)
+        if previous and previous[0] == stat.st_size and previous[1] == stat.st_mtime_ns:
+            return previous
+        with open(filepath, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns, digest]
 
-        for match in pattern.finditer(content):
-            # If there's a custom validator, use it
-            if validator and validator(match.group(0)):
-                continue  # Pattern is valid
 
-            # Find line number
-            before_match = content[: match.start()]
-            line_number = before_match.count("\n") + 1
-            line = lines[line_number - 1] if line_number <= len(lines) else ""
+class ValidationCache:
+    """
+    Persistent per-file validation results (_analysis/.validation-cache.json).
+
+    Each file's entry holds its content stamp, its anchor IDs, and its last
+    validation result together with every lookup the checks made (paths
+    that had to exist, variables, citations and anchors it referenced, the
+    parameter-name table digest). A result is reused when the content hash
+    matches and every recorded lookup still gives the same answer, so a file
+    is revalidated only if it changed or something it references changed.
 
-            errors.append(ValidationError(file=filepath, line=line_number, message=message, context=line.strip()[:80]))
+    The global tables (_variables.yml, references.bib, parameter names) are
+    cached keyed by their source hashes. Editing this script drops the cache.
+    """
 
-    # Check math delimiters
-    check_math_delimiters(content, filepath)
+    def __init__(self, path: str = VALIDATION_CACHE_PATH, enabled: bool = True):
+        self.path = path
+        self.enabled = enabled
+        self.version = _read_stamp(os.path.abspath(__file__))[2]
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._tables: Dict[str, Dict[str, Any]] = {}
+        self._stamps: Dict[str, Optional[List[Any]]] = {}
+        self.hits = 0
+        if enabled and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("schema") == VALIDATION_CACHE_SCHEMA and data.get("validator") == self.version:
+                    self._files = data.get("files", {})
+                    self._tables = data.get("tables", {})
+            except (OSError, ValueError):
+                pass
+        self._touched: Set[str] = set()
+
+    def stamp(self, filepath: str) -> Optional[List[Any]]:
+        """Current stamp of `filepath` (computed once per run)"""
+        if filepath not in self._stamps:
+            previous = self._files.get(filepath, {}).get("stamp")
+            self._stamps[filepath] = _read_stamp(filepath, previous)
+        return self._stamps[filepath]
+
+    def _entry(self, filepath: str) -> Dict[str, Any]:
+        """The file's entry, emptied if its content changed since it was stored"""
+        stamp = self.stamp(filepath)
+        entry = self._files.get(filepath)
+        if entry is None or stamp is None or entry.get("stamp", [None] * 3)[2] != stamp[2]:
+            entry = {}
+            self._files[filepath] = entry
+        entry["stamp"] = stamp
+        self._touched.add(filepath)
+        return entry
+
+    def table(self, name: str, sources: List[str], loader: Callable[[], Set[str]]) -> Set[str]:
+        """A global name table, reloaded only when one of its source files changed"""
+        if not self.enabled:
+            return loader()
+        stamps = {source: (self.stamp(source) or [None] * 3)[2] for source in sources}
+        cached = self._tables.get(name)
+        if cached and cached.get("sources") == stamps:
+            return set(cached["names"])
+        names = loader()
+        self._tables[name] = {"sources": stamps, "names": sorted(names)}
+        return names
+
+    def anchor_ids(self, filepath: str) -> Set[str]:
+        if not self.enabled:
+            return load_anchor_ids(filepath)
+        entry = self._entry(filepath)
+        if "anchors" not in entry:
+            entry["anchors"] = sorted(load_anchor_ids(filepath))
+        return set(entry["anchors"])
+
+    def result(self, filepath: str, context: ValidationContext) -> Optional[List[ValidationError]]:
+        """Cached errors for `filepath`, or None if it has to be revalidated"""
+        if not self.enabled:
+            return None
+        cached = self._entry(filepath).get("result")
+        if cached is None:
+            return None
+        for kind, key, value in cached["lookups"]:
+            if context.resolve(kind, key) != value:
+                return None
+        self.hits += 1
+        return [
+            ValidationError(file=filepath, line=line, column=column, message=message, context=text)
+            for line, column, message, text in cached["errors"]
+        ]
+
+    def record(self, filepath: str, file_errors: List[ValidationError], lookups: List[Tuple[Tuple[str, str], Any]]) -> None:
+        self._entry(filepath)["result"] = {
+            "lookups": [[kind, key, value] for (kind, key), value in lookups],
+            "errors": [[e.line, e.column, e.message, e.context] for e in file_errors],
+        }
+
+    def save(self) -> None:
+        """Persist entries for files seen this run (deleted files drop out)"""
+        if not self.enabled:
+            return
+        data = {
+            "schema": VALIDATION_CACHE_SCHEMA,
+            "validator": self.version,
+            "tables": self._tables,
+            "files": {path: self._files[path] for path in sorted(self._touched)},
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+        except OSError as e:
+            print(f"Warning: Failed to write {self.path}: {e}\n", file=sys.stderr)
 
-    # Check image paths
-    check_image_paths(content, filepath)
 
-    # Check cross-reference links
-    check_cross_reference_links(content, filepath)
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
 
-    # Check Python imports
-    # Always check for get_figure_output_path/get_project_root imports (whole-file check)
-    check_figure_file_imports(content, filepath)
-    # Also check for other imports per-block (npf, etc.)
-    check_python_imports(content, filepath)
-    # Check for parameter imports (catches missing imports from dih_models.parameters)
-    check_parameter_imports(content, filepath, defined_parameters)
 
-    # Check for Quarto variables in Graphviz code blocks
-    check_graphviz_variables(content, filepath)
+FileResult = Tuple[List[ValidationError], List[Tuple[Tuple[str, str], Any]]]
 
-    # Check em-dashes
-    check_em_dashes(content, filepath)
 
-    # Check for hardcoded figure paths
-    check_hardcoded_figure_paths(content, filepath)
+def validate_file(filepath: str, context: ValidationContext) -> FileResult:
+    """Parse a single file once and run the applicable checks over it
 
-    # Check GIF references
-    check_gif_references(content, filepath)
+    Returns the errors and the lookups they depend on (see ValidationCache).
+    """
+    if not os.path.exists(filepath):
+        print(f"File not found: {filepath}", file=sys.stderr)
+        return [], []
 
-    # Check include directives
-    check_include_directives(content, filepath)
-    check_markdown_links(content, filepath)
+    with open(filepath, encoding="utf-8") as f:
+        content = f.read()
 
-    # Check anchor IDs in links
-    check_anchor_ids(content, filepath, anchor_map)
+    doc = ParsedDocument(filepath, content)
+    for check in MD_CHECKS if doc.is_markdown else QMD_CHECKS:
+        check(doc, context)
+    return doc.errors, list(doc.lookups.items())
 
-    # Check for Quarto variables in link text
-    check_quarto_variables_in_links(content, filepath)
 
-    # Check for unknown Quarto variables
-    check_unknown_variables(content, filepath, defined_vars)
+# Context for pool workers (set once per worker, not pickled per file)
+_worker_context: Optional[ValidationContext] = None
 
-    # Check citations
-    check_citations(content, filepath, defined_citations)
 
-    # Check for inline expressions (incompatible with Jupyter Cache)
-    # DISABLED: We've disabled cache: true in Quarto configs, so inline expressions are fine
-    # check_inline_expressions(content, filepath)
+def _init_worker(context: ValidationContext) -> None:
+    global _worker_context
+    _worker_context = context
 
 
-def main():
-    """Main validation function"""
-    # First, regenerate _variables.yml to ensure it's current with parameters.py
-    print("Regenerating _variables.yml from parameters.py...\n")
+def _validate_in_worker(filepath: str) -> FileResult:
+    return validate_file(filepath, _worker_context)
+
+
+def validate_files(
+    files: List[str], context: ValidationContext, workers: int = 1, cache: Optional[ValidationCache] = None
+) -> Tuple[List[ValidationError], int]:
+    """
+    Validate `files` across `workers` processes, reusing cached results.
+
+    Returns the errors (in file order) and the number of files validated.
+    """
+    results: Dict[str, List[ValidationError]] = {}
+    pending = []
+    for filepath in files:
+        cached = cache.result(filepath, context) if cache else None
+        if cached is None:
+            pending.append(filepath)
+        else:
+            results[filepath] = cached
+
+    workers = max(1, min(workers, len(pending)))
+    if workers == 1:
+        fresh = [validate_file(filepath, context) for filepath in pending]
+    else:
+        chunksize = max(1, len(pending) // (workers * 4))
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(context,)) as pool:
+            fresh = pool.map(_validate_in_worker, pending, chunksize=chunksize)
+
+    for filepath, (file_errors, lookups) in zip(pending, fresh):
+        results[filepath] = file_errors
+        if cache and cache.enabled:
+            cache.record(filepath, file_errors, lookups)
+    return [error for filepath in files for error in results[filepath]], len(pending)
+
+
+def regenerate_outputs(command: List[str]) -> None:
+    """Run the generate-everything pipeline; exits on failure, echoes its summary lines"""
     try:
         import subprocess
 
-        result = subprocess.run(
-            [sys.executable, "scripts/generate-everything-parameters-variables-calculations-references.py"], capture_output=True, text=True, timeout=120
-        )
+        result = subprocess.run(command, capture_output=True, text=True, timeout=120)
         if result.returncode != 0:
             print(f"ERROR: generate-everything-parameters-variables-calculations-references.py failed with exit code {result.returncode}", file=sys.stderr)
             if result.stdout:
@@ -1391,11 +1377,46 @@ def main():
         print(f"ERROR: Failed to regenerate _variables.yml: {e}\n", file=sys.stderr)
         sys.exit(1)
 
+
+def main():
+    """Main validation function"""
+    parser = argparse.ArgumentParser(description="Validate .qmd and .md files before Quarto rendering")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes for file validation (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Revalidate every file instead of reusing results from {VALIDATION_CACHE_PATH}, "
+        "and rerun every generator stage",
+    )
+    args = parser.parse_args()
+
+    # First, make sure _variables.yml is current with parameters.py, running only
+    # the generator stages whose inputs changed (none: skip the pipeline entirely)
+    plan = StagePlan(PROJECT_ROOT)
+    stale_stages = plan.stale()
+    if not stale_stages and not args.no_cache:
+        plan.save()
+        print("Generated files are up to date with parameters.py and references.qmd; skipping regeneration\n")
+    else:
+        if args.no_cache:
+            print("Regenerating _variables.yml from parameters.py...\n")
+            command = [sys.executable, PIPELINE_SCRIPT]
+        else:
+            print(f"Regenerating changed stages ({', '.join(stale_stages)}) from parameters.py...\n")
+            command = [sys.executable, PIPELINE_SCRIPT, "--if-changed"]
+        regenerate_outputs(command)
+
     print("Running pre-render validation checks on .qmd files...\n")
+    cache = ValidationCache(enabled=not args.no_cache)
 
     # Load defined variables from _variables.yml
     print("Loading defined variables from _variables.yml...")
-    defined_vars = load_defined_variables()
+    defined_vars = cache.table("variables", ["_variables.yml"], load_defined_variables)
     if defined_vars:
         print(f"Loaded {len(defined_vars)} defined variables\n")
     else:
@@ -1403,7 +1424,7 @@ def main():
 
     # Load defined parameters from dih_models/parameters.py
     print("Loading defined parameters from dih_models/parameters.py...")
-    defined_parameters = load_parameter_names()
+    defined_parameters = cache.table("parameters", ["dih_models/parameters.py"], load_parameter_names)
     if defined_parameters:
         print(f"Loaded {len(defined_parameters)} defined parameters\n")
     else:
@@ -1411,7 +1432,7 @@ def main():
 
     # Load anchor IDs from all files
     print("Loading anchor IDs from all .qmd and .md files...")
-    anchor_map = load_all_anchor_ids()
+    anchor_map = load_all_anchor_ids(cache)
     total_anchors = sum(len(ids) for ids in anchor_map.values())
     if anchor_map:
         print(f"Loaded {total_anchors} anchor IDs from {len(anchor_map)} files\n")
@@ -1420,7 +1441,9 @@ def main():
 
     # Load citations from references.bib
     print("Loading citations from references.bib...")
-    defined_citations = load_citations_from_bib()
+    defined_citations = cache.table(
+        "citations", ["references.bib", "knowledge/appendix/iab-references.bib"], load_citations_from_bib
+    )
     if defined_citations:
         print(f"Loaded {len(defined_citations)} citation IDs\n")
     else:
@@ -1463,9 +1486,21 @@ def main():
     all_files = qmd_files + md_files
     print(f"Found {len(qmd_files)} .qmd files and {len(md_files)} .md files to validate ({len(all_files)} total)\n")
 
-    # Validate each file
-    for file in all_files:
-        validate_file(file, defined_vars, defined_parameters, anchor_map, defined_citations)
+    # Validate every file (in parallel); errors keep file order
+    context = ValidationContext(
+        defined_vars=defined_vars,
+        defined_parameters=defined_parameters,
+        anchor_map=anchor_map,
+        defined_citations=defined_citations,
+    )
+    start = time.perf_counter()
+    file_errors, validated = validate_files(all_files, context, workers=args.workers, cache=cache)
+    errors.extend(file_errors)
+    cache.save()
+    print(
+        f"Validated {validated} of {len(all_files)} files in {time.perf_counter() - start:.2f}s "
+        f"({len(all_files) - validated} unchanged, reused from cache)\n"
+    )
 
     # Report results
     if len(errors) == 0: